@@ -1,6 +1,8 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_init
+from kombu import Queue
 
 # Set default Django settings
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
@@ -11,5 +13,52 @@ app = Celery("plexify")
 # Load settings from Django settings with namespace CELERY
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
+# Two queues so user-triggered work never waits behind library syncs:
+#
+#   interactive  short tasks a user is waiting on (manual syncs, webhooks)
+#   bulk         long library syncs from the sync page and the beat schedule
+#
+# Run one worker per queue; each picks up its tuning from
+# WORKER_QUEUE_OPTIONS below:
+#
+#   celery -A config worker -Q interactive -n interactive@%h
+#   celery -A config worker -Q bulk -n bulk@%h
+#   celery -A config beat
+#
+# Bulk workers prefetch a single task so a long sync never holds others
+# hostage; keep their concurrency low, since every sync also hits a PMS.
+WORKER_QUEUE_OPTIONS = {
+    "interactive": {"concurrency": 4, "prefetch_multiplier": 4},
+    "bulk": {"concurrency": 2, "prefetch_multiplier": 1},
+}
+
+app.conf.task_queues = (Queue("interactive"), Queue("bulk"))
+app.conf.task_default_queue = "interactive"
+app.conf.task_routes = {
+    "media_manager.tasks.sync_movie_library": {"queue": "bulk"},
+    "media_manager.tasks.sync_catalog_library": {"queue": "bulk"},
+    "media_manager.tasks.sync_library_lane": {"queue": "bulk"},
+    "media_manager.tasks.sync_all_movie_libraries": {"queue": "bulk"},
+    "media_manager.tasks.sync_all_catalog_libraries": {"queue": "bulk"},
+    # Everything else, including webhooks, manual user syncs and the
+    # fan-out summaries, stays on the default interactive queue
+}
+# A worker serving both queues may also pick up syncs, so it gets the bulk
+# prefetch too
+app.conf.worker_prefetch_multiplier = 1
+
+
+@worker_init.connect
+def configure_queue_worker(sender=None, **kwargs):
+    """Apply WORKER_QUEUE_OPTIONS to a worker that consumes a single queue."""
+    queues = list(sender.app.amqp.queues.consume_from)
+    if len(queues) != 1 or queues[0] not in WORKER_QUEUE_OPTIONS:
+        return
+
+    options = WORKER_QUEUE_OPTIONS[queues[0]]
+    sender.concurrency = options["concurrency"]
+    sender.prefetch_multiplier = options["prefetch_multiplier"]
+
+
 # Auto-discover tasks from all installed apps
 app.autodiscover_tasks()
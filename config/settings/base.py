@@ -164,13 +164,22 @@ LOGGING = {
     },
 }
 
-# Cache configuration
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
-        "LOCATION": "unique-plexify",
+# Cache configuration; Redis shares it between web and worker processes
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "unique-plexify",
+        }
     }
-}
 
 # Authentication settings
 LOGIN_URL = "plex_auth:login"
@@ -187,6 +196,63 @@ PLEX_CLIENT_IDENTIFIER = os.getenv("PLEX_CLIENT_IDENTIFIER", str(uuid.uuid4()))
 PLEX_TOKEN = os.getenv("PLEX_TOKEN")
 PLEX_REDIRECT_URI = os.getenv("PLEX_REDIRECT_URI")
 
+# Process-wide PlexServer connection pool
+PLEX_CONNECTION_POOL_SIZE = int(os.getenv("PLEX_CONNECTION_POOL_SIZE", 32))
+PLEX_CONNECTION_POOL_TTL = int(os.getenv("PLEX_CONNECTION_POOL_TTL", 900))  # seconds
+PLEX_CONNECTION_HEALTH_CHECK_INTERVAL = int(
+    os.getenv("PLEX_CONNECTION_HEALTH_CHECK_INTERVAL", 60)
+)  # seconds
+
+# How long MyPlexAccount objects and resource lists are reused per token
+PLEX_ACCOUNT_CACHE_TTL = int(os.getenv("PLEX_ACCOUNT_CACHE_TTL", 300))  # seconds
+
+# Shared keep-alive HTTP session for plex.tv and PMS traffic
+PLEX_HTTP_POOL_CONNECTIONS = int(os.getenv("PLEX_HTTP_POOL_CONNECTIONS", 16))  # hosts
+PLEX_HTTP_POOL_MAXSIZE = int(os.getenv("PLEX_HTTP_POOL_MAXSIZE", 10))  # per host
+PLEX_HTTP_MAX_RETRIES = int(os.getenv("PLEX_HTTP_MAX_RETRIES", 2))
+PLEX_HTTP_TIMEOUT = float(os.getenv("PLEX_HTTP_TIMEOUT", 10))  # seconds
+PLEX_METADATA_BATCH_SIZE = int(
+    os.getenv("PLEX_METADATA_BATCH_SIZE", 50)
+)  # rating keys per request
+
+# Per-server circuit breaker for unreachable servers
+PLEX_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("PLEX_CIRCUIT_FAILURE_THRESHOLD", 3))
+PLEX_CIRCUIT_BASE_BACKOFF = int(os.getenv("PLEX_CIRCUIT_BASE_BACKOFF", 30))  # seconds
+PLEX_CIRCUIT_MAX_BACKOFF = int(os.getenv("PLEX_CIRCUIT_MAX_BACKOFF", 900))  # seconds
+PLEX_NOT_FOUND_CACHE_TTL = int(os.getenv("PLEX_NOT_FOUND_CACHE_TTL", 60))  # seconds
+PLEX_LAST_KNOWN_DATA_TTL = int(
+    os.getenv("PLEX_LAST_KNOWN_DATA_TTL", 60 * 60 * 24 * 7)
+)  # seconds
+PLEX_LIBRARY_SNAPSHOT_TTL = int(
+    os.getenv("PLEX_LIBRARY_SNAPSHOT_TTL", 60 * 60 * 24)
+)  # seconds, replaced sooner when the section's updatedAt changes
+
+# Per-server request budgets (token buckets shared across processes)
+PLEX_INTERACTIVE_RATE_LIMIT = float(
+    os.getenv("PLEX_INTERACTIVE_RATE_LIMIT", 10)
+)  # requests per second
+PLEX_INTERACTIVE_RATE_BURST = int(os.getenv("PLEX_INTERACTIVE_RATE_BURST", 30))
+PLEX_INTERACTIVE_RATE_MAX_WAIT = float(
+    os.getenv("PLEX_INTERACTIVE_RATE_MAX_WAIT", 2)
+)  # seconds
+PLEX_SYNC_RATE_LIMIT = float(
+    os.getenv("PLEX_SYNC_RATE_LIMIT", 4)
+)  # requests per second
+PLEX_SYNC_RATE_BURST = int(os.getenv("PLEX_SYNC_RATE_BURST", 8))
+PLEX_SYNC_RATE_MAX_WAIT = float(os.getenv("PLEX_SYNC_RATE_MAX_WAIT", 60))  # seconds
+
+# Movie library sync
+MOVIE_SYNC_BATCH_SIZE = int(os.getenv("MOVIE_SYNC_BATCH_SIZE", 500))  # rows per upsert
+PLEX_SYNC_LOCK_TIMEOUT = int(
+    os.getenv("PLEX_SYNC_LOCK_TIMEOUT", 300)
+)  # seconds, extended while a sync runs
+SYNC_DEDUP_TTL = int(
+    os.getenv("SYNC_DEDUP_TTL", 3600)
+)  # seconds a queued sync blocks identical triggers
+MOVIE_SYNC_MAX_PER_SERVER = int(
+    os.getenv("MOVIE_SYNC_MAX_PER_SERVER", 2)
+)  # concurrent library syncs per PMS
+
 if DEBUG:
     INTERNAL_IPS = [
         "127.0.0.1",
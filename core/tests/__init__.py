@@ -0,0 +1 @@
+# core/tests/__init__.py
@@ -0,0 +1,8 @@
+# core/tests/views/__init__.py
+
+from .test_library import TestLibraryView, TestLiveLibraryView
+
+__all__ = [
+    "TestLibraryView",
+    "TestLiveLibraryView",
+]
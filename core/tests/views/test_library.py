@@ -0,0 +1,281 @@
+# core/tests/views/test_library.py
+
+import base64
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qsl
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from core.views.library import LibraryView
+from media_manager.models import LibrarySyncCursor, Movie
+from media_manager.tasks import sync_movie_item
+from media_manager.tests.fake_plex import create_server_conn
+
+ADDED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+LIVE_CONTEXT = {"items": [], "info": {"title": "Live"}, "live": True}
+
+
+@patch.object(LibraryView, "_get_live_context", return_value=LIVE_CONTEXT)
+class TestLibraryView(TestCase):
+    """Test rendering libraries from the local catalog"""
+
+    def setUp(self):
+        cache.clear()
+        self.server_conn = create_server_conn()
+        self.client.force_login(self.server_conn.owner)
+        cache.set(
+            "server_libraries_machine-1",
+            [{"key": "1", "title": "Movies", "type": "movie"}],
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _add_movies(self, count: int, **fields) -> None:
+        Movie.objects.bulk_create(
+            [
+                Movie(
+                    server=self.server_conn,
+                    library_key="1",
+                    plex_key=str(key),
+                    title=fields.get("title", f"Movie {key:03d}"),
+                    year=fields.get("year", 2000),
+                    duration=7200000,
+                    added_at=ADDED_AT,
+                    updated_at=ADDED_AT,
+                )
+                for key in range(1, count + 1)
+            ]
+        )
+
+    def _finish_full_sync(self) -> None:
+        LibrarySyncCursor.objects.update_or_create(
+            server=self.server_conn,
+            library_key="1",
+            defaults={"last_synced_at": ADDED_AT, "last_full_sync_at": ADDED_AT},
+        )
+
+    def _get(self, query=None):
+        return self.client.get(
+            reverse("core:library", args=["machine-1", "1"]), query or {}
+        ).context
+
+    def test_unsynced_rows_use_live_library(self, mock_live):
+        """Test that rows from a webhook alone don't switch to the catalog"""
+        self._add_movies(1)
+
+        context = self._get()
+
+        self.assertTrue(context["live"])
+
+    def test_interrupted_first_sync_uses_live_library(self, mock_live):
+        """Test that a checkpointed first sync doesn't switch to the catalog"""
+        self._add_movies(3)
+        LibrarySyncCursor.objects.create(
+            server=self.server_conn,
+            library_key="1",
+            checkpoint_full=True,
+            checkpoint_offset=3,
+        )
+
+        context = self._get()
+
+        self.assertTrue(context["live"])
+
+    def test_synced_library_served_from_catalog(self, mock_live):
+        """Test that a fully synced library is read from the database"""
+        self._add_movies(3)
+        self._finish_full_sync()
+
+        context = self._get()
+
+        mock_live.assert_not_called()
+        self.assertEqual(context["info"]["total_items"], 3)
+        self.assertEqual(len(context["items"]), 3)
+
+    def _titles(self, context):
+        return [item["title"] for item in context["items"]]
+
+    def _follow(self, context, direction: str):
+        return self._get(dict(parse_qsl(context[f"{direction}_query"])))
+
+    @patch.object(LibraryView, "items_per_page", 2)
+    def test_keyset_pages_forward_and_back(self, mock_live):
+        """Test walking a catalog library forward and back by cursor"""
+        self._add_movies(5)
+        self._finish_full_sync()
+
+        first = self._get()
+        self.assertEqual(self._titles(first), ["Movie 001", "Movie 002"])
+        self.assertFalse(first["has_previous"])
+        self.assertTrue(first["has_next"])
+
+        second = self._follow(first, "next")
+        self.assertEqual(self._titles(second), ["Movie 003", "Movie 004"])
+        self.assertTrue(second["has_previous"])
+        self.assertTrue(second["has_next"])
+
+        last = self._follow(second, "next")
+        self.assertEqual(self._titles(last), ["Movie 005"])
+        self.assertFalse(last["has_next"])
+
+        back = self._follow(last, "previous")
+        self.assertEqual(self._titles(back), ["Movie 003", "Movie 004"])
+        self.assertTrue(back["has_previous"])
+        self.assertTrue(back["has_next"])
+
+        start = self._follow(back, "previous")
+        self.assertEqual(self._titles(start), ["Movie 001", "Movie 002"])
+        self.assertFalse(start["has_previous"])
+
+    @patch.object(LibraryView, "items_per_page", 2)
+    def test_keyset_ties_broken_by_id(self, mock_live):
+        """Test that rows sharing a sort value page in id order"""
+        self._add_movies(5)
+        self._finish_full_sync()
+
+        for sort, expected in (("year", [1, 2, 3, 4, 5]), ("-year", [5, 4, 3, 2, 1])):
+            with self.subTest(sort=sort):
+                context = self._get({"sort": sort})
+                titles = self._titles(context)
+                while context["has_next"]:
+                    context = self._follow(context, "next")
+                    titles += self._titles(context)
+
+                self.assertEqual(titles, [f"Movie {key:03d}" for key in expected])
+
+    @patch.object(LibraryView, "items_per_page", 2)
+    def test_keyset_null_values_sort_last(self, mock_live):
+        """Test paging across rows with no value, in both directions"""
+        self._add_movies(5)
+        self._finish_full_sync()
+        Movie.objects.filter(plex_key="1").update(rating=5.0)
+        Movie.objects.filter(plex_key="3").update(rating=7.0)
+
+        first = self._get({"sort": "rating"})
+        self.assertEqual(self._titles(first), ["Movie 001", "Movie 003"])
+
+        second = self._follow(first, "next")
+        self.assertEqual(self._titles(second), ["Movie 002", "Movie 004"])
+
+        last = self._follow(second, "next")
+        self.assertEqual(self._titles(last), ["Movie 005"])
+        self.assertFalse(last["has_next"])
+
+        back = self._follow(last, "previous")
+        self.assertEqual(self._titles(back), ["Movie 002", "Movie 004"])
+
+        start = self._follow(back, "previous")
+        self.assertEqual(self._titles(start), ["Movie 001", "Movie 003"])
+        self.assertFalse(start["has_previous"])
+
+    @patch.object(LibraryView, "items_per_page", 2)
+    def test_malformed_cursor_restarts_at_first_page(self, mock_live):
+        """Test that tampered cursors show the first page instead of failing"""
+        self._add_movies(3)
+        self._finish_full_sync()
+
+        def token(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        tokens = [
+            "%%%",
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+            token({"value": "Movie 002"}),
+            token(["Movie 002", "not-an-id"]),
+            token(["Movie 002", 1, 2]),
+            token(5),
+        ]
+        for direction in ("after", "before"):
+            for bad in tokens + [token(["not-a-year", 1])]:
+                with self.subTest(direction=direction, token=bad):
+                    query = {"sort": "year", direction: bad}
+                    response = self.client.get(
+                        reverse("core:library", args=["machine-1", "1"]), query
+                    )
+
+                    self.assertEqual(response.status_code, 200)
+                    self.assertNotIn("error", response.context)
+                    self.assertEqual(
+                        self._titles(response.context), ["Movie 001", "Movie 002"]
+                    )
+
+    @patch.object(LibraryView, "items_per_page", 2)
+    def test_filters_kept_across_pages(self, mock_live):
+        """Test that a filtered library stays filtered when paging"""
+        self._add_movies(6)
+        self._finish_full_sync()
+        Movie.objects.filter(plex_key__in=["2", "4", "5", "6"]).update(year=2001)
+
+        first = self._get({"year": "2001"})
+        self.assertEqual(self._titles(first), ["Movie 002", "Movie 004"])
+        self.assertEqual(first["info"]["total_items"], 4)
+        self.assertIn("year=2001", first["next_query"])
+
+        second = self._follow(first, "next")
+        self.assertEqual(self._titles(second), ["Movie 005", "Movie 006"])
+        self.assertFalse(second["has_next"])
+        self.assertEqual(second["filters"]["year"], "2001")
+
+        back = self._follow(second, "previous")
+        self.assertEqual(self._titles(back), ["Movie 002", "Movie 004"])
+
+
+@patch("core.views.library.PlexManager")
+class TestLiveLibraryView(TestCase):
+    """Test reading libraries that aren't in the catalog from the PMS"""
+
+    def setUp(self):
+        cache.clear()
+        self.server_conn = create_server_conn()
+        self.client.force_login(self.server_conn.owner)
+        cache.set(
+            "server_libraries_machine-1",
+            [{"key": "1", "title": "Movies", "type": "movie"}],
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def _titles(self):
+        context = self.client.get(
+            reverse("core:library", args=["machine-1", "1"])
+        ).context
+        return [item["title"] for item in context["items"]]
+
+    def _serve(self, mock_manager, title: str) -> MagicMock:
+        manager = mock_manager.return_value
+        manager.get_library_section.return_value = SimpleNamespace(
+            key=1,
+            title="Movies",
+            type="movie",
+            agent="tv.plex.agents.movie",
+            scanner="Plex Movie",
+            language="en-US",
+            locations=["/movies"],
+            updatedAt=ADDED_AT,
+            totalViewSize=lambda **kwargs: 1,
+        )
+        manager.get_library_index.return_value = ["101"]
+        manager.get_metadata_batch.return_value = [{"key": "101", "title": title}]
+        return manager
+
+    @patch("media_manager.tasks.MovieManager")
+    def test_webhook_invalidates_cached_pages(self, mock_movies, mock_manager):
+        """Test that a webhook sync drops cached live pages of its library"""
+        manager = self._serve(mock_manager, "Old Title")
+        self.assertEqual(self._titles(), ["Old Title"])
+
+        self._serve(mock_manager, "New Title")
+        self.assertEqual(self._titles(), ["Old Title"])
+        self.assertEqual(manager.get_metadata_batch.call_count, 1)
+
+        sync_movie_item.apply(args=["machine-1", "1", "101"])
+
+        self.assertEqual(self._titles(), ["New Title"])
+        self.assertEqual(manager.get_metadata_batch.call_count, 2)
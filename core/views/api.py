@@ -6,7 +6,6 @@ from typing import Any, Dict
 
 import pytz
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.http import JsonResponse
 from django.utils import timezone
@@ -17,6 +16,7 @@ from django.views.decorators.csrf import ensure_csrf_cookie
 from core.models import UserActivity, UserPreference
 from plex_auth.tasks import sync_plex_libraries
 from plex_auth.utils.exceptions import PlexManagerError
+from plex_auth.utils.task_dedup import enqueue_once
 
 logger = logging.getLogger(__name__)
 
@@ -51,15 +51,23 @@ class LibrarySyncView(APIView):
     def post(self, request, *args, **kwargs) -> JsonResponse:
         """Start a manual sync of Plex libraries."""
         try:
+            # Runs in the background; a repeated click joins the queued sync
+            task_id, queued = enqueue_once(
+                sync_plex_libraries, args=(request.user.id,), scope=(request.user.id,)
+            )
+            if not queued:
+                return self.success_response(
+                    "Sync already in progress", {"task_id": task_id}
+                )
+
             # Record the sync attempt
             UserActivity.log_activity(
                 request.user, "sync", "Started manual library sync"
             )
 
-            # Start the sync
-            request.user.sync_servers()
-
-            return self.success_response("Sync started successfully")
+            return self.success_response(
+                "Sync started successfully", {"task_id": task_id}
+            )
 
         except PlexManagerError as e:
             logger.error(f"Sync error for user {request.user.username}: {str(e)}")
@@ -210,10 +218,6 @@ class AutoSyncSettingsView(APIView):
     def _schedule_sync_task(self, user) -> None:
         """Schedule the next sync task based on user preferences."""
         try:
-            # Clear any existing sync lock
-            lock_id = f"plex_sync_{user.id}"
-            cache.delete(lock_id)
-
             # If we've never synced or it's been longer than the interval, sync now
             should_sync_now = False
             if not user.last_synced:
@@ -228,7 +232,7 @@ class AutoSyncSettingsView(APIView):
                     should_sync_now = True
 
             if should_sync_now:
-                sync_plex_libraries.delay(user.id)
+                enqueue_once(sync_plex_libraries, args=(user.id,), scope=(user.id,))
                 logger.info(f"Scheduled immediate sync for user {user.id}")
 
         except Exception as e:
@@ -238,10 +242,7 @@ class AutoSyncSettingsView(APIView):
     def _remove_sync_task(self, user) -> None:
         """Remove any scheduled sync tasks for the user."""
         try:
-            # Clear any existing sync lock
-            lock_id = f"plex_sync_{user.id}"
-            cache.delete(lock_id)
-
+            # A running sync keeps its lock and finishes; no new one is queued
             logger.info(f"Removed sync tasks for user {user.id}")
 
         except Exception as e:
@@ -1,24 +1,58 @@
 # core/views/library.py
 
+import base64
+import binascii
+import json
 import logging
-from typing import Dict, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import F, Max, Q
 from django.views.generic import TemplateView
 from plexapi.library import LibrarySection
-from plexapi.server import PlexServer
+
+from media_manager.models import Artist, LibrarySyncCursor, Movie, Show
+from media_manager.tasks import get_library_generation
+from plex_auth.utils.exceptions import ServerUnavailableError
+from plex_auth.utils.plex_manager import PlexManager
 
 logger = logging.getLogger(__name__)
 
+# Local tables mirroring each Plex library type
+CATALOG_MODELS = {
+    "movie": Movie,
+    "show": Show,
+    "artist": Artist,
+}
+
+# Sortable columns, each backed by an index; a model offers those it has
+SORT_FIELDS = {
+    "title": "Title",
+    "year": "Year",
+    "rating": "Rating",
+    "added_at": "Date added",
+    "duration": "Duration",
+}
+FILTER_FIELDS = ["year", "content_rating", "min_rating"]
+
 
 class LibraryView(LoginRequiredMixin, TemplateView):
     """
     Display contents of a specific Plex library section.
+
+    Libraries mirrored into the local catalog are rendered from the database
+    with keyset pagination, so pages load without contacting the PMS and
+    stay fast however deep the user pages. Libraries that haven't been
+    synced yet fall back to reading the server directly.
     """
 
     template_name = "core/library.html"
     login_url = "plex_auth:login"
+    items_per_page = 24
 
     def get_context_data(self, **kwargs) -> Dict:
         context = super().get_context_data(**kwargs)
@@ -28,43 +62,18 @@ class LibraryView(LoginRequiredMixin, TemplateView):
         library_key = kwargs.get("library_key")
 
         try:
-            # Get server connection
-            server_conn = user.plex_servers.get(
-                machine_identifier=server_id, status="available"
+            server_conn = user.plex_servers.get(machine_identifier=server_id)
+            library = self._get_known_library(server_conn, library_key)
+            model = self._get_catalog_model(
+                server_conn, library_key, library.get("type")
             )
 
-            # Use cache for library data
-            cache_key = f"library_{server_id}_{library_key}_{user.id}"
-            library_data = cache.get(cache_key)
-
-            if not library_data:
-                # Connect to Plex server
-                server = PlexServer(server_conn.url, server_conn.token)
-                library = server.library.sectionByID(library_key)
-
-                # Get library contents with pagination
-                page = self.request.GET.get("page", "1")
-                try:
-                    page = max(1, int(page))
-                except ValueError:
-                    page = 1
-
-                items_per_page = 24
-                start = (page - 1) * items_per_page
-
-                library_data = {
-                    "info": self._get_library_info(library),
-                    "items": self._get_library_items(library, start, items_per_page),
-                    "server_name": server_conn.name,
-                    "current_page": page,
-                    "has_next": len(library.all()) > (page * items_per_page),
-                    "has_previous": page > 1,
-                }
-
-                # Cache for 5 minutes
-                cache.set(cache_key, library_data, timeout=300)
-
-            context.update(library_data)
+            if model is not None:
+                context.update(
+                    self._get_catalog_context(server_conn, library_key, library, model)
+                )
+            else:
+                context.update(self._get_live_context(server_conn, library_key))
 
         except Exception as e:
             logger.error(
@@ -79,100 +88,414 @@ class LibraryView(LoginRequiredMixin, TemplateView):
 
         return context
 
-    def _get_library_info(self, library: LibrarySection) -> Dict:
+    @staticmethod
+    def _get_known_library(server_conn, library_key: str) -> Dict:
+        """Look up the library's title and type from cached listings only."""
+        libraries = cache.get(
+            f"server_libraries_{server_conn.machine_identifier}"
+        ) or PlexManager.get_last_known_libraries(server_conn)
+        return next(
+            (lib for lib in libraries if str(lib.get("key")) == str(library_key)),
+            {},
+        )
+
+    @staticmethod
+    def _get_catalog_model(server_conn, library_key: str, library_type: Optional[str]):
+        """
+        Return the model mirroring the library, or None if it isn't synced.
+
+        Rows alone don't make a library complete: a webhook or an interrupted
+        first sync leaves only some of them. The catalog is only served once
+        a full sync of the library has finished.
+        """
+        if not LibrarySyncCursor.objects.filter(
+            server=server_conn,
+            library_key=library_key,
+            last_full_sync_at__isnull=False,
+        ).exists():
+            return None
+
+        if library_type:
+            candidates = [CATALOG_MODELS.get(library_type)]
+        else:
+            candidates = CATALOG_MODELS.values()
+
+        for model in candidates:
+            if (
+                model is not None
+                and model.objects.filter(
+                    server=server_conn, library_key=library_key
+                ).exists()
+            ):
+                return model
+        return None
+
+    def _get_catalog_context(
+        self, server_conn, library_key: str, library: Dict, model
+    ) -> Dict:
+        """Build one page of a mirrored library from the database."""
+        params = self.request.GET
+        library_type = next(t for t, m in CATALOG_MODELS.items() if m is model)
+
+        sorts = [name for name in SORT_FIELDS if _has_field(model, name)]
+        sort = params.get("sort", "title")
+        if sort.lstrip("-") not in sorts:
+            sort = "title"
+
+        queryset = model.objects.filter(server=server_conn, library_key=library_key)
+        queryset, filters = self._apply_filters(queryset, model, params)
+
+        field = sort.lstrip("-")
+        backwards = "before" in params
+        cursor = _decode_cursor(
+            model, field, params.get("before" if backwards else "after")
+        )
+        if cursor is None:
+            # Without a usable cursor there's nothing to page back from
+            backwards = False
+        rows, has_more = self._get_keyset_page(
+            queryset, field, sort.startswith("-"), cursor, backwards
+        )
+
+        if backwards:
+            has_previous, has_next = has_more, True
+        else:
+            has_previous, has_next = cursor is not None, has_more
+
+        base_query = {"sort": sort} if sort != "title" else {}
+        base_query.update({name: value for name, value in filters.items() if value})
+
+        def page_query(direction: str, row) -> str:
+            cursor_value = _encode_cursor(getattr(row, field), row.pk)
+            return urlencode({**base_query, direction: cursor_value})
+
+        last_synced_at = LibrarySyncCursor.objects.filter(
+            server=server_conn, library_key=library_key
+        ).aggregate(last=Max("last_synced_at"))["last"]
+
+        return {
+            "info": {
+                "key": library_key,
+                "title": library.get("title") or f"Library {library_key}",
+                "type": library_type,
+                "total_items": queryset.count(),
+                "modified_at": last_synced_at,
+            },
+            "items": [self._format_catalog_item(row, library_type) for row in rows],
+            "server_name": server_conn.name,
+            "has_next": bool(rows) and has_next,
+            "has_previous": bool(rows) and has_previous,
+            "next_query": page_query("after", rows[-1]) if rows else "",
+            "previous_query": page_query("before", rows[0]) if rows else "",
+            "sort": sort,
+            "sort_options": [
+                option
+                for name in sorts
+                for option in (
+                    (name, SORT_FIELDS[name]),
+                    (f"-{name}", f"{SORT_FIELDS[name]} (descending)"),
+                )
+            ],
+            "filters": filters,
+            "content_ratings": (
+                self._get_content_ratings(queryset.model, server_conn, library_key)
+                if "content_rating" in filters
+                else []
+            ),
+        }
+
+    @staticmethod
+    def _apply_filters(queryset, model, params) -> Tuple[Any, Dict[str, str]]:
+        """
+        Narrow the queryset by the filter query params the model supports.
+
+        Returns:
+            Tuple of (filtered queryset, the filters offered for this model
+            mapped to their current values)
+        """
+        filters = {}
+        for name in FILTER_FIELDS:
+            column = "rating" if name == "min_rating" else name
+            if not _has_field(model, column):
+                continue
+
+            value = params.get(name, "").strip()
+            filters[name] = value
+            if not value:
+                continue
+
+            try:
+                if name == "year":
+                    queryset = queryset.filter(year=int(value))
+                elif name == "min_rating":
+                    queryset = queryset.filter(rating__gte=float(value))
+                else:
+                    queryset = queryset.filter(content_rating=value)
+            except ValueError:
+                # Ignore malformed numbers rather than failing the page
+                filters[name] = ""
+
+        return queryset, filters
+
+    @staticmethod
+    def _get_content_ratings(model, server_conn, library_key: str) -> List[str]:
+        return list(
+            model.objects.filter(server=server_conn, library_key=library_key)
+            .exclude(content_rating="")
+            .order_by("content_rating")
+            .values_list("content_rating", flat=True)
+            .distinct()
+        )
+
+    def _get_keyset_page(
+        self,
+        queryset,
+        field: str,
+        descending: bool,
+        cursor: Optional[Tuple[Any, int]],
+        backwards: bool,
+    ) -> Tuple[List, bool]:
+        """
+        Fetch the page after (or before) a cursor, ordered by (field, id).
+
+        Rather than skipping ``offset`` rows, the query seeks straight to the
+        cursor's position, so every page costs the same. Empty values sort
+        last; pages are read in reverse order when walking backwards.
+
+        Returns:
+            Tuple of (rows in display order, whether more rows lie beyond them)
+        """
+        ascending = descending == backwards
+        order = F(field).asc if ascending else F(field).desc
+        queryset = queryset.order_by(
+            order(nulls_first=True) if backwards else order(nulls_last=True),
+            "id" if ascending else "-id",
+        )
+
+        if cursor is not None:
+            queryset = queryset.filter(
+                _seek_past(field, cursor, ascending, nulls_first=backwards)
+            )
+
+        rows = list(queryset[: self.items_per_page + 1])
+        has_more = len(rows) > self.items_per_page
+        rows = rows[: self.items_per_page]
+        if backwards:
+            rows.reverse()
+        return rows, has_more
+
+    @staticmethod
+    def _format_catalog_item(row, library_type: str) -> Dict:
+        """Shape a mirrored item like the live items the template expects."""
+        item_data = {
+            "key": row.plex_key,
+            "rating_key": row.plex_key,
+            "title": row.title,
+            "year": getattr(row, "year", None),
+            "thumb": row.thumb_url,
+            "summary": row.summary,
+            "type": library_type,
+            "duration": getattr(row, "duration", 0),
+            "added_at": row.added_at,
+        }
+
+        if library_type == "movie":
+            item_data.update(
+                {
+                    "rating": row.rating,
+                    "content_rating": row.content_rating,
+                    "studio": row.studio,
+                    "genres": row.genres[:3],
+                    "directors": row.directors[:2],
+                    "resolution": _format_resolution(row.video_resolution),
+                }
+            )
+        elif library_type == "show":
+            item_data.update(
+                {
+                    "rating": row.rating,
+                    "content_rating": row.content_rating,
+                    "studio": row.studio,
+                    "episode_count": row.episode_count,
+                    "season_count": row.season_count,
+                    "genres": row.genres[:3],
+                }
+            )
+
+        return item_data
+
+    def _get_live_context(self, server_conn, library_key: str) -> Dict:
+        """
+        Read a library that isn't mirrored locally straight from the PMS.
+
+        Pages slice a cached snapshot of the section's rating keys and only
+        load metadata for their own items, and the count comes from the
+        container header of a zero-size query, so no page ever downloads
+        the whole library.
+        """
+        if server_conn.status != "available":
+            raise ServerUnavailableError(f"Server {server_conn.name} is unavailable")
+
+        user = self.request.user
+        server_id = server_conn.machine_identifier
+
+        # Get library contents with pagination
+        page = self.request.GET.get("page", "1")
+        try:
+            page = max(1, int(page))
+        except ValueError:
+            page = 1
+
+        # Use cache for library data; webhooks bump the generation to drop
+        # every cached page of the library
+        generation = get_library_generation(server_conn, library_key)
+        cache_key = (
+            f"library_{server_id}_{library_key}_{user.id}_g{generation}_page{page}"
+        )
+        library_data = cache.get(cache_key)
+
+        if not library_data:
+            plex_manager = PlexManager(user.plex_token)
+            library = plex_manager.get_library_section(server_conn, library_key)
+
+            items_per_page = self.items_per_page
+            start = (page - 1) * items_per_page
+            total_items = library.totalViewSize(includeCollections=False)
+            rating_keys = plex_manager.get_library_index(server_conn, library)
+
+            library_data = {
+                "info": self._get_library_info(library, total_items),
+                "items": self._get_library_items(
+                    plex_manager,
+                    server_conn,
+                    rating_keys[start : start + items_per_page],
+                ),
+                "server_name": server_conn.name,
+                "current_page": page,
+                "has_next": total_items > (page * items_per_page),
+                "has_previous": page > 1,
+                "next_query": urlencode({"page": page + 1}),
+                "previous_query": urlencode({"page": page - 1}),
+            }
+
+            # Cache for 5 minutes
+            cache.set(cache_key, library_data, timeout=300)
+
+        return library_data
+
+    def _get_library_info(self, library: LibrarySection, total_items: int) -> Dict:
         """Get basic information about the library section."""
         return {
             "key": library.key,
             "title": library.title,
             "type": library.type,
-            "total_items": len(library.all()),
+            "total_items": total_items,
             "agent": library.agent,
             "scanner": library.scanner,
             "language": library.language,
             "locations": library.locations,
-            "empty": library.isEmpty(),
+            "empty": total_items == 0,
             "modified_at": library.updatedAt,
         }
 
     def _get_library_items(
-        self, library: LibrarySection, start: int, limit: int
+        self, plex_manager: PlexManager, server_conn, rating_keys: List[str]
     ) -> List[Dict]:
-        """Get paginated library items with metadata."""
-        items = []
-        all_items = library.all()[start : start + limit]
+        """Load one page of library items by rating key, in snapshot order."""
+        if not rating_keys:
+            return []
 
-        for item in all_items:
-            try:
-                item_data = {
-                    "key": item.key,
-                    "rating_key": item.ratingKey,
-                    "title": item.title,
-                    "year": getattr(item, "year", None),
-                    "thumb": getattr(item, "thumb", None),
-                    "summary": getattr(item, "summary", ""),
-                    "type": item.type,
-                    "duration": getattr(item, "duration", 0),
-                    "added_at": getattr(item, "addedAt", None),
-                }
+        # Items deleted since the snapshot was taken are left out
+        by_key = {
+            str(item["key"]): item
+            for item in plex_manager.get_metadata_batch(server_conn, rating_keys)
+        }
 
-                # Add media-type specific information
-                if library.type == "movie":
-                    item_data.update(
-                        {
-                            "rating": getattr(item, "rating", None),
-                            "content_rating": getattr(item, "contentRating", None),
-                            "studio": getattr(item, "studio", None),
-                            "genres": (
-                                [g.tag for g in item.genres][:3]
-                                if hasattr(item, "genres")
-                                else []
-                            ),
-                            "directors": (
-                                [d.tag for d in item.directors][:2]
-                                if hasattr(item, "directors")
-                                else []
-                            ),
-                            "resolution": self._get_video_resolution(item),
-                        }
-                    )
-                elif library.type == "show":
-                    item_data.update(
-                        {
-                            "rating": getattr(item, "rating", None),
-                            "content_rating": getattr(item, "contentRating", None),
-                            "studio": getattr(item, "studio", None),
-                            "episode_count": getattr(item, "leafCount", 0),
-                            "season_count": (
-                                len(item.seasons()) if hasattr(item, "seasons") else 0
-                            ),
-                            "genres": (
-                                [g.tag for g in item.genres][:3]
-                                if hasattr(item, "genres")
-                                else []
-                            ),
-                        }
-                    )
-
-                items.append(item_data)
-
-            except Exception as e:
-                logger.error(f"Error processing library item: {str(e)}")
+        items = []
+        for rating_key in rating_keys:
+            item = by_key.get(str(rating_key))
+            if item is None:
                 continue
 
+            items.append(
+                {
+                    **item,
+                    "rating_key": item["key"],
+                    "genres": item.get("genres", [])[:3],
+                    "directors": item.get("directors", [])[:2],
+                    "resolution": _format_resolution(item.get("video_resolution")),
+                }
+            )
+
         return items
 
-    def _get_video_resolution(self, item) -> str:
-        """Get video resolution for a media item."""
-        try:
-            media = item.media[0] if item.media else None
-            if media:
-                if media.height >= 2160:
-                    return "4K"
-                elif media.height >= 1080:
-                    return "1080p"
-                elif media.height >= 720:
-                    return "720p"
-                return f"{media.height}p"
-        except:
-            pass
-        return "Unknown"
+
+def _has_field(model, name: str) -> bool:
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _format_resolution(resolution: str) -> str:
+    """Turn a PMS videoResolution ('1080', '4k', 'sd') into a badge label."""
+    if not resolution:
+        return ""
+    if resolution.isdigit():
+        return f"{resolution}p"
+    return resolution.upper()
+
+
+def _encode_cursor(value: Any, pk: int) -> str:
+    """Pack a row's sort value and id into an opaque URL-safe token."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([value, pk], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(model, field: str, token: Optional[str]):
+    """
+    Unpack a cursor token for the given sort field.
+
+    Returns:
+        Tuple of (sort value, id), or None if the token is missing or
+        malformed, in which case paging restarts from the first page
+    """
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if value is not None:
+            value = model._meta.get_field(field).to_python(value)
+        return value, int(pk)
+    except (binascii.Error, ValueError, TypeError, ValidationError):
+        logger.debug(f"Ignoring malformed library cursor: {token}")
+        return None
+
+
+def _seek_past(field: str, cursor: Tuple[Any, int], ascending: bool, nulls_first: bool):
+    """
+    Match the rows that come after ``cursor`` in (field, id) order.
+
+    Args:
+        field: Sort column
+        cursor: (sort value, id) of the last row already shown
+        ascending: Direction the rows are being read in
+        nulls_first: Whether rows with no value are read before the others
+    """
+    op = "gt" if ascending else "lt"
+    value, pk = cursor
+
+    if value is None:
+        remaining_nulls = Q(**{f"{field}__isnull": True, f"id__{op}": pk})
+        if nulls_first:
+            return remaining_nulls | Q(**{f"{field}__isnull": False})
+        return remaining_nulls
+
+    after = Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"id__{op}": pk})
+    if nulls_first:
+        return after
+    return after | Q(**{f"{field}__isnull": True})
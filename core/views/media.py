@@ -8,7 +8,11 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.cache import cache
 from django.views.generic import TemplateView
 
-from plex_auth.utils.exceptions import PlexManagerError
+from plex_auth.utils.exceptions import (
+    PlexManagerError,
+    ServerBusyError,
+    ServerUnavailableError,
+)
 from plex_auth.utils.plex_manager import PlexManager
 
 logger = logging.getLogger(__name__)
@@ -157,6 +161,31 @@ class MediaView(LoginRequiredMixin, TemplateView):
 
                 server_conn.mark_available()
 
+            except ServerUnavailableError as e:
+                # Circuit is open or the request budget is spent: don't wait on
+                # the server, show what we last saw
+                logger.info(f"Skipping {server_conn.name}: {str(e)}")
+                if isinstance(e, ServerBusyError):
+                    errors.append(
+                        f"Server {server_conn.name} is busy, showing last known "
+                        f"data. Try again in a moment"
+                    )
+                else:
+                    errors.append(
+                        f"Server {server_conn.name} is unreachable, showing last "
+                        f"known data"
+                    )
+                for library in plex_manager.get_last_known_libraries(server_conn):
+                    library_data = {
+                        **library,
+                        "server_name": server_conn.name,
+                        "server_id": server_conn.machine_identifier,
+                        "stale": True,
+                    }
+                    all_libraries.append(library_data)
+                    self._update_stats(stats, library_data)
+                continue
+
             except PlexManagerError as e:
                 error_msg = f"Error connecting to server {server_conn.name}: {str(e)}"
                 logger.error(error_msg)
@@ -4,15 +4,16 @@ import logging
 from datetime import timedelta
 from typing import Any, Dict, List
 
+import pytz
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.cache import cache
 from django.db.models import Q
 from django.utils import timezone
 from django.views.generic import TemplateView
-import pytz
 
 from core.models import UserActivity, UserPreference
-from plex_auth.utils.exceptions import PlexManagerError
+from plex_auth.utils.exceptions import PlexManagerError, ServerUnavailableError
+from plex_auth.utils.locks import DistributedLock
 from plex_auth.utils.plex_manager import PlexManager
 
 logger = logging.getLogger(__name__)
@@ -125,7 +126,7 @@ class ProfileView(LoginRequiredMixin, TemplateView):
     def _get_sync_status(self, user) -> Dict[str, Any]:
         """Get current sync status information."""
         return {
-            "is_syncing": cache.get(f"sync_in_progress_{user.id}", False),
+            "is_syncing": DistributedLock(f"plex_sync_{user.id}").is_held(),
             "last_sync": (
                 timezone.localtime(user.last_synced) if user.last_synced else None
             ),
@@ -184,25 +185,28 @@ class ProfileView(LoginRequiredMixin, TemplateView):
 
         plex_manager = PlexManager(user.plex_token)
 
-        for server in user.plex_servers.filter(status="available"):
+        for server in user.plex_servers.all():
             try:
                 libraries = plex_manager.get_libraries(server)
-                stats["total_libraries"] += len(libraries)
+            except ServerUnavailableError:
+                # Circuit is open, fall back to the last libraries we saw
+                libraries = plex_manager.get_last_known_libraries(server)
+            except PlexManagerError:
+                continue
 
-                for lib in libraries:
-                    stats["total_items"] += lib.get("count", 0)
-                    lib_type = lib.get("type", "other")
-                    stats["library_types"][lib_type] = (
-                        stats["library_types"].get(lib_type, 0) + 1
-                    )
+            stats["total_libraries"] += len(libraries)
 
-                if server.is_local:
-                    stats["connection_types"]["local"] += 1
-                else:
-                    stats["connection_types"]["remote"] += 1
+            for lib in libraries:
+                stats["total_items"] += lib.get("count", 0)
+                lib_type = lib.get("type", "other")
+                stats["library_types"][lib_type] = (
+                    stats["library_types"].get(lib_type, 0) + 1
+                )
 
-            except PlexManagerError:
-                continue
+            if server.is_local:
+                stats["connection_types"]["local"] += 1
+            else:
+                stats["connection_types"]["remote"] += 1
 
         return stats
 
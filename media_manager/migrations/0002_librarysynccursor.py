@@ -0,0 +1,45 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media_manager", "0001_initial"),
+        ("plex_auth", "0003_plexserverconnection_preferred_url"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LibrarySyncCursor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("library_key", models.CharField(max_length=50)),
+                ("last_updated_at", models.DateTimeField(blank=True, null=True)),
+                ("last_added_at", models.DateTimeField(blank=True, null=True)),
+                ("last_synced_at", models.DateTimeField(blank=True, null=True)),
+                ("last_full_sync_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "server",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sync_cursors",
+                        to="plex_auth.plexserverconnection",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("server", "library_key")},
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media_manager", "0002_librarysynccursor"),
+        ("plex_auth", "0003_plexserverconnection_preferred_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="library_key",
+            field=models.CharField(blank=True, max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name="movie",
+            index=models.Index(
+                fields=["server", "library_key"], name="media_manag_server__660198_idx"
+            ),
+        ),
+    ]
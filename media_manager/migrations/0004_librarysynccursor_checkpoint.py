@@ -0,0 +1,42 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media_manager", "0003_movie_library_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="librarysynccursor",
+            name="checkpoint_added_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="librarysynccursor",
+            name="checkpoint_field",
+            field=models.CharField(
+                blank=True,
+                help_text="Delta filter field, blank for full",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="librarysynccursor",
+            name="checkpoint_full",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="librarysynccursor",
+            name="checkpoint_offset",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="librarysynccursor",
+            name="checkpoint_updated_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
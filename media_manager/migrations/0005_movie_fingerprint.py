@@ -0,0 +1,20 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media_manager", "0004_librarysynccursor_checkpoint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="movie",
+            name="fingerprint",
+            field=models.CharField(
+                blank=True, help_text="Hash of the synced Plex fields", max_length=64
+            ),
+        ),
+    ]
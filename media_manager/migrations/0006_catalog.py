@@ -0,0 +1,486 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:45
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("media_manager", "0005_movie_fingerprint"),
+        ("plex_auth", "0004_plexserverconnection_webhook_secret"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Artist",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("plex_key", models.CharField(max_length=50)),
+                ("library_key", models.CharField(blank=True, max_length=50)),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField(blank=True)),
+                ("thumb_url", models.URLField(blank=True, max_length=1024)),
+                ("added_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True,
+                        help_text="Hash of the synced Plex fields",
+                        max_length=64,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                ("genres", models.JSONField(blank=True, default=list)),
+                ("view_count", models.IntegerField(default=0)),
+                (
+                    "server",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)ss",
+                        to="plex_auth.plexserverconnection",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Album",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("plex_key", models.CharField(max_length=50)),
+                ("library_key", models.CharField(blank=True, max_length=50)),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField(blank=True)),
+                ("thumb_url", models.URLField(blank=True, max_length=1024)),
+                ("added_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True,
+                        help_text="Hash of the synced Plex fields",
+                        max_length=64,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                ("year", models.IntegerField(blank=True, null=True)),
+                (
+                    "studio",
+                    models.CharField(
+                        blank=True, help_text="Record label", max_length=100
+                    ),
+                ),
+                ("genres", models.JSONField(blank=True, default=list)),
+                ("track_count", models.IntegerField(default=0)),
+                ("view_count", models.IntegerField(default=0)),
+                (
+                    "server",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)ss",
+                        to="plex_auth.plexserverconnection",
+                    ),
+                ),
+                (
+                    "artist",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="albums",
+                        to="media_manager.artist",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Show",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("plex_key", models.CharField(max_length=50)),
+                ("library_key", models.CharField(blank=True, max_length=50)),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField(blank=True)),
+                ("thumb_url", models.URLField(blank=True, max_length=1024)),
+                ("added_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True,
+                        help_text="Hash of the synced Plex fields",
+                        max_length=64,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                ("year", models.IntegerField(blank=True, null=True)),
+                ("content_rating", models.CharField(blank=True, max_length=10)),
+                ("studio", models.CharField(blank=True, max_length=100)),
+                ("rating", models.FloatField(blank=True, null=True)),
+                ("genres", models.JSONField(blank=True, default=list)),
+                ("season_count", models.IntegerField(default=0)),
+                ("episode_count", models.IntegerField(default=0)),
+                ("viewed_episode_count", models.IntegerField(default=0)),
+                (
+                    "server",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)ss",
+                        to="plex_auth.plexserverconnection",
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Season",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("plex_key", models.CharField(max_length=50)),
+                ("library_key", models.CharField(blank=True, max_length=50)),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField(blank=True)),
+                ("thumb_url", models.URLField(blank=True, max_length=1024)),
+                ("added_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True,
+                        help_text="Hash of the synced Plex fields",
+                        max_length=64,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                (
+                    "index",
+                    models.IntegerField(
+                        blank=True, help_text="Season number", null=True
+                    ),
+                ),
+                ("episode_count", models.IntegerField(default=0)),
+                ("viewed_episode_count", models.IntegerField(default=0)),
+                (
+                    "server",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)ss",
+                        to="plex_auth.plexserverconnection",
+                    ),
+                ),
+                (
+                    "show",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="seasons",
+                        to="media_manager.show",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["index"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Episode",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("plex_key", models.CharField(max_length=50)),
+                ("library_key", models.CharField(blank=True, max_length=50)),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField(blank=True)),
+                ("thumb_url", models.URLField(blank=True, max_length=1024)),
+                ("added_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True,
+                        help_text="Hash of the synced Plex fields",
+                        max_length=64,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                ("season_number", models.IntegerField(blank=True, null=True)),
+                (
+                    "index",
+                    models.IntegerField(
+                        blank=True, help_text="Episode number", null=True
+                    ),
+                ),
+                (
+                    "duration",
+                    models.IntegerField(
+                        default=0, help_text="Duration in milliseconds"
+                    ),
+                ),
+                ("content_rating", models.CharField(blank=True, max_length=10)),
+                ("rating", models.FloatField(blank=True, null=True)),
+                ("originally_available_at", models.DateField(blank=True, null=True)),
+                ("view_count", models.IntegerField(default=0)),
+                (
+                    "server",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)ss",
+                        to="plex_auth.plexserverconnection",
+                    ),
+                ),
+                (
+                    "season",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="episodes",
+                        to="media_manager.season",
+                    ),
+                ),
+                (
+                    "show",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="episodes",
+                        to="media_manager.show",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["season_number", "index"],
+                "abstract": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="Track",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("plex_key", models.CharField(max_length=50)),
+                ("library_key", models.CharField(blank=True, max_length=50)),
+                ("title", models.CharField(max_length=255)),
+                ("summary", models.TextField(blank=True)),
+                ("thumb_url", models.URLField(blank=True, max_length=1024)),
+                ("added_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        blank=True,
+                        help_text="Hash of the synced Plex fields",
+                        max_length=64,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("modified_at", models.DateTimeField(auto_now=True)),
+                ("disc_number", models.IntegerField(blank=True, null=True)),
+                (
+                    "index",
+                    models.IntegerField(
+                        blank=True, help_text="Track number", null=True
+                    ),
+                ),
+                (
+                    "duration",
+                    models.IntegerField(
+                        default=0, help_text="Duration in milliseconds"
+                    ),
+                ),
+                ("view_count", models.IntegerField(default=0)),
+                (
+                    "album",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tracks",
+                        to="media_manager.album",
+                    ),
+                ),
+                (
+                    "artist",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tracks",
+                        to="media_manager.artist",
+                    ),
+                ),
+                (
+                    "server",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)ss",
+                        to="plex_auth.plexserverconnection",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["disc_number", "index"],
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="artist",
+            index=models.Index(
+                fields=["server", "library_key"], name="artist_server_library_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="artist",
+            index=models.Index(fields=["title"], name="artist_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="artist",
+            index=models.Index(fields=["added_at"], name="artist_added_at_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="artist",
+            unique_together={("server", "plex_key")},
+        ),
+        migrations.AddIndex(
+            model_name="album",
+            index=models.Index(
+                fields=["server", "library_key"], name="album_server_library_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="album",
+            index=models.Index(fields=["title"], name="album_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="album",
+            index=models.Index(fields=["added_at"], name="album_added_at_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="album",
+            unique_together={("server", "plex_key")},
+        ),
+        migrations.AddIndex(
+            model_name="show",
+            index=models.Index(
+                fields=["server", "library_key"], name="show_server_library_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="show",
+            index=models.Index(fields=["title"], name="show_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="show",
+            index=models.Index(fields=["added_at"], name="show_added_at_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="show",
+            unique_together={("server", "plex_key")},
+        ),
+        migrations.AddIndex(
+            model_name="season",
+            index=models.Index(
+                fields=["server", "library_key"], name="season_server_library_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="season",
+            index=models.Index(fields=["title"], name="season_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="season",
+            index=models.Index(fields=["added_at"], name="season_added_at_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="season",
+            unique_together={("server", "plex_key")},
+        ),
+        migrations.AddIndex(
+            model_name="episode",
+            index=models.Index(
+                fields=["server", "library_key"], name="episode_server_library_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="episode",
+            index=models.Index(fields=["title"], name="episode_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="episode",
+            index=models.Index(fields=["added_at"], name="episode_added_at_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="episode",
+            unique_together={("server", "plex_key")},
+        ),
+        migrations.AddIndex(
+            model_name="track",
+            index=models.Index(
+                fields=["server", "library_key"], name="track_server_library_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="track",
+            index=models.Index(fields=["title"], name="track_title_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="track",
+            index=models.Index(fields=["added_at"], name="track_added_at_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="track",
+            unique_together={("server", "plex_key")},
+        ),
+    ]
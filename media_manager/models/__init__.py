@@ -1,5 +1,17 @@
 # media_manager/models/__init__.py
 
+from .artist import Album, Artist, Track
+from .library_sync_cursor import LibrarySyncCursor
 from .movie import Movie
+from .show import Episode, Season, Show
 
-__all__ = ["Movie"]
+__all__ = [
+    "Album",
+    "Artist",
+    "Episode",
+    "LibrarySyncCursor",
+    "Movie",
+    "Season",
+    "Show",
+    "Track",
+]
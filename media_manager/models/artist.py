@@ -0,0 +1,60 @@
+# media_manager/models/artist.py
+
+from django.db import models
+
+from .catalog_item import CatalogItem
+
+
+class Artist(CatalogItem):
+    FINGERPRINT_FIELDS = CatalogItem.FINGERPRINT_FIELDS + ["genres", "view_count"]
+
+    genres = models.JSONField(default=list, blank=True)
+    view_count = models.IntegerField(default=0)
+
+    class Meta(CatalogItem.Meta):
+        pass
+
+
+class Album(CatalogItem):
+    FINGERPRINT_FIELDS = CatalogItem.FINGERPRINT_FIELDS + [
+        "artist_id",
+        "year",
+        "studio",
+        "genres",
+        "track_count",
+        "view_count",
+    ]
+
+    artist = models.ForeignKey(Artist, on_delete=models.CASCADE, related_name="albums")
+    year = models.IntegerField(null=True, blank=True)
+    studio = models.CharField(max_length=100, blank=True, help_text="Record label")
+    genres = models.JSONField(default=list, blank=True)
+    track_count = models.IntegerField(default=0)
+    view_count = models.IntegerField(default=0)
+
+    class Meta(CatalogItem.Meta):
+        pass
+
+    def __str__(self):
+        return f"{self.title} ({self.year or 'N/A'})"
+
+
+class Track(CatalogItem):
+    FINGERPRINT_FIELDS = CatalogItem.FINGERPRINT_FIELDS + [
+        "artist_id",
+        "album_id",
+        "disc_number",
+        "index",
+        "duration",
+        "view_count",
+    ]
+
+    artist = models.ForeignKey(Artist, on_delete=models.CASCADE, related_name="tracks")
+    album = models.ForeignKey(Album, on_delete=models.CASCADE, related_name="tracks")
+    disc_number = models.IntegerField(null=True, blank=True)
+    index = models.IntegerField(null=True, blank=True, help_text="Track number")
+    duration = models.IntegerField(default=0, help_text="Duration in milliseconds")
+    view_count = models.IntegerField(default=0)
+
+    class Meta(CatalogItem.Meta):
+        ordering = ["disc_number", "index"]
@@ -0,0 +1,59 @@
+# media_manager/models/catalog_item.py
+
+from django.db import models
+from django.utils import timezone
+
+from plex_auth.models import PlexServerConnection
+
+from .fingerprint import FingerprintMixin
+
+
+class CatalogItem(FingerprintMixin, models.Model):
+    """
+    Fields shared by every locally mirrored Plex item other than movies.
+
+    Subclasses list the Plex-sourced fields they store in FINGERPRINT_FIELDS,
+    which are both hashed to detect changes and overwritten on sync.
+    """
+
+    FINGERPRINT_FIELDS = [
+        "library_key",
+        "title",
+        "summary",
+        "thumb_url",
+        "added_at",
+        "updated_at",
+    ]
+
+    plex_key = models.CharField(max_length=50)
+    server = models.ForeignKey(
+        PlexServerConnection, on_delete=models.CASCADE, related_name="%(class)ss"
+    )
+    library_key = models.CharField(max_length=50, blank=True)
+    title = models.CharField(max_length=255)
+    summary = models.TextField(blank=True)
+    thumb_url = models.URLField(max_length=1024, blank=True)
+
+    added_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    # Internal fields
+    fingerprint = models.CharField(
+        max_length=64, blank=True, help_text="Hash of the synced Plex fields"
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+    modified_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+        unique_together = ["server", "plex_key"]
+        indexes = [
+            models.Index(
+                fields=["server", "library_key"], name="%(class)s_server_library_idx"
+            ),
+            models.Index(fields=["title"], name="%(class)s_title_idx"),
+            models.Index(fields=["added_at"], name="%(class)s_added_at_idx"),
+        ]
+
+    def __str__(self):
+        return self.title
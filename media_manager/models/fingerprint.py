@@ -0,0 +1,32 @@
+# media_manager/models/fingerprint.py
+
+import hashlib
+import json
+from datetime import datetime
+from typing import List, Optional
+
+
+class FingerprintMixin:
+    """
+    Hashes a synced model's Plex-sourced fields to detect changes.
+
+    Models list the fields in FINGERPRINT_FIELDS and store the hash in a
+    ``fingerprint`` field, so syncs can skip rows whose content is unchanged.
+    """
+
+    FINGERPRINT_FIELDS: List[str] = []
+
+    def compute_fingerprint(self, fields: Optional[List[str]] = None) -> str:
+        """Hash the normalized Plex fields so unchanged rows can be skipped.
+
+        Args:
+            fields: Fields to hash instead of FINGERPRINT_FIELDS
+        """
+        values = {}
+        for name in fields or self.FINGERPRINT_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, datetime):
+                value = int(value.timestamp())
+            values[name] = value
+        payload = json.dumps(values, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
@@ -0,0 +1,111 @@
+# media_manager/models/library_sync_cursor.py
+
+from typing import Optional
+
+from django.db import models
+from django.utils import timezone
+
+from plex_auth.models import PlexServerConnection
+
+
+class LibrarySyncCursor(models.Model):
+    """
+    High-water marks for incremental syncs of one Plex library.
+
+    Later syncs only ask the PMS for items added or updated after these
+    marks instead of re-downloading the whole library.
+    """
+
+    server = models.ForeignKey(
+        PlexServerConnection, on_delete=models.CASCADE, related_name="sync_cursors"
+    )
+    library_key = models.CharField(max_length=50)
+
+    # Watermarks from the newest items seen so far
+    last_updated_at = models.DateTimeField(null=True, blank=True)
+    last_added_at = models.DateTimeField(null=True, blank=True)
+
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    last_full_sync_at = models.DateTimeField(null=True, blank=True)
+
+    # Progress of an interrupted sync, committed with each chunk and cleared
+    # once the sync completes
+    checkpoint_full = models.BooleanField(default=False)
+    checkpoint_field = models.CharField(
+        max_length=20, blank=True, help_text="Delta filter field, blank for full"
+    )
+    checkpoint_offset = models.IntegerField(null=True, blank=True)
+    checkpoint_added_at = models.DateTimeField(null=True, blank=True)
+    checkpoint_updated_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        unique_together = ["server", "library_key"]
+
+    def __str__(self):
+        return f"{self.server.name} library {self.library_key}"
+
+    @property
+    def has_watermark(self) -> bool:
+        """Whether a previous sync recorded where to resume from."""
+        return self.last_updated_at is not None or self.last_added_at is not None
+
+    @property
+    def has_checkpoint(self) -> bool:
+        """Whether an interrupted sync left progress to resume from."""
+        return self.checkpoint_offset is not None
+
+    def save_checkpoint(
+        self,
+        full: bool,
+        field: str,
+        offset: int,
+        last_added_at: Optional[timezone.datetime],
+        last_updated_at: Optional[timezone.datetime],
+    ) -> None:
+        """Record how far the running sync got; call inside the chunk's transaction."""
+        self.checkpoint_full = full
+        self.checkpoint_field = field
+        self.checkpoint_offset = offset
+        self.checkpoint_added_at = last_added_at
+        self.checkpoint_updated_at = last_updated_at
+        self.save(
+            update_fields=[
+                "checkpoint_full",
+                "checkpoint_field",
+                "checkpoint_offset",
+                "checkpoint_added_at",
+                "checkpoint_updated_at",
+            ]
+        )
+
+    def advance(
+        self,
+        last_added_at: Optional[timezone.datetime],
+        last_updated_at: Optional[timezone.datetime],
+        full: bool = False,
+    ) -> None:
+        """
+        Move the watermarks forward after a successful sync.
+
+        Watermarks never move backwards, so a delta sync that saw nothing
+        new keeps the previous marks. Any checkpoint is cleared.
+        """
+        if last_added_at and (
+            self.last_added_at is None or last_added_at > self.last_added_at
+        ):
+            self.last_added_at = last_added_at
+        if last_updated_at and (
+            self.last_updated_at is None or last_updated_at > self.last_updated_at
+        ):
+            self.last_updated_at = last_updated_at
+
+        self.last_synced_at = timezone.now()
+        if full:
+            self.last_full_sync_at = self.last_synced_at
+
+        self.checkpoint_full = False
+        self.checkpoint_field = ""
+        self.checkpoint_offset = None
+        self.checkpoint_added_at = None
+        self.checkpoint_updated_at = None
+        self.save()
@@ -5,13 +5,43 @@ from django.utils import timezone
 
 from plex_auth.models import PlexServerConnection
 
+from .fingerprint import FingerprintMixin
+
+
+class Movie(FingerprintMixin, models.Model):
+    # Plex-sourced fields covered by the fingerprint
+    FINGERPRINT_FIELDS = [
+        "library_key",
+        "title",
+        "year",
+        "summary",
+        "duration",
+        "content_rating",
+        "video_resolution",
+        "rating",
+        "studio",
+        "genres",
+        "directors",
+        "actors",
+        "added_at",
+        "updated_at",
+        "thumb_url",
+        "view_count",
+    ]
+    # Fingerprinted fields a section listing always returns in full; tag
+    # lists are truncated and media info is missing until details are fetched
+    LISTING_FIELDS = [
+        name
+        for name in FINGERPRINT_FIELDS
+        if name not in ("genres", "directors", "actors", "video_resolution")
+    ]
 
-class Movie(models.Model):
     # Core Plex fields
     plex_key = models.CharField(max_length=50)
     server = models.ForeignKey(
         PlexServerConnection, on_delete=models.CASCADE, related_name="movies"
     )
+    library_key = models.CharField(max_length=50, blank=True)
     title = models.CharField(max_length=255)
     year = models.IntegerField(null=True, blank=True)
     summary = models.TextField(blank=True)
@@ -36,6 +66,9 @@ class Movie(models.Model):
     thumb_url = models.URLField(max_length=1024, blank=True)
 
     # Internal fields
+    fingerprint = models.CharField(
+        max_length=64, blank=True, help_text="Hash of the synced Plex fields"
+    )
     created_at = models.DateTimeField(default=timezone.now)
     modified_at = models.DateTimeField(auto_now=True)
 
@@ -43,6 +76,7 @@ class Movie(models.Model):
         unique_together = ["server", "plex_key"]
         indexes = [
             models.Index(fields=["server", "plex_key"]),
+            models.Index(fields=["server", "library_key"]),
             models.Index(fields=["title"]),
             models.Index(fields=["year"]),
             models.Index(fields=["content_rating"]),
@@ -0,0 +1,79 @@
+# media_manager/models/show.py
+
+from django.db import models
+
+from .catalog_item import CatalogItem
+
+
+class Show(CatalogItem):
+    FINGERPRINT_FIELDS = CatalogItem.FINGERPRINT_FIELDS + [
+        "year",
+        "content_rating",
+        "studio",
+        "rating",
+        "genres",
+        "season_count",
+        "episode_count",
+        "viewed_episode_count",
+    ]
+
+    year = models.IntegerField(null=True, blank=True)
+    content_rating = models.CharField(max_length=10, blank=True)
+    studio = models.CharField(max_length=100, blank=True)
+    rating = models.FloatField(null=True, blank=True)
+    genres = models.JSONField(default=list, blank=True)
+    season_count = models.IntegerField(default=0)
+    episode_count = models.IntegerField(default=0)
+    viewed_episode_count = models.IntegerField(default=0)
+
+    class Meta(CatalogItem.Meta):
+        pass
+
+    def __str__(self):
+        return f"{self.title} ({self.year or 'N/A'})"
+
+
+class Season(CatalogItem):
+    FINGERPRINT_FIELDS = CatalogItem.FINGERPRINT_FIELDS + [
+        "show_id",
+        "index",
+        "episode_count",
+        "viewed_episode_count",
+    ]
+
+    show = models.ForeignKey(Show, on_delete=models.CASCADE, related_name="seasons")
+    index = models.IntegerField(null=True, blank=True, help_text="Season number")
+    episode_count = models.IntegerField(default=0)
+    viewed_episode_count = models.IntegerField(default=0)
+
+    class Meta(CatalogItem.Meta):
+        ordering = ["index"]
+
+
+class Episode(CatalogItem):
+    FINGERPRINT_FIELDS = CatalogItem.FINGERPRINT_FIELDS + [
+        "show_id",
+        "season_id",
+        "season_number",
+        "index",
+        "duration",
+        "content_rating",
+        "rating",
+        "originally_available_at",
+        "view_count",
+    ]
+
+    show = models.ForeignKey(Show, on_delete=models.CASCADE, related_name="episodes")
+    season = models.ForeignKey(
+        Season, on_delete=models.CASCADE, related_name="episodes"
+    )
+    season_number = models.IntegerField(null=True, blank=True)
+    index = models.IntegerField(null=True, blank=True, help_text="Episode number")
+    duration = models.IntegerField(default=0, help_text="Duration in milliseconds")
+    content_rating = models.CharField(max_length=10, blank=True)
+    rating = models.FloatField(null=True, blank=True)
+    originally_available_at = models.DateField(null=True, blank=True)
+    view_count = models.IntegerField(default=0)
+
+    class Meta(CatalogItem.Meta):
+        ordering = ["season_number", "index"]
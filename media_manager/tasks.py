@@ -1,116 +1,557 @@
 # media_manager/tasks.py
 
+import asyncio
 import logging
-from typing import Dict, List
+import uuid
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
-from celery import shared_task
+from celery import chord, shared_task
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.db import transaction
 from django.utils import timezone
 
-from media_manager.utils import MovieManager
+from media_manager.utils import CatalogManager, MovieManager, SyncProgress
+from plex_auth.models import PlexServerConnection
+from plex_auth.utils.async_plex_manager import AsyncPlexManager
 from plex_auth.utils.exceptions import PlexManagerError
+from plex_auth.utils.http_session import get_pool_stats
+from plex_auth.utils.locks import DistributedLock
+from plex_auth.utils.task_dedup import keep_inflight, release_inflight
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
+FANOUT_STATUS_KEY = "library_sync_fanout_{}"
+FANOUT_STATUS_TTL = 60 * 60 * 24  # seconds
+# Live library pages embed this counter in their cache keys; it outlives
+# their TTL, and if it expires anyway pages are only reloaded early
+LIBRARY_GENERATION_KEY = "library_generation_{}_{}"
+LIBRARY_GENERATION_TTL = 60 * 60 * 24  # seconds
+
+
+def _progress_reporter(task, server_conn, library: Dict) -> SyncProgress:
+    """
+    Build a SyncProgress that publishes to the task's result as PROGRESS.
+
+    Args:
+        task: Bound task whose state is updated
+        server_conn: PlexServerConnection being synced
+        library: Dict with the ``key`` and optionally the ``title`` of the library
+    """
+
+    def publish(state: Dict) -> None:
+        task.update_state(
+            state="PROGRESS",
+            meta={
+                "server_name": server_conn.name,
+                "library_key": library["key"],
+                "library_name": library.get("title"),
+                **state,
+            },
+        )
+
+    return SyncProgress(publish)
+
+
+def _sync_library(
+    server_conn,
+    library_key: str,
+    full: bool,
+    sync: Callable[..., Dict],
+    progress: Optional[SyncProgress] = None,
+) -> Dict:
+    """
+    Sync one library while holding its lock.
+
+    Args:
+        sync: MovieManager.sync_movies_from_library or CatalogManager.sync_library
+
+    Returns:
+        dict: Sync counts, or a ``skipped`` status if the library is busy
+
+    Raises:
+        PlexManagerError: If the library could not be synced
+    """
+    # One sync per library across all workers; the heartbeat keeps the lock
+    # alive however long a large library takes
+    lock = DistributedLock(
+        f"library_sync_{server_conn.machine_identifier}_{library_key}"
+    )
+    if not lock.acquire(heartbeat=True):
+        logger.warning(f"Sync already in progress for library {library_key}")
+        return {"status": "skipped", "message": "Sync already in progress"}
+
+    # Stop between batches once the heartbeat loses the lock, since another
+    # worker may already be syncing the same library
+    progress = progress or SyncProgress()
+    progress.abort_check = lock.ensure_held
+
+    try:
+        # Commits chunk by chunk, so an interrupted sync keeps its progress
+        result = sync(server_conn, library_key, full=full, progress=progress)
+    finally:
+        lock.release()
+
+    logger.info(
+        f"Sync completed - Added: {result['added']}, "
+        f"Updated: {result['updated']}, Unchanged: {result['unchanged']}, "
+        f"Total: {result['total']}"
+    )
+    logger.debug(f"HTTP pool stats: {get_pool_stats()}")
+
+    return {
+        "status": "success",
+        "server_name": server_conn.name,
+        "library_key": library_key,
+        **result,
+    }
+
+
 @shared_task(bind=True, max_retries=3)
-def sync_movie_library(self, user_id: int, server_id: str, library_key: str) -> Dict:
+def sync_movie_library(
+    self, user_id: int, server_id: str, library_key: str, full: bool = False
+) -> Dict:
     """
     Sync movies from a specific Plex library.
     Uses server_id (machine_identifier) and library_key to identify the library.
+    Only changed movies are fetched unless ``full`` forces a complete resync.
     """
     logger.info(
         f"Starting movie sync for user {user_id}, server {server_id}, library {library_key}"
     )
 
-    # Create lock key for this specific library
-    lock_id = f"movie_sync_{server_id}_{library_key}"
+    try:
+        user = User.objects.get(id=user_id)
+        server_conn = user.plex_servers.get(machine_identifier=server_id)
+
+        return _sync_library(
+            server_conn,
+            library_key,
+            full,
+            MovieManager(user.plex_token).sync_movies_from_library,
+            progress=_progress_reporter(self, server_conn, {"key": library_key}),
+        )
+
+    except PlexManagerError as e:
+        logger.error(f"Plex error during movie sync: {str(e)}")
+        retry_in = (2**self.request.retries) * 60  # 1min, 2min, 4min
+        self.retry(exc=e, countdown=retry_in)
+
+    except Exception as e:
+        logger.exception(f"Error syncing movies for library {library_key}")
+        return {"status": "error", "message": str(e)}
+
+
+@shared_task(bind=True, max_retries=3)
+def sync_catalog_library(
+    self, user_id: int, server_id: str, library_key: str, full: bool = False
+) -> Dict:
+    """
+    Sync shows, seasons and episodes or artists, albums and tracks from a
+    specific Plex library.
+    Only changed items are fetched unless ``full`` forces a complete resync.
+    """
+    logger.info(
+        f"Starting catalog sync for user {user_id}, server {server_id}, library {library_key}"
+    )
 
     try:
-        # Check if sync is already running for this library
-        if cache.get(lock_id):
-            logger.warning(f"Sync already in progress for library {library_key}")
-            return {"status": "skipped", "message": "Sync already in progress"}
+        user = User.objects.get(id=user_id)
+        server_conn = user.plex_servers.get(machine_identifier=server_id)
+
+        return _sync_library(
+            server_conn,
+            library_key,
+            full,
+            CatalogManager(user.plex_token).sync_library,
+            progress=_progress_reporter(self, server_conn, {"key": library_key}),
+        )
+
+    except PlexManagerError as e:
+        logger.error(f"Plex error during catalog sync: {str(e)}")
+        retry_in = (2**self.request.retries) * 60  # 1min, 2min, 4min
+        self.retry(exc=e, countdown=retry_in)
+
+    except Exception as e:
+        logger.exception(f"Error syncing catalog for library {library_key}")
+        return {"status": "error", "message": str(e)}
 
-        # Set lock for 2 hours (large libraries might take time)
-        cache.set(lock_id, True, timeout=7200)
 
+@shared_task(bind=True)
+def sync_library_lane(
+    self, user_id: int, server_id: str, libraries: List[Dict], full: bool = False
+) -> List[Dict]:
+    """
+    Sync several libraries of one server one after another.
+
+    A lane is the unit of parallelism in a fan-out; the number of lanes per
+    server caps how many syncs hit one PMS at once. Failures are reported per
+    library rather than raised so the fan-out callback always runs.
+
+    Args:
+        user_id: ID of the user owning the server
+        server_id: machine_identifier of the server
+        libraries: Dicts with the ``key``, ``title`` and ``type`` of each library
+        full: Whether to force complete resyncs
+
+    Returns:
+        List[Dict]: One sync result per library
+    """
+    results = []
+
+    try:
         user = User.objects.get(id=user_id)
         server_conn = user.plex_servers.get(machine_identifier=server_id)
+    except Exception as e:
+        logger.error(f"Cannot start sync lane for server {server_id}: {str(e)}")
+        return [
+            {
+                "status": "error",
+                "server_id": server_id,
+                "library_key": library["key"],
+                "library_name": library["title"],
+                "message": str(e),
+            }
+            for library in libraries
+        ]
 
-        movie_manager = MovieManager(user.plex_token)
+    # One set of managers per lane, so the account and server connection
+    # are reused
+    movie_manager = MovieManager(user.plex_token)
+    catalog_manager = CatalogManager(user.plex_token)
 
-        with transaction.atomic():
-            result = movie_manager.sync_movies_from_library(server_conn, library_key)
+    for library in libraries:
+        logger.info(
+            f"Starting {library['type']} sync for server {server_conn.name}, "
+            f"library {library['key']}"
+        )
+        if library["type"] == "movie":
+            sync = movie_manager.sync_movies_from_library
+        else:
+            sync = catalog_manager.sync_library
 
-            logger.info(
-                f"Sync completed - Added: {result['added']}, "
-                f"Updated: {result['updated']}, Total: {result['total']}"
+        try:
+            result = _sync_library(
+                server_conn,
+                library["key"],
+                full,
+                sync,
+                progress=_progress_reporter(self, server_conn, library),
             )
-
-            return {
-                "status": "success",
+        except Exception as e:
+            logger.error(
+                f"Error syncing library {library['key']} on {server_conn.name}: {str(e)}"
+            )
+            result = {
+                "status": "error",
                 "server_name": server_conn.name,
-                "library_key": library_key,
-                **result,
+                "library_key": library["key"],
+                "message": str(e),
             }
 
+        result["library_name"] = library["title"]
+        results.append(result)
+
+    return results
+
+
+@shared_task
+def aggregate_library_sync(
+    lane_results: List[List[Dict]],
+    fanout_id: str,
+    errors: Optional[List[Dict]] = None,
+) -> Dict:
+    """
+    Combine the results of every lane in a fan-out into one summary.
+
+    The summary replaces the fan-out's status entry so the sync page can
+    poll it.
+
+    Args:
+        lane_results: Per-library results of each lane
+        fanout_id: ID of the fan-out, used as its status key
+        errors: Errors raised before the lanes were queued
+
+    Returns:
+        dict: Totals and errors across all libraries
+    """
+    libraries = [result for lane in lane_results for result in lane or []]
+    summary = {
+        "status": "completed",
+        "fanout_id": fanout_id,
+        "libraries": libraries,
+        "added": 0,
+        "updated": 0,
+        "unchanged": 0,
+        "removed": 0,
+        "total": 0,
+        "skipped": 0,
+        "errors": list(errors or []),
+    }
+
+    for result in libraries:
+        if result.get("status") == "success":
+            for field in ("added", "updated", "unchanged", "removed", "total"):
+                summary[field] += result.get(field, 0)
+        elif result.get("status") == "skipped":
+            summary["skipped"] += 1
+        else:
+            summary["errors"].append(
+                {
+                    "server_name": result.get("server_name", result.get("server_id")),
+                    "library_name": result.get("library_name"),
+                    "message": result.get("message", "Unknown error"),
+                }
+            )
+
+    logger.info(
+        f"Library sync fan-out {fanout_id} completed - Added: {summary['added']}, "
+        f"Updated: {summary['updated']}, Removed: {summary['removed']}, "
+        f"Errors: {len(summary['errors'])}"
+    )
+    cache.set(FANOUT_STATUS_KEY.format(fanout_id), summary, FANOUT_STATUS_TTL)
+    release_inflight(fanout_id)
+    return summary
+
+
+@shared_task
+def fail_library_sync_fanout(request, exc, traceback, fanout_id: str) -> None:
+    """
+    Mark a fan-out as failed when one of its lanes or its callback crashed.
+
+    Runs as the chord callback's error handler: once a lane fails the
+    callback never runs, so the status entry would otherwise stay
+    ``running`` until it expires.
+
+    Args:
+        request: Request of the failed task
+        exc: Exception the task failed with
+        traceback: Traceback of the failure, if any
+        fanout_id: ID of the fan-out, used as its status key
+    """
+    logger.error(f"Library sync fan-out {fanout_id} failed: {str(exc)}")
+    status = get_fanout_status(fanout_id) or {"fanout_id": fanout_id, "errors": []}
+    status.update(status="failed", error=str(exc))
+    cache.set(FANOUT_STATUS_KEY.format(fanout_id), status, FANOUT_STATUS_TTL)
+    release_inflight(fanout_id)
+
+
+def get_fanout_status(fanout_id: str) -> Optional[Dict]:
+    """Return the status entry of a library sync fan-out, if there is one."""
+    return cache.get(FANOUT_STATUS_KEY.format(fanout_id))
+
+
+def get_library_generation(server_conn, library_key: str) -> int:
+    """Return the generation live pages of a library are cached under."""
+    key = LIBRARY_GENERATION_KEY.format(server_conn.machine_identifier, library_key)
+    return cache.get(key, 0)
+
+
+def invalidate_library_caches(server_conn, library_key: str) -> None:
+    """Drop cached pages that show a library's contents."""
+    mid = server_conn.machine_identifier
+    cache.delete_many(
+        [
+            f"recent_{mid}",
+            f"deck_{mid}",
+            f"server_libraries_{mid}",
+            f"media_data_{server_conn.owner_id}",
+        ]
+    )
+
+    # Live pages are cached per user and page, so move every one of them to
+    # a new key at once rather than deleting them
+    key = LIBRARY_GENERATION_KEY.format(mid, library_key)
+    if not cache.add(key, 1, timeout=LIBRARY_GENERATION_TTL):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Expired between the two calls
+            cache.set(key, 1, timeout=LIBRARY_GENERATION_TTL)
+
+
+@shared_task(bind=True, max_retries=3)
+def sync_movie_item(self, server_id: str, library_key: str, rating_key: str) -> Dict:
+    """
+    Upsert one movie reported by a Plex webhook and refresh related caches.
+
+    Args:
+        server_id: machine_identifier of the server
+        library_key: Library section key of the movie
+        rating_key: Rating key of the movie
+    """
+    try:
+        server_conn = PlexServerConnection.objects.select_related("owner").get(
+            machine_identifier=server_id
+        )
+        movie_manager = MovieManager(server_conn.owner.plex_token)
+
+        outcome = movie_manager.sync_movie_item(server_conn, library_key, rating_key)
+        invalidate_library_caches(server_conn, library_key)
+
+        logger.info(
+            f"Webhook sync of movie {rating_key} on {server_conn.name}: {outcome}"
+        )
+        return {"status": "success", "rating_key": rating_key, "result": outcome}
+
     except PlexManagerError as e:
-        logger.error(f"Plex error during movie sync: {str(e)}")
-        retry_in = (2**self.request.retries) * 60  # 1min, 2min, 4min
+        logger.error(f"Plex error syncing movie {rating_key}: {str(e)}")
+        retry_in = (2**self.request.retries) * 30  # 30s, 1min, 2min
         self.retry(exc=e, countdown=retry_in)
 
     except Exception as e:
-        logger.exception(f"Error syncing movies for library {library_key}")
+        logger.exception(f"Error syncing movie {rating_key}")
         return {"status": "error", "message": str(e)}
 
-    finally:
-        cache.delete(lock_id)
 
+async def _fetch_libraries_for_servers(
+    plex_token: str, server_conns: List
+) -> Dict[str, Any]:
+    """Fetch libraries for several servers at once, keyed by machine_identifier."""
+    async with AsyncPlexManager(plex_token) as manager:
+        return await manager.for_servers(server_conns, manager.get_libraries)
 
-@shared_task(bind=True)
-def sync_all_movie_libraries(self, user_id: int) -> List[Dict]:
+
+def _split_into_lanes(libraries: List[Dict], lanes: int) -> List[List[Dict]]:
+    """Deal libraries round-robin into at most ``lanes`` non-empty lanes."""
+    lanes = max(1, min(lanes, len(libraries)))
+    return [libraries[i::lanes] for i in range(lanes)]
+
+
+def _fan_out_library_syncs(
+    task, user_id: Optional[int], full: bool, library_types: Iterable[str]
+) -> Dict:
     """
-    Sync all movie libraries for a user.
-    Identifies movie libraries and triggers individual sync tasks for each.
+    Queue a chord of per-server sync lanes for every matching library.
+
+    Libraries are discovered on all servers at once. At most
+    ``MOVIE_SYNC_MAX_PER_SERVER`` lanes run against any one PMS, and a final
+    callback aggregates the counts into a single status entry keyed by the
+    calling task's ID. If a lane crashes the entry is marked failed instead.
+
+    Args:
+        task: Bound task starting the fan-out
+        user_id: ID of the user to sync, or None for every user
+        full: Whether to force complete resyncs
+        library_types: Plex library types to sync, e.g. ("movie",)
+
+    Returns:
+        dict: The fan-out's initial status entry
     """
-    logger.info(f"Starting sync of all movie libraries for user {user_id}")
+    fanout_id = task.request.id or str(uuid.uuid4())
+    lanes_per_server = getattr(settings, "MOVIE_SYNC_MAX_PER_SERVER", 2)
+    logger.info(
+        f"Starting sync of all {'/'.join(library_types)} libraries for "
+        f"{f'user {user_id}' if user_id else 'all users'}"
+    )
 
-    try:
-        user = User.objects.get(id=user_id)
-        results = []
-
-        for server_conn in user.plex_servers.all():
-            try:
-                movie_manager = MovieManager(user.plex_token)
-                libraries = movie_manager.plex_manager.get_libraries(server_conn)
-
-                # Filter for movie libraries
-                movie_libraries = [lib for lib in libraries if lib["type"] == "movie"]
-
-                for library in movie_libraries:
-                    # Trigger sync task for each movie library
-                    task = sync_movie_library.delay(
-                        user_id, server_conn.machine_identifier, library["key"]
-                    )
-
-                    results.append(
-                        {
-                            "server_name": server_conn.name,
-                            "library_name": library["title"],
-                            "task_id": task.id,
-                        }
-                    )
-
-            except Exception as e:
-                logger.error(f"Error processing server {server_conn.name}: {str(e)}")
+    users = User.objects.filter(plex_servers__isnull=False).distinct()
+    if user_id is not None:
+        users = users.filter(id=user_id)
+
+    lanes = []
+    libraries_queued = []
+    errors = []
+
+    for user in users:
+        server_conns = list(user.plex_servers.all())
+
+        try:
+            # Query every server's libraries concurrently
+            libraries_by_server = asyncio.run(
+                _fetch_libraries_for_servers(user.plex_token, server_conns)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching libraries for user {user.id}: {str(e)}")
+            errors.append({"server_name": None, "message": str(e)})
+            continue
+
+        for server_conn in server_conns:
+            libraries = libraries_by_server.get(server_conn.machine_identifier, [])
+            if isinstance(libraries, Exception):
+                logger.error(
+                    f"Error processing server {server_conn.name}: {str(libraries)}"
+                )
+                errors.append(
+                    {"server_name": server_conn.name, "message": str(libraries)}
+                )
                 continue
 
-        return results
+            matching = [
+                {"key": lib["key"], "title": lib["title"], "type": lib["type"]}
+                for lib in libraries
+                if lib["type"] in library_types
+            ]
+            if not matching:
+                continue
 
-    except Exception as e:
-        logger.exception(f"Error in sync_all_movie_libraries for user {user_id}")
-        return []
+            for lane in _split_into_lanes(matching, lanes_per_server):
+                # Lane IDs are fixed up front so their progress can be polled
+                lanes.append(
+                    sync_library_lane.s(
+                        user.id, server_conn.machine_identifier, lane, full
+                    ).set(task_id=str(uuid.uuid4()))
+                )
+
+            libraries_queued.extend(
+                {"server_name": server_conn.name, "library_name": lib["title"]}
+                for lib in matching
+            )
+
+    status = {
+        "status": "running",
+        "fanout_id": fanout_id,
+        "libraries": libraries_queued,
+        "lanes": len(lanes),
+        "lane_ids": [lane.id for lane in lanes],
+        "errors": errors,
+    }
+
+    if not lanes:
+        status["status"] = "completed"
+        cache.set(FANOUT_STATUS_KEY.format(fanout_id), status, FANOUT_STATUS_TTL)
+        return status
+
+    cache.set(FANOUT_STATUS_KEY.format(fanout_id), status, FANOUT_STATUS_TTL)
+    # Repeated triggers keep attaching to this fan-out until its callback
+    # has run, not just until the chord is queued
+    keep_inflight(fanout_id)
+    chord(lanes)(
+        aggregate_library_sync.s(fanout_id, errors).on_error(
+            fail_library_sync_fanout.s(fanout_id)
+        )
+    )
+
+    logger.info(
+        f"Queued {len(libraries_queued)} libraries in {len(lanes)} lanes "
+        f"for fan-out {fanout_id}"
+    )
+    return status
+
+
+@shared_task(bind=True)
+def sync_all_movie_libraries(
+    self, user_id: Optional[int] = None, full: bool = False
+) -> Dict:
+    """
+    Sync all movie libraries for a user, or for every user if none is given.
+
+    The libraries are synced in parallel through a chord of per-server lanes;
+    poll get_fanout_status with this task's ID for the aggregated result.
+    """
+    return _fan_out_library_syncs(self, user_id, full, ("movie",))
+
+
+@shared_task(bind=True)
+def sync_all_catalog_libraries(
+    self, user_id: Optional[int] = None, full: bool = False
+) -> Dict:
+    """
+    Sync all show and music libraries for a user, or for every user if none
+    is given.
+
+    Works like sync_all_movie_libraries.
+    """
+    return _fan_out_library_syncs(self, user_id, full, ("show", "artist"))
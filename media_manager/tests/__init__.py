@@ -0,0 +1 @@
+# media_manager/tests/__init__.py
@@ -0,0 +1,183 @@
+# media_manager/tests/fake_plex.py
+
+from typing import Dict, List, Optional
+from unittest.mock import MagicMock, patch
+from xml.etree import ElementTree
+
+from plexapi.base import PlexObject
+from plexapi.exceptions import NotFound
+from plexapi.video import Episode as PlexEpisode
+from plexapi.video import Movie as PlexMovie
+from plexapi.video import Season as PlexSeason
+from plexapi.video import Show as PlexShow
+
+from plex_auth.models import PlexAccount, PlexServerConnection
+
+# PMS search types by item type, and the plexapi class of each
+PLEX_TYPES = {1: "movie", 2: "show", 3: "season", 4: "episode"}
+PLEX_CLASSES = {
+    "movie": PlexMovie,
+    "show": PlexShow,
+    "season": PlexSeason,
+    "episode": PlexEpisode,
+}
+
+LISTING_XML = (
+    '<Video ratingKey="{key}" type="{type}" title="{title}" year="{year}" '
+    'duration="{duration}" addedAt="{added_at}" updatedAt="{updated_at}" '
+    'viewCount="{view_count}" thumb="/library/metadata/{key}/thumb/1"{parents}>'
+    '<Genre tag="{genre}" /></Video>'
+)
+
+DETAIL_XML = (
+    '<Video ratingKey="{key}" type="{type}" title="{title}" year="{year}" '
+    'duration="{duration}" addedAt="{added_at}" updatedAt="{updated_at}" '
+    'viewCount="{view_count}" thumb="/library/metadata/{key}/thumb/1">'
+    '<Media videoResolution="1080" height="1080" />'
+    '<Genre tag="{genre}" /><Genre tag="Drama" />'
+    '<Director tag="Director {key}" /><Role tag="Actor {key}" /></Video>'
+)
+
+
+def create_server_conn(machine_identifier: str = "machine-1"):
+    """Create a user with one server connection to sync into."""
+    user = PlexAccount.objects.create(
+        username=f"user-{machine_identifier}",
+        plex_username=f"user-{machine_identifier}",
+        plex_account_id=f"account-{machine_identifier}",
+        plex_token="token",
+    )
+    return PlexServerConnection.objects.create(
+        owner=user,
+        name="Test Server",
+        url="http://pms:32400",
+        machine_identifier=machine_identifier,
+        token="token",
+        version="1.40.0",
+    )
+
+
+class FakeLibrary:
+    """
+    In-memory library section standing in for a PMS.
+
+    Patched into a sync manager's PlexManager so syncs page through
+    ``items`` exactly as they would through a real section, sorted by
+    addedAt and filtered by item type and the delta watermarks.
+    """
+
+    def __init__(self, key: str = "1", section_type: str = "movie"):
+        self.key = key
+        self.items: Dict[str, Dict] = {}
+        self.detail_requests: List[List[int]] = []
+        # Called with the offset of every page, e.g. to change items mid-sync
+        self.on_page = None
+
+        self.server = MagicMock(
+            _baseurl="http://pms:32400", machineIdentifier="machine-1"
+        )
+        self.server.fetchItems.side_effect = self._fetch_metadata
+
+        self.section = MagicMock(key=key, type=section_type)
+        self.section.title = f"{section_type.title()} Library"
+        self.section.totalViewSize.side_effect = lambda libtype=section_type: len(
+            self._sorted(libtype)
+        )
+        self.server.library.sections.return_value = [self.section]
+
+    def add(
+        self,
+        key: int,
+        added_at: int,
+        updated_at: Optional[int] = None,
+        item_type: str = "movie",
+        parent: Optional[int] = None,
+        grandparent: Optional[int] = None,
+        **attrs,
+    ) -> None:
+        parents = ""
+        if parent:
+            parents += f' parentRatingKey="{parent}"'
+        if grandparent:
+            parents += f' grandparentRatingKey="{grandparent}"'
+        self.items[str(key)] = {
+            "key": key,
+            "type": item_type,
+            "title": attrs.get("title", f"Movie {key}"),
+            "year": attrs.get("year", 2000),
+            "duration": attrs.get("duration", 7200000),
+            "added_at": added_at,
+            "updated_at": updated_at or added_at,
+            "view_count": attrs.get("view_count", 0),
+            "genre": attrs.get("genre", "Crime"),
+            "parents": parents,
+        }
+
+    def update(self, key: int, updated_at: int, **attrs) -> None:
+        self.items[str(key)].update(updated_at=updated_at, **attrs)
+
+    def remove(self, key: int) -> None:
+        del self.items[str(key)]
+
+    def patch(self, manager, testcase) -> None:
+        """Point a manager's PlexManager at this library for one test."""
+        for name, kwargs in (
+            ("_get_server", {"return_value": self.server}),
+            ("iter_library_pages", {"side_effect": self.iter_library_pages}),
+            ("get_library_rating_keys", {"side_effect": self.get_library_rating_keys}),
+        ):
+            patcher = patch.object(manager.plex_manager, name, **kwargs)
+            patcher.start()
+            testcase.addCleanup(patcher.stop)
+
+    def _element(self, template: str, item: Dict) -> PlexObject:
+        data = ElementTree.fromstring(template.format(**item))
+        return PLEX_CLASSES[item["type"]](self.server, data, initpath="/library")
+
+    def _sorted(self, item_type: str = "movie") -> List[Dict]:
+        return sorted(
+            (item for item in self.items.values() if item["type"] == item_type),
+            key=lambda i: (i["added_at"], i["key"]),
+        )
+
+    def iter_library_pages(
+        self,
+        server_conn,
+        library_key: str,
+        page_size: int = 500,
+        libtype: int = 1,
+        sort: str = "addedAt:asc",
+        filters: Optional[Dict] = None,
+        start: int = 0,
+    ):
+        while True:
+            if self.on_page:
+                self.on_page(start)
+            items = self._sorted(PLEX_TYPES[libtype])
+            for field, value in (filters or {}).items():
+                name = "updated_at" if field.startswith("updatedAt") else "added_at"
+                items = [item for item in items if item[name] > value]
+
+            page = items[start : start + page_size]
+            if not page:
+                return
+            yield [self._element(LISTING_XML, item) for item in page]
+            start += len(page)
+            if start >= len(items):
+                return
+
+    def get_library_rating_keys(
+        self, server_conn, library_key: str, libtype: int = 1, page_size: int = 5000
+    ) -> List[str]:
+        return [str(item["key"]) for item in self._sorted(PLEX_TYPES[libtype])]
+
+    def _fetch_metadata(self, keys, container_size=None):
+        self.detail_requests.append(list(keys))
+        found = [
+            self._element(DETAIL_XML, self.items[str(key)])
+            for key in keys
+            if str(key) in self.items
+        ]
+        if not found:
+            raise NotFound("No items")
+        return found
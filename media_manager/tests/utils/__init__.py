@@ -0,0 +1,13 @@
+# media_manager/tests/utils/__init__.py
+
+from .test_catalog_manager import TestCatalogManager
+from .test_movie_manager import TestMovieManager
+from .test_sync_helpers import TestDeleteMissingItems, TestSyncProgress, TestUpsertItems
+
+__all__ = [
+    "TestCatalogManager",
+    "TestDeleteMissingItems",
+    "TestMovieManager",
+    "TestSyncProgress",
+    "TestUpsertItems",
+]
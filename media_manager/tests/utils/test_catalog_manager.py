@@ -0,0 +1,103 @@
+# media_manager/tests/utils/test_catalog_manager.py
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from media_manager.models import Episode, LibrarySyncCursor, Season, Show
+from media_manager.models.fingerprint import FingerprintMixin
+from media_manager.tests.fake_plex import FakeLibrary, create_server_conn
+from media_manager.utils import CatalogManager
+
+T0 = 1700000000
+
+
+@override_settings(MOVIE_SYNC_BATCH_SIZE=2)
+class TestCatalogManager(TestCase):
+    """Test syncing a show library against a fake PMS"""
+
+    def setUp(self):
+        cache.clear()
+        self.server_conn = create_server_conn()
+        self.library = FakeLibrary("2", section_type="show")
+        self.library.add(1, added_at=T0 + 1, item_type="show")
+        self.library.add(2, added_at=T0 + 2, item_type="season", parent=1)
+        for key in (3, 4, 5):
+            self.library.add(
+                key, added_at=T0 + key, item_type="episode", parent=2, grandparent=1
+            )
+        self.manager = CatalogManager("token")
+        self.library.patch(self.manager, self)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _sync(self, full: bool = False):
+        return self.manager.sync_library(self.server_conn, "2", full=full)
+
+    def _episode_keys(self):
+        return sorted(Episode.objects.values_list("plex_key", flat=True), key=int)
+
+    def test_first_sync_stores_every_level(self):
+        """Test that shows, seasons and episodes are linked to their parents"""
+        result = self._sync()
+
+        self.assertTrue(result["full"])
+        self.assertEqual(result["added"], 5)
+        self.assertEqual(self._episode_keys(), ["3", "4", "5"])
+        season = Season.objects.get()
+        self.assertEqual(season.show, Show.objects.get())
+        self.assertEqual(season.episodes.count(), 3)
+
+    def test_models_share_fingerprint(self):
+        """Test that catalog rows hash their own fingerprint fields"""
+        self._sync()
+
+        show = Show.objects.get()
+        self.assertIsInstance(show, FingerprintMixin)
+        self.assertEqual(show.fingerprint, show.compute_fingerprint())
+
+    def test_delta_sync_removes_deleted_episodes(self):
+        """Test that a delta sync reconciles levels whose counts changed"""
+        self._sync()
+        self.library.remove(4)
+
+        result = self._sync()
+
+        self.assertFalse(result["full"])
+        self.assertEqual(result["episode"]["removed"], 1)
+        self.assertEqual(result["show"]["removed"], 0)
+        self.assertEqual(self._episode_keys(), ["3", "5"])
+
+    def test_delta_sync_skips_listing_when_counts_match(self):
+        """Test that no keys are listed while every level's count agrees"""
+        self._sync()
+        self.manager.plex_manager.get_library_rating_keys.reset_mock()
+
+        result = self._sync()
+
+        self.assertEqual(result["removed"], 0)
+        self.manager.plex_manager.get_library_rating_keys.assert_not_called()
+
+    def test_orphaned_episode_holds_watermark(self):
+        """Test that an item skipped for a missing parent is listed again"""
+        self._sync()
+        # Season 7 isn't listed yet when its episode is
+        self.library.add(
+            8, added_at=T0 + 10, item_type="episode", parent=7, grandparent=1
+        )
+        self.library.add(
+            9, added_at=T0 + 11, item_type="episode", parent=2, grandparent=1
+        )
+
+        self._sync()
+
+        cursor = LibrarySyncCursor.objects.get()
+        self.assertEqual(cursor.last_added_at.timestamp(), T0 + 10)
+        self.assertEqual(self._episode_keys(), ["3", "4", "5", "9"])
+
+        self.library.add(7, added_at=T0 + 12, item_type="season", parent=1)
+        self._sync()
+
+        self.assertEqual(self._episode_keys(), ["3", "4", "5", "8", "9"])
+        cursor.refresh_from_db()
+        self.assertEqual(cursor.last_added_at.timestamp(), T0 + 12)
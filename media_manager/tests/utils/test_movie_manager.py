@@ -0,0 +1,211 @@
+# media_manager/tests/utils/test_movie_manager.py
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from media_manager.models import LibrarySyncCursor, Movie
+from media_manager.tests.fake_plex import FakeLibrary, create_server_conn
+from media_manager.utils import MovieManager, SyncProgress
+from plex_auth.utils.exceptions import LockLostError
+from plex_auth.utils.locks import DistributedLock
+
+
+@override_settings(MOVIE_SYNC_BATCH_SIZE=2)
+class TestMovieManager(TestCase):
+    """Test syncing a movie library against a fake PMS"""
+
+    def setUp(self):
+        cache.clear()
+        self.server_conn = create_server_conn()
+        self.library = FakeLibrary()
+        for key in range(1, 6):
+            self.library.add(key, added_at=1700000000 + key)
+        self.manager = MovieManager("token")
+        self.library.patch(self.manager, self)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _sync(self, full: bool = False):
+        return self.manager.sync_movies_from_library(self.server_conn, "1", full=full)
+
+    def _stored_keys(self):
+        return sorted(Movie.objects.values_list("plex_key", flat=True), key=int)
+
+    def test_first_sync_adds_every_movie(self):
+        """Test that the first sync stores the whole library across pages"""
+        result = self._sync()
+
+        self.assertEqual(
+            (result["added"], result["updated"], result["total"]), (5, 0, 5)
+        )
+        self.assertEqual(self._stored_keys(), ["1", "2", "3", "4", "5"])
+        movie = Movie.objects.get(plex_key="1")
+        self.assertEqual(movie.genres, ["Crime", "Drama"])
+        self.assertEqual(movie.video_resolution, "1080")
+
+    def test_sync_advances_watermarks(self):
+        """Test that the cursor records the newest added and updated times"""
+        self.library.update(2, updated_at=1700000100)
+
+        result = self._sync()
+
+        cursor = LibrarySyncCursor.objects.get()
+        self.assertTrue(result["full"])
+        self.assertEqual(cursor.last_added_at.timestamp(), 1700000005)
+        self.assertEqual(cursor.last_updated_at.timestamp(), 1700000100)
+        self.assertIsNotNone(cursor.last_full_sync_at)
+        self.assertFalse(cursor.has_checkpoint)
+
+    def test_delta_sync_only_lists_changed_movies(self):
+        """Test that a delta sync only pages through items past the watermarks"""
+        self._sync()
+        self.library.update(2, updated_at=1700000100, title="Remastered")
+        self.library.add(6, added_at=1700000200)
+        self.library.detail_requests.clear()
+
+        result = self._sync()
+
+        # Movie 5 sits on the watermark and is re-listed by the overlap
+        self.assertFalse(result["full"])
+        self.assertEqual(
+            (result["added"], result["updated"], result["unchanged"]), (1, 1, 1)
+        )
+        self.assertEqual(Movie.objects.get(plex_key="2").title, "Remastered")
+        fetched = {key for batch in self.library.detail_requests for key in batch}
+        self.assertFalse(fetched & {1, 3, 4})
+        cursor = LibrarySyncCursor.objects.get()
+        self.assertEqual(cursor.last_added_at.timestamp(), 1700000200)
+
+    def test_watermarks_never_move_backwards(self):
+        """Test that a delta sync that finds nothing keeps the previous marks"""
+        self._sync()
+        before = LibrarySyncCursor.objects.get()
+
+        result = self._sync()
+
+        after = LibrarySyncCursor.objects.get()
+        self.assertEqual((result["added"], result["updated"]), (0, 0))
+        self.assertEqual(after.last_added_at, before.last_added_at)
+        self.assertEqual(after.last_updated_at, before.last_updated_at)
+
+    def test_full_resync_leaves_unchanged_movies_alone(self):
+        """Test that re-syncing an unchanged library rewrites no rows"""
+        self._sync()
+        before = dict(Movie.objects.values_list("plex_key", "modified_at"))
+        self.library.detail_requests.clear()
+
+        result = self._sync(full=True)
+
+        self.assertEqual(
+            (result["added"], result["updated"], result["unchanged"]), (0, 0, 5)
+        )
+        after = dict(Movie.objects.values_list("plex_key", "modified_at"))
+        self.assertEqual(after, before)
+        self.assertEqual(self.library.detail_requests, [])
+
+    def test_only_changed_movies_fetch_details(self):
+        """Test that details are only fetched for movies whose listing changed"""
+        self._sync()
+        self.library.update(4, updated_at=1700000004, view_count=3)
+        self.library.detail_requests.clear()
+
+        result = self._sync(full=True)
+
+        self.assertEqual(
+            (result["added"], result["updated"], result["unchanged"]), (0, 1, 4)
+        )
+        self.assertEqual(self.library.detail_requests, [[4]])
+        self.assertEqual(Movie.objects.get(plex_key="4").view_count, 3)
+        self.assertEqual(Movie.objects.get(plex_key="4").genres, ["Crime", "Drama"])
+
+    def test_interrupted_full_sync_resumes_from_checkpoint(self):
+        """Test that a retry continues after the last committed page"""
+
+        def fail_on_third_page(offset):
+            if offset == 4:
+                raise ConnectionError("PMS went away")
+
+        self.library.on_page = fail_on_third_page
+        with self.assertRaises(ConnectionError):
+            self._sync(full=True)
+
+        cursor = LibrarySyncCursor.objects.get()
+        self.assertTrue(cursor.checkpoint_full)
+        self.assertEqual(cursor.checkpoint_offset, 4)
+        self.assertEqual(self._stored_keys(), ["1", "2", "3", "4"])
+
+        self.library.on_page = None
+        self.library.detail_requests.clear()
+        result = self._sync()
+
+        self.assertTrue(result["full"])
+        self.assertEqual((result["added"], result["total"]), (1, 1))
+        self.assertEqual(self.library.detail_requests, [[5]])
+        self.assertEqual(self._stored_keys(), ["1", "2", "3", "4", "5"])
+        cursor.refresh_from_db()
+        self.assertFalse(cursor.has_checkpoint)
+        self.assertIsNotNone(cursor.last_full_sync_at)
+
+    def test_failed_abort_check_stops_between_batches(self):
+        """Test that a sync stops writing once its lock is lost"""
+        self._sync()
+        self.library.update(5, updated_at=1700000100, title="Changed")
+        self.manager.plex_manager.get_library_rating_keys.reset_mock()
+        lock = DistributedLock("library_sync_machine-1_1", timeout=60)
+        lock.acquire()
+        self.addCleanup(lock.release)
+
+        def lose_lock_during_second_batch(offset):
+            if offset == 2:
+                lock.lost = True
+
+        self.library.on_page = lose_lock_during_second_batch
+        with self.assertRaises(LockLostError):
+            self.manager.sync_movies_from_library(
+                self.server_conn,
+                "1",
+                full=True,
+                progress=SyncProgress(abort_check=lock.ensure_held),
+            )
+
+        # The batch in flight commits, but nothing after it is written
+        self.assertEqual(Movie.objects.get(plex_key="5").title, "Movie 5")
+        self.assertEqual(LibrarySyncCursor.objects.get().checkpoint_offset, 4)
+        self.manager.plex_manager.get_library_rating_keys.assert_not_called()
+
+    def test_delta_sync_removes_deleted_movies(self):
+        """Test that a movie deleted on the PMS is removed by the next delta sync"""
+        self._sync()
+        self.library.remove(3)
+
+        result = self._sync()
+
+        self.assertEqual(result["removed"], 1)
+        self.assertEqual(self._stored_keys(), ["1", "2", "4", "5"])
+
+    def test_removal_mid_sync_keeps_shifted_movies(self):
+        """Test that a movie skipped by shifted pages isn't deleted as missing"""
+        self._sync()
+
+        def remove_first_movie(offset):
+            if offset == 2 and "1" in self.library.items:
+                self.library.remove(1)
+
+        self.library.on_page = remove_first_movie
+        result = self._sync(full=True)
+
+        # Movie 3 slid onto the finished page and was never listed
+        self.assertEqual(result["total"], 4)
+        self.assertEqual(result["removed"], 1)
+        self.assertEqual(self._stored_keys(), ["2", "3", "4", "5"])
+
+    def test_delta_sync_skips_listing_when_counts_match(self):
+        """Test that reconciling is skipped while the movie counts agree"""
+        self._sync()
+        self.manager.plex_manager.get_library_rating_keys.reset_mock()
+
+        result = self._sync()
+
+        self.assertEqual(result["removed"], 0)
+        self.manager.plex_manager.get_library_rating_keys.assert_not_called()
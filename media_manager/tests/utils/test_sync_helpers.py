@@ -0,0 +1,180 @@
+# media_manager/tests/utils/test_sync_helpers.py
+
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from media_manager.models import Movie, Season, Show
+from media_manager.tests.fake_plex import create_server_conn
+from media_manager.utils import (
+    MOVIE_SYNC_FIELDS,
+    SyncProgress,
+    delete_missing_items,
+    upsert_items,
+)
+
+ADDED_AT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_movie(server_conn, key: str, library_key: str = "1", **fields) -> Movie:
+    defaults = {
+        "title": f"Movie {key}",
+        "duration": 7200000,
+        "added_at": ADDED_AT,
+        "updated_at": ADDED_AT,
+    }
+    defaults.update(fields)
+    return Movie(server=server_conn, library_key=library_key, plex_key=key, **defaults)
+
+
+class TestDeleteMissingItems(TestCase):
+    """Test removing library rows that no longer exist on the PMS"""
+
+    def setUp(self):
+        self.server_conn = create_server_conn()
+        Movie.objects.bulk_create(
+            [make_movie(self.server_conn, key) for key in ("1", "2", "3")]
+        )
+
+    def _keys(self, **filters):
+        return sorted(
+            Movie.objects.filter(**filters).values_list("plex_key", flat=True)
+        )
+
+    def test_removes_only_missing_keys(self):
+        """Test that rows whose key is live are kept"""
+        removed = delete_missing_items(Movie, self.server_conn, "1", ["1", "3"])
+
+        self.assertEqual(removed, 1)
+        self.assertEqual(self._keys(), ["1", "3"])
+
+    def test_no_live_keys_empties_library(self):
+        """Test that an empty live listing removes the whole library"""
+        removed = delete_missing_items(Movie, self.server_conn, "1", [])
+
+        self.assertEqual(removed, 3)
+        self.assertEqual(self._keys(), [])
+
+    def test_scoped_to_library_and_server(self):
+        """Test that other libraries and servers are never touched"""
+        other_server = create_server_conn("machine-2")
+        Movie.objects.bulk_create(
+            [
+                make_movie(self.server_conn, "10", library_key="2"),
+                make_movie(other_server, "1"),
+            ]
+        )
+
+        removed = delete_missing_items(Movie, self.server_conn, "1", ["2"])
+
+        self.assertEqual(removed, 2)
+        self.assertEqual(self._keys(library_key="2"), ["10"])
+        self.assertEqual(self._keys(server=other_server), ["1"])
+
+    def test_counts_only_own_rows_when_cascading(self):
+        """Test that cascaded children aren't counted as removed parents"""
+        show = Show.objects.create(
+            server=self.server_conn,
+            library_key="5",
+            plex_key="s1",
+            title="Show",
+            added_at=ADDED_AT,
+            updated_at=ADDED_AT,
+        )
+        Season.objects.create(
+            server=self.server_conn,
+            library_key="5",
+            plex_key="s1-1",
+            title="Season 1",
+            show=show,
+            added_at=ADDED_AT,
+            updated_at=ADDED_AT,
+        )
+
+        removed = delete_missing_items(Show, self.server_conn, "5", [])
+
+        self.assertEqual(removed, 1)
+        self.assertFalse(Season.objects.exists())
+
+
+class TestUpsertItems(TestCase):
+    """Test the single-statement bulk upsert used by every sync"""
+
+    def setUp(self):
+        self.server_conn = create_server_conn()
+
+    def _upsert(self, movies):
+        return upsert_items(Movie, self.server_conn, movies, MOVIE_SYNC_FIELDS)
+
+    def test_counts_added_updated_and_unchanged(self):
+        """Test that new, changed and identical rows are told apart"""
+        self._upsert([make_movie(self.server_conn, key) for key in ("1", "2")])
+
+        counts = self._upsert(
+            [
+                make_movie(self.server_conn, "1"),
+                make_movie(self.server_conn, "2", title="Renamed"),
+                make_movie(self.server_conn, "3"),
+            ]
+        )
+
+        self.assertEqual(counts, (1, 1, 1))
+        self.assertEqual(Movie.objects.count(), 3)
+
+    def test_updates_existing_row_in_place(self):
+        """Test that an update overwrites the synced fields of the same row"""
+        self._upsert([make_movie(self.server_conn, "1")])
+        original = Movie.objects.get()
+
+        self._upsert([make_movie(self.server_conn, "1", title="New", year=1999)])
+
+        movie = Movie.objects.get()
+        self.assertEqual(movie.pk, original.pk)
+        self.assertEqual((movie.title, movie.year), ("New", 1999))
+        self.assertEqual(movie.fingerprint, movie.compute_fingerprint())
+
+    def test_skips_rows_with_unchanged_fingerprint(self):
+        """Test that identical rows aren't rewritten and keep their modified_at"""
+        self._upsert([make_movie(self.server_conn, key) for key in ("1", "2")])
+        before = dict(Movie.objects.values_list("plex_key", "modified_at"))
+
+        with self.assertNumQueries(1):
+            counts = self._upsert(
+                [make_movie(self.server_conn, key) for key in ("1", "2")]
+            )
+
+        self.assertEqual(counts, (0, 0, 2))
+        after = dict(Movie.objects.values_list("plex_key", "modified_at"))
+        self.assertEqual(after, before)
+
+
+@patch("media_manager.utils.time.monotonic")
+class TestSyncProgress(SimpleTestCase):
+    """Test progress reporting for library syncs"""
+
+    def test_resumed_run_only_counts_its_own_items(self, mock_monotonic):
+        """Test that checkpointed items don't inflate throughput or the ETA"""
+        reports = []
+        mock_monotonic.return_value = 1000
+        progress = SyncProgress(reports.append)
+
+        progress.update("syncing", processed=100, total=200)
+        mock_monotonic.return_value = 1010
+        progress.update("syncing", processed=150)
+
+        self.assertEqual(reports[-1]["processed"], 150)
+        self.assertEqual(reports[-1]["items_per_second"], 5.0)
+        self.assertEqual(reports[-1]["eta_seconds"], 10)
+
+    def test_failing_callback_is_ignored(self, mock_monotonic):
+        """Test that a broken reporter never fails the sync"""
+        mock_monotonic.return_value = 1000
+
+        def report(_):
+            raise RuntimeError("backend down")
+
+        progress = SyncProgress(report)
+        progress.update("connecting")
+
+        self.assertEqual(progress.as_dict()["phase"], "connecting")
@@ -0,0 +1,10 @@
+# media_manager/tests/views/__init__.py
+
+from .test_sync import TestSyncStatusView, TestTriggerSyncView
+from .test_webhook import TestPlexWebhookView
+
+__all__ = [
+    "TestPlexWebhookView",
+    "TestSyncStatusView",
+    "TestTriggerSyncView",
+]
@@ -0,0 +1,124 @@
+# media_manager/tests/views/test_sync.py
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from media_manager.tasks import (
+    FANOUT_STATUS_KEY,
+    FANOUT_STATUS_TTL,
+    aggregate_library_sync,
+    fail_library_sync_fanout,
+)
+from media_manager.tests.fake_plex import create_server_conn
+from plex_auth.utils.task_dedup import _clear_inflight, keep_inflight
+
+
+@patch("media_manager.tasks.sync_all_movie_libraries.apply_async")
+@patch("media_manager.tasks.sync_movie_library.apply_async")
+class TestTriggerSyncView(TestCase):
+    """Test starting syncs from the sync page"""
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(create_server_conn().owner)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _trigger(self, sync_type: str, full: bool = False):
+        return self.client.post(
+            reverse("media_manager:trigger_sync"),
+            {
+                "sync_type": sync_type,
+                "server_id": "machine-1",
+                "library_key": "1",
+                "full": "true" if full else "false",
+            },
+        ).json()
+
+    def test_repeated_trigger_joins_queued_sync(self, mock_library, mock_all):
+        """Test that a double click attaches to the sync already queued"""
+        first = self._trigger("library")
+        second = self._trigger("library")
+
+        self.assertTrue(first["queued"])
+        self.assertFalse(second["queued"])
+        self.assertEqual(second["task_id"], first["task_id"])
+        mock_library.assert_called_once()
+
+    def test_full_sync_not_absorbed_by_delta(self, mock_library, mock_all):
+        """Test that a full resync is queued while a delta one is in flight"""
+        delta = self._trigger("library")
+        full = self._trigger("library", full=True)
+
+        self.assertTrue(full["queued"])
+        self.assertNotEqual(full["task_id"], delta["task_id"])
+        self.assertFalse(self._trigger("library", full=True)["queued"])
+
+    def test_fanout_in_flight_until_aggregated(self, mock_library, mock_all):
+        """Test that syncing all libraries stays in flight until its callback"""
+        task_id = self._trigger("all")["task_id"]
+
+        # The fan-out task returns as soon as its chord is queued
+        keep_inflight(task_id)
+        _clear_inflight(task_id=task_id, state="SUCCESS")
+        self.assertEqual(self._trigger("all")["task_id"], task_id)
+
+        aggregate_library_sync([], task_id)
+        self.assertTrue(self._trigger("all")["queued"])
+        self.assertEqual(mock_all.call_count, 2)
+
+
+class TestSyncStatusView(TestCase):
+    """Test polling the status of library syncs"""
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(create_server_conn().owner)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _status(self, task_id: str):
+        return self.client.get(
+            reverse("media_manager:sync_status"), {"task_id": task_id}
+        )
+
+    def _start_fanout(self, fanout_id: str) -> None:
+        cache.set(
+            FANOUT_STATUS_KEY.format(fanout_id),
+            {"status": "running", "fanout_id": fanout_id, "lane_ids": [], "errors": []},
+            FANOUT_STATUS_TTL,
+        )
+
+    def test_requires_task_id(self):
+        """Test that polling without a task ID is rejected"""
+        response = self._status("")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_running_fanout(self):
+        """Test that a fan-out in flight reports running"""
+        self._start_fanout("fanout-1")
+
+        data = self._status("fanout-1").json()
+
+        self.assertEqual(data["status"], "running")
+        self.assertIsNone(data["error"])
+
+    def test_crashed_lane_fails_fanout(self):
+        """Test that the chord's error handler marks the fan-out failed"""
+        self._start_fanout("fanout-1")
+
+        # Celery calls a callback's error handlers as (request, exc, traceback)
+        fail_library_sync_fanout.s("fanout-1")(
+            MagicMock(), RuntimeError("Worker lost"), None
+        )
+        data = self._status("fanout-1").json()
+
+        self.assertEqual(data["status"], "failed")
+        self.assertEqual(data["error"], "Worker lost")
+        self.assertEqual(data["result"]["fanout_id"], "fanout-1")
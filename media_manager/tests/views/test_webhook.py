@@ -0,0 +1,102 @@
+# media_manager/tests/views/test_webhook.py
+
+import json
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from media_manager.tests.fake_plex import create_server_conn
+
+
+@patch("media_manager.views.webhook.sync_movie_item")
+class TestPlexWebhookView(TestCase):
+    """Test receiving Plex webhooks"""
+
+    def setUp(self):
+        self.server_conn = create_server_conn()
+        self.secret = self.server_conn.get_webhook_secret()
+
+    def _post(self, payload, secret=None):
+        return self.client.post(
+            reverse("media_manager:plex_webhook", args=[secret or self.secret]),
+            {"payload": json.dumps(payload)},
+        )
+
+    def _event(self, event="library.new", item_type="movie", **metadata):
+        return {
+            "event": event,
+            "Server": {"uuid": "machine-1"},
+            "Metadata": {
+                "type": item_type,
+                "ratingKey": "101",
+                "librarySectionID": 1,
+                **metadata,
+            },
+        }
+
+    def test_queues_sync_of_changed_movie(self, mock_sync):
+        """Test that a movie event queues a sync of that movie"""
+        mock_sync.delay.return_value = MagicMock(id="task-1")
+
+        response = self._post(self._event())
+
+        self.assertEqual(response.json(), {"status": "queued", "task_id": "task-1"})
+        mock_sync.delay.assert_called_once_with("machine-1", "1", "101")
+
+    def test_bad_secret(self, mock_sync):
+        """Test that a secret for another server is rejected"""
+        response = self._post(self._event(), secret="wrong")
+
+        self.assertEqual(response.status_code, 403)
+        mock_sync.delay.assert_not_called()
+
+    def test_unknown_server(self, mock_sync):
+        """Test that events from servers we don't know are rejected"""
+        payload = self._event()
+        payload["Server"]["uuid"] = "machine-2"
+
+        response = self._post(payload)
+
+        self.assertEqual(response.status_code, 403)
+        mock_sync.delay.assert_not_called()
+
+    def test_malformed_payloads(self, mock_sync):
+        """Test that payloads that aren't event objects get a 400"""
+        for payload in (
+            [],
+            "library.new",
+            {"event": "library.new", "Server": None},
+            {"event": "library.new", "Server": "machine-1"},
+            {**self._event(), "Metadata": ["101"]},
+        ):
+            with self.subTest(payload=payload):
+                self.assertEqual(self._post(payload).status_code, 400)
+
+        response = self.client.post(
+            reverse("media_manager:plex_webhook", args=[self.secret]),
+            {"payload": "{not json"},
+        )
+        self.assertEqual(response.status_code, 400)
+        mock_sync.delay.assert_not_called()
+
+    def test_missing_rating_key(self, mock_sync):
+        """Test that a movie event without a rating key gets a 400"""
+        response = self._post(self._event(ratingKey=None))
+
+        self.assertEqual(response.status_code, 400)
+        mock_sync.delay.assert_not_called()
+
+    def test_ignored_events(self, mock_sync):
+        """Test that playback events and non-movie items are acknowledged only"""
+        for payload in (
+            self._event(event="media.play"),
+            self._event(item_type="episode"),
+        ):
+            with self.subTest(event=payload["event"]):
+                response = self._post(payload)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["status"], "ignored")
+
+        mock_sync.delay.assert_not_called()
@@ -4,6 +4,7 @@ from django.urls import path
 
 from media_manager.views.random_movie import RandomMovieSelectView, RandomMovieView
 from media_manager.views.sync import MovieSyncView, SyncStatusView, TriggerSyncView
+from media_manager.views.webhook import PlexWebhookView
 
 app_name = "media_manager"
 
@@ -13,4 +14,5 @@ urlpatterns = [
     path("sync/", MovieSyncView.as_view(), name="movie_sync"),
     path("sync/trigger/", TriggerSyncView.as_view(), name="trigger_sync"),
     path("sync/status/", SyncStatusView.as_view(), name="sync_status"),
+    path("webhook/<str:secret>/", PlexWebhookView.as_view(), name="plex_webhook"),
 ]
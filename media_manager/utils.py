@@ -1,25 +1,228 @@
 # media_manager/utils.py
 
 import logging
-from typing import Dict
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+import requests
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
 from django.utils import timezone
 from plexapi.exceptions import NotFound
 
-from media_manager.models import Movie
+from media_manager.models import (
+    Album,
+    Artist,
+    Episode,
+    LibrarySyncCursor,
+    Movie,
+    Season,
+    Show,
+    Track,
+)
+from plex_auth.utils.exceptions import PlexManagerError
 from plex_auth.utils.plex_manager import PlexManager
+from plex_auth.utils.rate_limiter import PRIORITY_SYNC
 
 logger = logging.getLogger(__name__)
 
 
+# Fields overwritten when a synced movie has changed
+MOVIE_SYNC_FIELDS = Movie.FINGERPRINT_FIELDS + ["fingerprint", "modified_at"]
+
+
+def upsert_items(
+    model, server_conn, items: List, update_fields: List[str]
+) -> Tuple[int, int, int]:
+    """
+    Insert or update a batch of synced rows with a single statement.
+
+    Stored fingerprints are compared first and rows whose content hasn't
+    changed are left alone, so they keep their modified_at and cause no
+    write at all.
+
+    Args:
+        model: Model with a fingerprint field and compute_fingerprint()
+        server_conn: PlexServerConnection the rows belong to
+        items: Unsaved instances with unique plex_keys
+        update_fields: Fields overwritten on existing rows
+
+    Returns:
+        Tuple of (added count, updated count, unchanged count)
+    """
+    existing = dict(
+        model.objects.filter(
+            server=server_conn, plex_key__in=[item.plex_key for item in items]
+        ).values_list("plex_key", "fingerprint")
+    )
+
+    changed = []
+    for item in items:
+        item.fingerprint = item.compute_fingerprint()
+        if existing.get(item.plex_key) != item.fingerprint:
+            changed.append(item)
+
+    if changed:
+        model.objects.bulk_create(
+            changed,
+            update_conflicts=True,
+            unique_fields=["server", "plex_key"],
+            update_fields=update_fields,
+        )
+
+    added = sum(1 for item in changed if item.plex_key not in existing)
+    return added, len(changed) - added, len(items) - len(changed)
+
+
+def delete_missing_items(
+    model, server_conn, library_key: str, live_keys: List[str]
+) -> int:
+    """
+    Delete a library's rows whose keys aren't in ``live_keys``.
+
+    The stale rows are found and deleted by the database with an anti-join
+    against the live keys, so the library's rows are never read into Python.
+    On PostgreSQL the keys are bound as a single array parameter, since a
+    placeholder per key would overflow the protocol's limit of 65535 on
+    large libraries. Deletes cascade to child rows.
+
+    Returns:
+        Number of rows deleted from ``model``
+    """
+    live_keys = sorted({str(key) for key in live_keys})
+    stale = model.objects.filter(server=server_conn, library_key=str(library_key))
+    if live_keys:
+        if connection.vendor == "postgresql":
+            column = f'{connection.ops.quote_name(model._meta.db_table)}."plex_key"'
+            stale = stale.exclude(
+                RawSQL(
+                    f"{column} = ANY(%s::varchar[])",
+                    [live_keys],
+                    output_field=BooleanField(),
+                )
+            )
+        else:
+            stale = stale.exclude(plex_key__in=live_keys)
+
+    _, deleted = stale.delete()
+    removed = deleted.get(model._meta.label, 0)
+
+    if removed:
+        logger.info(
+            f"Removed {removed} {model._meta.verbose_name_plural} "
+            f"no longer in library {library_key}"
+        )
+    return removed
+
+
+class SyncProgress:
+    """
+    Tracks how far a library sync got and reports it as it runs.
+
+    Each update is passed to ``callback`` as a dict with the phase, items
+    processed out of the total (None while unknown), throughput and ETA.
+    Throughput only counts items processed by this run, so a resumed sync
+    doesn't report the checkpointed items as instant.
+
+    Syncs update their progress after every committed batch, so
+    ``abort_check`` runs there and may raise to stop the sync before it
+    writes anything else, e.g. once its lock was lost.
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[Dict], None]] = None,
+        abort_check: Optional[Callable[[], None]] = None,
+    ):
+        self.callback = callback
+        self.abort_check = abort_check
+        self.phase = "starting"
+        self.processed = 0
+        self.total: Optional[int] = None
+        self._started_at = time.monotonic()
+        self._initial: Optional[int] = None
+
+    def update(
+        self,
+        phase: str,
+        processed: Optional[int] = None,
+        total: Optional[int] = None,
+    ) -> None:
+        """Record the current phase and counts and report them."""
+        if self.abort_check:
+            self.abort_check()
+
+        self.phase = phase
+        if processed is not None:
+            if self._initial is None:
+                # The first count is where this run picked up
+                self._initial = processed
+                self._started_at = time.monotonic()
+            self.processed = processed
+        if total is not None:
+            self.total = total
+
+        if self.callback:
+            try:
+                self.callback(self.as_dict())
+            except Exception as e:
+                logger.warning(f"Failed to report sync progress: {str(e)}")
+
+    def as_dict(self) -> Dict:
+        """Return the current progress with derived throughput and ETA."""
+        elapsed = time.monotonic() - self._started_at
+        done = self.processed - (self._initial or 0)
+        rate = done / elapsed if elapsed > 0 and done > 0 else 0.0
+
+        eta = None
+        if rate and self.total is not None:
+            eta = round(max(self.total - self.processed, 0) / rate)
+
+        return {
+            "phase": self.phase,
+            "processed": self.processed,
+            "total": self.total,
+            "items_per_second": round(rate, 1),
+            "eta_seconds": eta,
+            "elapsed_seconds": round(elapsed),
+        }
+
+
 class MovieManager:
-    def __init__(self, plex_token: str):
-        self.plex_manager = PlexManager(plex_token)
+    def __init__(self, plex_token: str, session: Optional[requests.Session] = None):
+        self.plex_manager = PlexManager(
+            plex_token, session=session, priority=PRIORITY_SYNC
+        )
 
-    def sync_movies_from_library(self, server_conn, library_key: str) -> Dict[str, int]:
+    def sync_movies_from_library(
+        self,
+        server_conn,
+        library_key: str,
+        full: bool = False,
+        progress: Optional[SyncProgress] = None,
+    ) -> Dict[str, int]:
         """
-        Syncs all movies from a specific Plex library to our database.
+        Syncs movies from a specific Plex library to our database.
+
+        After the first sync only movies added or updated since the library's
+        LibrarySyncCursor watermarks are fetched.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            library_key: Library section key
+            full: Ignore the watermarks and resync the whole library
+            progress: Receives the phase and item counts as the sync runs
         """
+        progress = progress or SyncProgress()
+        progress.update("connecting")
+
+        if self.plex_manager.is_section_missing(server_conn, library_key):
+            raise NotFound(f"Library with ID {library_key} not found")
+
         try:
             # Get server connection using PlexManager
             server = self.plex_manager._get_server(server_conn)
@@ -40,88 +243,748 @@ class MovieManager:
                 available_sections = [f"{s.key}: {s.title}" for s in sections]
                 error_msg = f"Library with ID {library_key} not found. Available sections: {available_sections}"
                 logger.error(error_msg)
+                self.plex_manager.mark_section_missing(server_conn, library_key)
                 raise NotFound(error_msg)
 
             logger.info(f"Found library: {library_section.title}")
 
-            # Get all movies
-            movies = library_section.all()
-            logger.info(f"Found {len(movies)} items in library")
+            cursor, _ = LibrarySyncCursor.objects.get_or_create(
+                server=server_conn, library_key=str(library_key)
+            )
+
+            # Resume an interrupted sync unless a full run replaces a delta one
+            resumed = cursor.has_checkpoint and (cursor.checkpoint_full or not full)
+            if resumed:
+                full = cursor.checkpoint_full
+                last_added_at = cursor.checkpoint_added_at
+                last_updated_at = cursor.checkpoint_updated_at
+                logger.info(
+                    f"Resuming sync of {library_section.title} from "
+                    f"{cursor.checkpoint_field or 'full listing'} offset {cursor.checkpoint_offset}"
+                )
+            else:
+                full = full or not cursor.has_watermark
+                last_added_at = None
+                last_updated_at = None
 
             added_count = 0
             updated_count = 0
+            unchanged_count = 0
+            total_count = 0
+
+            # A delta sync can't tell how many changed items to expect
+            total = library_section.totalViewSize(libtype="movie") if full else None
+            progress.update(
+                "syncing",
+                processed=cursor.checkpoint_offset if resumed and full else 0,
+                total=total,
+            )
+
+            # Pages are written as they arrive, so memory stays bounded by
+            # the page size rather than the library size. Each page commits
+            # with its checkpoint so a retry picks up from the last one.
+            pages = self._iter_movie_pages(
+                server_conn, library_key, cursor, full, resumed
+            )
+            for field, next_offset, page in pages:
+                total_count += len(page)
 
-            for movie in movies:
                 # Skip non-movie items
-                if not hasattr(movie, "type") or movie.type != "movie":
+                movie_items = [movie for movie in page if movie.type == "movie"]
+                if len(movie_items) < len(page):
                     logger.debug(
-                        f"Skipping non-movie item: {getattr(movie, 'title', 'Unknown')}"
+                        f"Skipping {len(page) - len(movie_items)} non-movie items"
                     )
-                    continue
-
-                try:
-                    movie_data = self.plex_manager._format_media_item(movie)
-                    if not movie_data:
-                        logger.warning(
-                            f"Failed to format movie data for: {movie.title}"
-                        )
-                        continue
-
-                    # Update or create movie record
-                    movie_obj, created = Movie.objects.update_or_create(
-                        server=server_conn,
-                        plex_key=str(movie_data["key"]),
-                        defaults={
-                            "title": movie_data["title"],
-                            "year": movie_data.get("year"),
-                            "summary": movie_data.get("summary", ""),
-                            "duration": movie_data.get("duration", 0),
-                            "content_rating": movie_data.get("content_rating", ""),
-                            "rating": movie_data.get("rating"),
-                            "studio": movie_data.get("studio", ""),
-                            "genres": movie_data.get("genres", []),
-                            "directors": movie_data.get("directors", []),
-                            "actors": movie_data.get("actors", []),
-                            "added_at": (
-                                timezone.datetime.fromtimestamp(
-                                    movie_data["added_at"]
-                                ).astimezone(timezone.get_current_timezone())
-                                if movie_data.get("added_at")
-                                else timezone.now()
-                            ),
-                            "updated_at": (
-                                timezone.datetime.fromtimestamp(
-                                    movie_data["updated_at"]
-                                ).astimezone(timezone.get_current_timezone())
-                                if movie_data.get("updated_at")
-                                else timezone.now()
-                            ),
-                            "thumb_url": movie_data.get("thumb", ""),
-                            "view_count": movie_data.get("view_count", 0),
-                        },
+                with transaction.atomic():
+                    added, updated, unchanged, synced = self._sync_movie_batch(
+                        server, server_conn, library_key, movie_items
                     )
-                    if created:
-                        logger.debug(f"Created new movie record: {movie_data['title']}")
-                        added_count += 1
-                    else:
-                        logger.debug(
-                            f"Updated existing movie record: {movie_data['title']}"
-                        )
-                        updated_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing movie {movie.title}: {str(e)}")
-                    continue
+
+                    for movie in synced:
+                        if last_added_at is None or movie.added_at > last_added_at:
+                            last_added_at = movie.added_at
+                        if (
+                            last_updated_at is None
+                            or movie.updated_at > last_updated_at
+                        ):
+                            last_updated_at = movie.updated_at
+
+                    cursor.save_checkpoint(
+                        full, field, next_offset, last_added_at, last_updated_at
+                    )
+
+                added_count += added
+                updated_count += updated
+                unchanged_count += unchanged
+
+                logger.debug(f"Synced {total_count} items from {library_section.title}")
+                progress.update(
+                    "syncing", processed=next_offset if full else total_count
+                )
+
+            progress.update("reconciling")
+
+            # Drop movies that no longer exist on the PMS. The paged listing
+            # can't tell us: an item removed mid-sync shifts the later pages
+            # and skips a live item. Live keys are listed separately once
+            # paging is done, for a delta sync only when the counts show
+            # something was removed.
+            live_keys = None
+            if full or Movie.objects.filter(
+                server=server_conn, library_key=str(library_key)
+            ).count() != library_section.totalViewSize(libtype="movie"):
+                live_keys = self.plex_manager.get_library_rating_keys(
+                    server_conn, library_key
+                )
+
+            with transaction.atomic():
+                removed_count = 0
+                if live_keys is not None:
+                    removed_count = self._delete_missing_movies(
+                        server_conn, library_key, live_keys
+                    )
+
+                cursor.advance(last_added_at, last_updated_at, full=full)
 
             logger.info(
-                f"Sync complete - Added: {added_count}, Updated: {updated_count}, Total: {len(movies)}"
+                f"Sync complete - Added: {added_count}, Updated: {updated_count}, "
+                f"Unchanged: {unchanged_count}, Removed: {removed_count}, "
+                f"Total: {total_count}"
             )
+            progress.update("completed")
             return {
                 "added": added_count,
                 "updated": updated_count,
-                "total": len(movies),
+                "unchanged": unchanged_count,
+                "removed": removed_count,
+                "total": total_count,
+                "full": full,
             }
 
         except Exception as e:
             logger.error(f"Error syncing movies: {str(e)}")
             raise
+
+    def sync_movie_item(self, server_conn, library_key: str, rating_key: str) -> str:
+        """
+        Upsert a single movie, e.g. after a webhook reports it changed.
+
+        A movie that no longer exists on the PMS is removed locally.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            library_key: Library section key the movie belongs to
+            rating_key: Rating key of the movie
+
+        Returns:
+            str: "added", "updated", "unchanged", "removed" or "skipped"
+        """
+        movie_details = self.plex_manager.get_metadata_batch(server_conn, [rating_key])
+
+        if not movie_details:
+            deleted, _ = Movie.objects.filter(
+                server=server_conn, plex_key=str(rating_key)
+            ).delete()
+            return "removed" if deleted else "skipped"
+
+        movie_data = movie_details[0]
+        if movie_data["type"] != "movie":
+            logger.debug(f"Skipping non-movie item {rating_key}")
+            return "skipped"
+
+        movie = self._build_movie(server_conn, library_key, movie_data)
+        added, updated, _ = self._upsert_movies(server_conn, [movie])
+        if added:
+            return "added"
+        return "updated" if updated else "unchanged"
+
+    def _build_movie(self, server_conn, library_key: str, movie_data: Dict) -> Movie:
+        """Build an unsaved Movie from a formatted Plex item."""
+        return Movie(
+            server=server_conn,
+            library_key=str(library_key),
+            plex_key=str(movie_data["key"]),
+            title=movie_data["title"],
+            year=movie_data.get("year"),
+            summary=movie_data.get("summary", ""),
+            duration=movie_data.get("duration") or 0,
+            content_rating=movie_data.get("content_rating", ""),
+            video_resolution=movie_data.get("video_resolution", ""),
+            rating=movie_data.get("rating"),
+            studio=movie_data.get("studio", ""),
+            genres=movie_data.get("genres", []),
+            directors=movie_data.get("directors", []),
+            actors=movie_data.get("actors", []),
+            added_at=self._to_datetime(movie_data.get("added_at")),
+            updated_at=self._to_datetime(movie_data.get("updated_at")),
+            thumb_url=movie_data.get("thumb", ""),
+            view_count=movie_data.get("view_count", 0),
+        )
+
+    @staticmethod
+    def _to_datetime(timestamp: Optional[float]):
+        if not timestamp:
+            return timezone.now()
+        return timezone.datetime.fromtimestamp(timestamp).astimezone(
+            timezone.get_current_timezone()
+        )
+
+    def _upsert_movies(self, server_conn, movies: List[Movie]) -> Tuple[int, int, int]:
+        """
+        Insert or update a batch of movies with a single statement.
+
+        Returns:
+            Tuple of (added count, updated count, unchanged count)
+        """
+        return upsert_items(Movie, server_conn, movies, MOVIE_SYNC_FIELDS)
+
+    def _delete_missing_movies(
+        self, server_conn, library_key: str, live_keys: List[str]
+    ) -> int:
+        """
+        Delete a library's movies whose keys aren't in ``live_keys``.
+
+        Returns:
+            Number of movies deleted
+        """
+        return delete_missing_items(Movie, server_conn, library_key, live_keys)
+
+    def _iter_movie_pages(
+        self,
+        server_conn,
+        library_key: str,
+        cursor: LibrarySyncCursor,
+        full: bool,
+        resume: bool = False,
+    ) -> Iterator[Tuple[str, int, List]]:
+        """
+        Yield pages of movies to sync.
+
+        A full sync pages through the whole section; a delta sync only
+        through items added or updated after the cursor's watermarks.
+
+        Args:
+            resume: Start from the cursor's checkpoint instead of the beginning
+
+        Yields:
+            Tuples of (delta field or "" for full, offset after the page, page)
+        """
+        page_size = getattr(settings, "MOVIE_SYNC_BATCH_SIZE", 500)
+        resume_field = cursor.checkpoint_field if resume else None
+        resume_offset = cursor.checkpoint_offset if resume else 0
+
+        if full:
+            offset = resume_offset or 0
+            for page in self.plex_manager.iter_library_pages(
+                server_conn, library_key, page_size=page_size, start=offset
+            ):
+                offset += len(page)
+                yield "", offset, page
+            return
+
+        fields = [
+            ("updatedAt", cursor.last_updated_at),
+            ("addedAt", cursor.last_added_at),
+        ]
+        if resume_field:
+            # Skip the streams the interrupted run already finished
+            names = [name for name, _ in fields]
+            fields = fields[names.index(resume_field) :]
+
+        seen = set()
+        for field, watermark in fields:
+            if watermark is None:
+                continue
+            offset = resume_offset if field == resume_field else 0
+            # Overlap by a second so items changed within the watermark's
+            # second aren't missed; upserting them again is harmless
+            since = int(watermark.timestamp()) - 1
+            for page in self.plex_manager.iter_library_pages(
+                server_conn,
+                library_key,
+                page_size=page_size,
+                filters={f"{field}>>": since},
+                start=offset,
+            ):
+                offset += len(page)
+                page = [item for item in page if item.ratingKey not in seen]
+                seen.update(item.ratingKey for item in page)
+                if page:
+                    yield field, offset, page
+
+    def _sync_movie_batch(
+        self, server, server_conn, library_key: str, movie_items: List
+    ) -> Tuple[int, int, int, List[Movie]]:
+        """
+        Fetch full metadata for the changed movies of a batch and upsert them.
+
+        Listed movies are compared with the stored rows on the fields a
+        listing carries in full, and details are only fetched for new or
+        changed ones.
+
+        Returns:
+            Tuple of (added count, updated count, unchanged count, synced
+            movies); unchanged movies are built from the listing
+        """
+        listed = {}
+        for movie_data in self.plex_manager._format_media_items(server, movie_items):
+            try:
+                movie = self._build_movie(server_conn, library_key, movie_data)
+            except Exception as e:
+                logger.error(f"Error processing movie {movie_data['title']}: {str(e)}")
+                continue
+            listed[movie.plex_key] = movie
+
+        stored = {
+            movie.plex_key: movie.compute_fingerprint(Movie.LISTING_FIELDS)
+            for movie in Movie.objects.filter(
+                server=server_conn, plex_key__in=list(listed)
+            ).only("plex_key", *Movie.LISTING_FIELDS)
+        }
+        unchanged_movies = [
+            movie
+            for key, movie in listed.items()
+            if stored.get(key) == movie.compute_fingerprint(Movie.LISTING_FIELDS)
+        ]
+        unchanged_keys = {movie.plex_key for movie in unchanged_movies}
+        changed_items = [
+            item for item in movie_items if str(item.ratingKey) not in unchanged_keys
+        ]
+        if not changed_items:
+            return 0, 0, len(unchanged_movies), unchanged_movies
+
+        # Listing objects only carry a few tags, so fetch complete metadata
+        # in batches rather than letting plexapi reload each movie
+        movie_details = self.plex_manager._format_media_items(
+            server, changed_items, detail=True
+        )
+        if len(movie_details) < len(changed_items):
+            logger.warning(
+                f"Failed to format {len(changed_items) - len(movie_details)} movies"
+            )
+
+        # A duplicate key keeps the last copy
+        movies_by_key = {}
+        for movie_data in movie_details:
+            try:
+                movie = self._build_movie(server_conn, library_key, movie_data)
+            except Exception as e:
+                logger.error(f"Error processing movie {movie_data['title']}: {str(e)}")
+                continue
+            movies_by_key[movie.plex_key] = movie
+
+        # Write in plex_key order so concurrent syncs lock rows of the
+        # unique index in the same order and can't deadlock
+        movies = [movies_by_key[key] for key in sorted(movies_by_key)]
+        if not movies:
+            return 0, 0, len(unchanged_movies), unchanged_movies
+
+        added, updated, unchanged = self._upsert_movies(server_conn, movies)
+        return (
+            added,
+            updated,
+            unchanged + len(unchanged_movies),
+            movies + unchanged_movies,
+        )
+
+
+@dataclass(frozen=True)
+class CatalogLevel:
+    """One level of a show or music library, e.g. seasons of a show library."""
+
+    model: Any
+    libtype: str
+    plex_type: int
+    # (foreign key field, parent model, XML attribute holding the parent key)
+    parents: Tuple[Tuple[str, Any, str], ...] = ()
+
+
+# Levels in the order they must be written so parents exist before children
+CATALOG_LEVELS = {
+    "show": [
+        CatalogLevel(Show, "show", 2),
+        CatalogLevel(Season, "season", 3, (("show", Show, "parentRatingKey"),)),
+        CatalogLevel(
+            Episode,
+            "episode",
+            4,
+            (
+                ("show", Show, "grandparentRatingKey"),
+                ("season", Season, "parentRatingKey"),
+            ),
+        ),
+    ],
+    "artist": [
+        CatalogLevel(Artist, "artist", 8),
+        CatalogLevel(Album, "album", 9, (("artist", Artist, "parentRatingKey"),)),
+        CatalogLevel(
+            Track,
+            "track",
+            10,
+            (
+                ("artist", Artist, "grandparentRatingKey"),
+                ("album", Album, "parentRatingKey"),
+            ),
+        ),
+    ],
+}
+
+
+class CatalogManager:
+    """
+    Mirrors show and music libraries into the local catalog.
+
+    Every level of a library (shows, seasons and episodes, or artists, albums
+    and tracks) is listed with one paged request stream of its own, so a sync
+    never walks the tree item by item.
+    """
+
+    def __init__(self, plex_token: str, session: Optional[requests.Session] = None):
+        self.plex_manager = PlexManager(
+            plex_token, session=session, priority=PRIORITY_SYNC
+        )
+
+    def sync_library(
+        self,
+        server_conn,
+        library_key: str,
+        full: bool = False,
+        progress: Optional[SyncProgress] = None,
+    ) -> Dict[str, Any]:
+        """
+        Syncs a show or music library to our database.
+
+        After the first sync only items added or updated since the library's
+        LibrarySyncCursor watermarks are fetched. Items deleted from Plex are
+        removed by full syncs, and by delta syncs for levels whose stored and
+        live counts differ.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            library_key: Library section key
+            full: Ignore the watermarks and resync the whole library
+            progress: Receives the phase and item counts as the sync runs
+
+        Returns:
+            dict: Added/updated/unchanged/removed counts overall and per level
+        """
+        progress = progress or SyncProgress()
+        progress.update("connecting")
+
+        if self.plex_manager.is_section_missing(server_conn, library_key):
+            raise NotFound(f"Library with ID {library_key} not found")
+
+        server = self.plex_manager._get_server(server_conn)
+        library_section = next(
+            (
+                section
+                for section in server.library.sections()
+                if str(section.key) == str(library_key)
+            ),
+            None,
+        )
+        if not library_section:
+            self.plex_manager.mark_section_missing(server_conn, library_key)
+            raise NotFound(f"Library with ID {library_key} not found")
+
+        levels = CATALOG_LEVELS.get(library_section.type)
+        if not levels:
+            raise PlexManagerError(
+                f"Library {library_section.title} is a {library_section.type} library"
+            )
+
+        cursor, _ = LibrarySyncCursor.objects.get_or_create(
+            server=server_conn, library_key=str(library_key)
+        )
+        full = full or not cursor.has_watermark
+
+        total = None
+        if full:
+            total = sum(
+                library_section.totalViewSize(libtype=level.libtype) for level in levels
+            )
+        progress.update("syncing", processed=0, total=total)
+
+        result = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "total": 0}
+        last_added_at = None
+        last_updated_at = None
+        # Earliest timestamps of items skipped because their parent isn't
+        # stored yet; the watermarks are held there so they're listed again
+        held_added_at = None
+        held_updated_at = None
+
+        for level in levels:
+            counts = dict.fromkeys(
+                ("added", "updated", "unchanged", "removed", "total"), 0
+            )
+
+            for page in self._iter_level_pages(
+                server_conn, library_key, level, cursor, full
+            ):
+                with transaction.atomic():
+                    items, skipped = self._build_items(
+                        server, server_conn, library_key, level, page
+                    )
+                    added, updated, unchanged = upsert_items(
+                        level.model,
+                        server_conn,
+                        items,
+                        level.model.FINGERPRINT_FIELDS + ["fingerprint", "modified_at"],
+                    )
+
+                for item in items:
+                    if last_added_at is None or item.added_at > last_added_at:
+                        last_added_at = item.added_at
+                    if last_updated_at is None or item.updated_at > last_updated_at:
+                        last_updated_at = item.updated_at
+                for item in skipped:
+                    if held_added_at is None or item.added_at < held_added_at:
+                        held_added_at = item.added_at
+                    if held_updated_at is None or item.updated_at < held_updated_at:
+                        held_updated_at = item.updated_at
+
+                counts["added"] += added
+                counts["updated"] += updated
+                counts["unchanged"] += unchanged
+                counts["total"] += len(page)
+                result["total"] += len(page)
+                progress.update("syncing", processed=result["total"])
+
+            result[level.libtype] = counts
+            for field in ("added", "updated", "unchanged"):
+                result[field] += counts[field]
+
+        progress.update("reconciling")
+
+        if held_added_at is not None:
+            logger.warning(
+                f"Holding the watermarks of {library_section.title} back for "
+                f"items whose parent isn't synced yet"
+            )
+            if last_added_at is None or held_added_at < last_added_at:
+                last_added_at = held_added_at
+            if last_updated_at is None or held_updated_at < last_updated_at:
+                last_updated_at = held_updated_at
+
+        with transaction.atomic():
+            # Children first, so counts aren't absorbed by cascades
+            for level in reversed(levels):
+                removed = self._delete_missing_items(
+                    server_conn, library_key, library_section, level, full
+                )
+                result[level.libtype]["removed"] = removed
+                result["removed"] += removed
+
+            cursor.advance(last_added_at, last_updated_at, full=full)
+
+        logger.info(
+            f"Catalog sync of {library_section.title} complete - "
+            f"Added: {result['added']}, Updated: {result['updated']}, "
+            f"Unchanged: {result['unchanged']}, Removed: {result['removed']}, "
+            f"Total: {result['total']}"
+        )
+        progress.update("completed")
+        return {**result, "full": full, "library_type": library_section.type}
+
+    def _delete_missing_items(
+        self,
+        server_conn,
+        library_key: str,
+        library_section,
+        level: CatalogLevel,
+        full: bool,
+    ) -> int:
+        """
+        Delete a level's rows that no longer exist on the PMS.
+
+        Live keys are listed separately rather than collected while paging,
+        since an item removed mid-sync shifts the later pages. A delta sync
+        only lists them when the stored and live counts differ.
+
+        Returns:
+            Number of rows deleted
+        """
+        if not full and level.model.objects.filter(
+            server=server_conn, library_key=str(library_key)
+        ).count() == library_section.totalViewSize(libtype=level.libtype):
+            return 0
+
+        live_keys = self.plex_manager.get_library_rating_keys(
+            server_conn, library_key, libtype=level.plex_type
+        )
+        return delete_missing_items(level.model, server_conn, library_key, live_keys)
+
+    def _iter_level_pages(
+        self,
+        server_conn,
+        library_key: str,
+        level: CatalogLevel,
+        cursor: LibrarySyncCursor,
+        full: bool,
+    ) -> Iterator[List]:
+        """
+        Yield pages of one level's items to sync.
+
+        A full sync pages through every item of the level; a delta sync only
+        through items added or updated after the cursor's watermarks.
+        """
+        page_size = getattr(settings, "MOVIE_SYNC_BATCH_SIZE", 500)
+
+        if full:
+            yield from self.plex_manager.iter_library_pages(
+                server_conn, library_key, page_size=page_size, libtype=level.plex_type
+            )
+            return
+
+        seen = set()
+        for field, watermark in (
+            ("updatedAt", cursor.last_updated_at),
+            ("addedAt", cursor.last_added_at),
+        ):
+            if watermark is None:
+                continue
+            # Overlap by a second so items changed within the watermark's
+            # second aren't missed
+            since = int(watermark.timestamp()) - 1
+            for page in self.plex_manager.iter_library_pages(
+                server_conn,
+                library_key,
+                page_size=page_size,
+                libtype=level.plex_type,
+                filters={f"{field}>>": since},
+            ):
+                page = [item for item in page if item.ratingKey not in seen]
+                seen.update(item.ratingKey for item in page)
+                if page:
+                    yield page
+
+    def _build_items(
+        self, server, server_conn, library_key: str, level: CatalogLevel, page: List
+    ) -> Tuple[List, List]:
+        """
+        Build unsaved rows for a page of listed items, in plex_key order.
+
+        Items whose parent isn't stored locally are skipped and returned
+        separately, so the sync can hold its watermarks back for them.
+
+        Returns:
+            Tuple of (rows to write, rows skipped for a missing parent)
+        """
+        parent_ids = {}
+        for field, parent_model, attribute in level.parents:
+            parent_keys = {item._data.get(attribute) for item in page}
+            parent_ids[field] = dict(
+                parent_model.objects.filter(
+                    server=server_conn, plex_key__in=parent_keys
+                ).values_list("plex_key", "id")
+            )
+
+        base_url = server._baseurl.rstrip("/")
+        items_by_key = {}
+        skipped = []
+        for item in page:
+            data = item._data
+            try:
+                row = level.model(
+                    server=server_conn,
+                    library_key=str(library_key),
+                    plex_key=str(data.get("ratingKey")),
+                    **self._item_fields(level.libtype, data, base_url),
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error processing {level.libtype} {data.get('title')}: {str(e)}"
+                )
+                continue
+
+            missing = [
+                f"{field} {data.get(attribute)}"
+                for field, _, attribute in level.parents
+                if data.get(attribute) not in parent_ids[field]
+            ]
+            if missing:
+                logger.warning(
+                    f"Skipping {level.libtype} {row.title}: "
+                    f"{', '.join(missing)} not synced"
+                )
+                skipped.append(row)
+                continue
+
+            for field, _, attribute in level.parents:
+                setattr(row, f"{field}_id", parent_ids[field][data.get(attribute)])
+            items_by_key[row.plex_key] = row
+
+        # Write in plex_key order so concurrent syncs can't deadlock
+        return [items_by_key[key] for key in sorted(items_by_key)], skipped
+
+    @staticmethod
+    def _item_fields(libtype: str, data, base_url: str) -> Dict[str, Any]:
+        """Read a level's model fields from a listing's XML element."""
+        attrib = data.attrib
+
+        def number(name: str, cast=int, default=None):
+            value = attrib.get(name)
+            return cast(value) if value not in (None, "") else default
+
+        def timestamp(name: str):
+            return MovieManager._to_datetime(number(name, float))
+
+        thumb = attrib.get("thumb")
+        fields = {
+            "title": attrib.get("title", ""),
+            "summary": attrib.get("summary", ""),
+            "thumb_url": f"{base_url}{thumb}" if thumb else "",
+            "added_at": timestamp("addedAt"),
+            "updated_at": timestamp(
+                "updatedAt" if "updatedAt" in attrib else "addedAt"
+            ),
+        }
+        genres = [el.get("tag") for el in data.findall("Genre") if el.get("tag")]
+
+        if libtype == "show":
+            fields.update(
+                year=number("year"),
+                content_rating=attrib.get("contentRating", ""),
+                studio=attrib.get("studio", ""),
+                rating=number("audienceRating", float) or number("rating", float),
+                genres=genres,
+                season_count=number("childCount", default=0),
+                episode_count=number("leafCount", default=0),
+                viewed_episode_count=number("viewedLeafCount", default=0),
+            )
+        elif libtype == "season":
+            fields.update(
+                index=number("index"),
+                episode_count=number("leafCount", default=0),
+                viewed_episode_count=number("viewedLeafCount", default=0),
+            )
+        elif libtype == "episode":
+            aired = attrib.get("originallyAvailableAt")
+            fields.update(
+                season_number=number("parentIndex"),
+                index=number("index"),
+                duration=number("duration", default=0),
+                content_rating=attrib.get("contentRating", ""),
+                rating=number("audienceRating", float) or number("rating", float),
+                originally_available_at=(date.fromisoformat(aired) if aired else None),
+                view_count=number("viewCount", default=0),
+            )
+        elif libtype == "artist":
+            fields.update(genres=genres, view_count=number("viewCount", default=0))
+        elif libtype == "album":
+            fields.update(
+                year=number("year"),
+                studio=attrib.get("studio", ""),
+                genres=genres,
+                track_count=number("leafCount", default=0),
+                view_count=number("viewCount", default=0),
+            )
+        elif libtype == "track":
+            fields.update(
+                disc_number=number("parentIndex"),
+                index=number("index"),
+                duration=number("duration", default=0),
+                view_count=number("viewCount", default=0),
+            )
+
+        return fields
@@ -5,11 +5,17 @@ from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import JsonResponse
 from django.middleware.csrf import get_token
+from django.urls import reverse
 from django.views import View
 from django.views.generic import TemplateView
 
-from media_manager.tasks import sync_all_movie_libraries, sync_movie_library
-from media_manager.utils import MovieManager
+from media_manager.tasks import (
+    get_fanout_status,
+    sync_all_movie_libraries,
+    sync_movie_library,
+)
+from plex_auth.utils.plex_manager import PlexManager
+from plex_auth.utils.task_dedup import enqueue_once
 
 
 class MovieSyncView(LoginRequiredMixin, TemplateView):
@@ -20,16 +26,28 @@ class MovieSyncView(LoginRequiredMixin, TemplateView):
         context["csrf_token"] = get_token(self.request)
 
         # Get all movie libraries for the user
-        movie_manager = MovieManager(self.request.user.plex_token)
+        plex_manager = PlexManager(self.request.user.plex_token)
         server_libraries = []
 
         for server in self.request.user.plex_servers.all():
             try:
-                libraries = movie_manager.plex_manager.get_libraries(server)
+                libraries = plex_manager.get_libraries(server)
                 movie_libs = [lib for lib in libraries if lib["type"] == "movie"]
 
                 if movie_libs:
-                    server_libraries.append({"server": server, "libraries": movie_libs})
+                    webhook_url = self.request.build_absolute_uri(
+                        reverse(
+                            "media_manager:plex_webhook",
+                            args=[server.get_webhook_secret()],
+                        )
+                    )
+                    server_libraries.append(
+                        {
+                            "server": server,
+                            "libraries": movie_libs,
+                            "webhook_url": webhook_url,
+                        }
+                    )
             except Exception as e:
                 messages.error(
                     self.request,
@@ -45,25 +63,46 @@ class TriggerSyncView(LoginRequiredMixin, View):
         sync_type = request.POST.get("sync_type")
         server_id = request.POST.get("server_id")
         library_key = request.POST.get("library_key")
+        full = request.POST.get("full") == "true"
 
         try:
+            # A repeated trigger attaches to the run already in flight; a full
+            # resync is never absorbed by a delta one
             if sync_type == "all":
-                task = sync_all_movie_libraries.delay(request.user.id)
+                task_id, queued = enqueue_once(
+                    sync_all_movie_libraries,
+                    args=(request.user.id, full),
+                    scope=(request.user.id, full),
+                )
                 return JsonResponse(
                     {
                         "status": "success",
-                        "message": "Full sync started",
-                        "task_id": task.id,
+                        "message": (
+                            "Full sync started"
+                            if queued
+                            else "Full sync already in progress"
+                        ),
+                        "task_id": task_id,
+                        "queued": queued,
                     }
                 )
 
             elif sync_type == "library" and server_id and library_key:
-                task = sync_movie_library.delay(request.user.id, server_id, library_key)
+                task_id, queued = enqueue_once(
+                    sync_movie_library,
+                    args=(request.user.id, server_id, library_key, full),
+                    scope=(server_id, library_key, full),
+                )
                 return JsonResponse(
                     {
                         "status": "success",
-                        "message": "Library sync started",
-                        "task_id": task.id,
+                        "message": (
+                            "Library sync started"
+                            if queued
+                            else "Library sync already in progress"
+                        ),
+                        "task_id": task_id,
+                        "queued": queued,
                     }
                 )
 
@@ -85,8 +124,28 @@ class SyncStatusView(LoginRequiredMixin, View):
                 {"status": "error", "message": "No task ID provided"}, status=400
             )
 
+        # Fan-outs keep one aggregated status entry under the parent task's ID
+        fanout = get_fanout_status(task_id)
+        if fanout is not None:
+            response = {
+                "status": fanout["status"],
+                "result": fanout,
+                "error": fanout.get("error"),
+            }
+            if fanout["status"] == "running":
+                response["progress"] = [
+                    lane.info
+                    for lane in map(AsyncResult, fanout.get("lane_ids", []))
+                    if lane.state == "PROGRESS"
+                ]
+            return JsonResponse(response)
+
         result = AsyncResult(task_id)
 
+        # Running syncs publish their phase, counts, throughput and ETA
+        if result.state == "PROGRESS":
+            return JsonResponse({"status": "running", "progress": result.info})
+
         if result.ready():
             return JsonResponse(
                 {
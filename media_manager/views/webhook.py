@@ -0,0 +1,80 @@
+# media_manager/views/webhook.py
+
+import hmac
+import json
+import logging
+
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from media_manager.tasks import sync_movie_item
+from plex_auth.models import PlexServerConnection
+
+logger = logging.getLogger(__name__)
+
+# Events that change what we store about a single item
+SYNC_EVENTS = {"library.new", "media.scrobble", "media.rate"}
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class PlexWebhookView(View):
+    """
+    Receive Plex webhooks and sync the affected movie in the background.
+
+    Plex posts a multipart form whose ``payload`` field holds the event JSON.
+    The URL carries the server's webhook secret, which must match the server
+    named in the payload.
+    """
+
+    def post(self, request, secret):
+        try:
+            payload = json.loads(request.POST.get("payload") or request.body)
+        except (TypeError, ValueError):
+            return JsonResponse(
+                {"status": "error", "message": "Invalid payload"}, status=400
+            )
+
+        # Valid JSON isn't necessarily an event object
+        if not isinstance(payload, dict):
+            return JsonResponse(
+                {"status": "error", "message": "Invalid payload"}, status=400
+            )
+        server = payload.get("Server")
+        metadata = payload.get("Metadata") or {}
+        if not isinstance(server, dict) or not isinstance(metadata, dict):
+            return JsonResponse(
+                {"status": "error", "message": "Invalid payload"}, status=400
+            )
+
+        event = payload.get("event")
+        server_id = server.get("uuid")
+
+        server_conn = PlexServerConnection.objects.filter(
+            machine_identifier=server_id
+        ).first()
+        if not server_conn or not server_conn.webhook_secret:
+            return JsonResponse(
+                {"status": "error", "message": "Unknown server"}, status=403
+            )
+        if not hmac.compare_digest(server_conn.webhook_secret, secret):
+            logger.warning(f"Rejected webhook with bad secret for {server_conn.name}")
+            return JsonResponse(
+                {"status": "error", "message": "Invalid secret"}, status=403
+            )
+
+        if event not in SYNC_EVENTS or metadata.get("type") != "movie":
+            return JsonResponse({"status": "ignored", "event": event})
+
+        rating_key = metadata.get("ratingKey")
+        library_key = metadata.get("librarySectionID")
+        if not rating_key or library_key is None:
+            return JsonResponse(
+                {"status": "error", "message": "Missing ratingKey"}, status=400
+            )
+
+        task = sync_movie_item.delay(server_id, str(library_key), str(rating_key))
+        logger.info(f"Webhook {event} queued sync of movie {rating_key}")
+
+        return JsonResponse({"status": "queued", "task_id": task.id})
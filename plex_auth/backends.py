@@ -8,6 +8,12 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import BaseBackend
 from django.core.exceptions import ObjectDoesNotExist
 
+from plex_auth.utils.account_cache import account_cache
+from plex_auth.utils.connection_pool import connection_pool
+from plex_auth.utils.constants import REQUEST_TIMEOUT
+from plex_auth.utils.http_session import get_session
+from plex_auth.utils.token_generation import revoke_token
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,6 +31,9 @@ class PlexAuthenticationBackend(BaseBackend):
 
     PLEX_USER_API = "https://plex.tv/api/v2/user"
 
+    def __init__(self, session: Optional[requests.Session] = None):
+        self.session = session or get_session()
+
     def authenticate(
         self,
         request,
@@ -77,7 +86,9 @@ class PlexAuthenticationBackend(BaseBackend):
                 "Accept": "application/json",
                 "X-Plex-Token": token,
             }
-            response = requests.get(self.PLEX_USER_API, headers=headers)
+            response = self.session.get(
+                self.PLEX_USER_API, headers=headers, timeout=REQUEST_TIMEOUT
+            )
             response.raise_for_status()
             account_data = response.json()
             logger.info("Successfully fetched Plex account data")
@@ -125,6 +136,12 @@ class PlexAuthenticationBackend(BaseBackend):
                 user = User(username=username)
                 logger.info(f"Creating new user: {username}")
 
+        # Drop anything cached for a token that is being replaced
+        if user.plex_token and user.plex_token != token:
+            revoke_token(user.plex_token)
+            account_cache.invalidate(user.plex_token)
+            connection_pool.invalidate_token(user.plex_token)
+
         # Update user data
         user.plex_username = username
         user.plex_token = token
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plex_auth", "0002_plexserverconnection_direct_url_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="plexserverconnection",
+            name="preferred_url",
+            field=models.URLField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="plexserverconnection",
+            name="preferred_url_latency_ms",
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 04:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plex_auth", "0003_plexserverconnection_preferred_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="plexserverconnection",
+            name="webhook_secret",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
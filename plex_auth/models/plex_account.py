@@ -73,7 +73,7 @@ class PlexAccount(AbstractUser):
         try:
             # Discover available servers
             plex_manager = PlexManager(self.plex_token)
-            available_servers = plex_manager.discover_servers()
+            available_servers = plex_manager.discover_servers(refresh=True)
 
             # Update or create server records
             for server_data in available_servers:
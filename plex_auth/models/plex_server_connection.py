@@ -1,6 +1,7 @@
 # plex_auth/models/plex_server_connection.py
 
 import logging
+import secrets
 from typing import List
 from urllib.parse import urlparse
 
@@ -22,6 +23,9 @@ class PlexServerConnection(models.Model):
     # Store alternative connection URLs
     local_url = models.URLField(blank=True)
     direct_url = models.URLField(blank=True)
+    # Last endpoint that won connection resolution, tried first on cold connects
+    preferred_url = models.URLField(blank=True)
+    preferred_url_latency_ms = models.FloatField(null=True, blank=True)
     token = models.CharField(max_length=255)
     machine_identifier = models.CharField(max_length=255, unique=True)
     version = models.CharField(max_length=50)
@@ -42,6 +46,8 @@ class PlexServerConnection(models.Model):
         default="available",
     )
     last_connection_error = models.TextField(blank=True)
+    # Authenticates Plex webhook calls for this server
+    webhook_secret = models.CharField(max_length=64, blank=True)
 
     class Meta:
         unique_together = ["owner", "machine_identifier"]
@@ -96,16 +102,32 @@ class PlexServerConnection(models.Model):
         if changed:
             self.save(update_fields=["url", "direct_url", "local_url"])
 
+    def record_preferred_connection(self, url: str, latency_ms: float) -> None:
+        """Remember the endpoint that answered first and how long it took."""
+        logger.debug(f"Preferred URL for {self.name}: {url} ({latency_ms:.0f} ms)")
+        self.preferred_url = url
+        self.preferred_url_latency_ms = latency_ms
+        self.save(update_fields=["preferred_url", "preferred_url_latency_ms"])
+
+    def get_webhook_secret(self) -> str:
+        """Return the server's webhook secret, generating it on first use."""
+        if not self.webhook_secret:
+            self.webhook_secret = secrets.token_urlsafe(32)
+            self.save(update_fields=["webhook_secret"])
+        return self.webhook_secret
+
     def get_connection_urls(self) -> List[str]:
-        """Get all available connection URLs."""
+        """Get all available connection URLs, preferred endpoint first."""
         urls = []
+        if self.preferred_url:
+            urls.append(self.preferred_url)
         if self.url:
             urls.append(self.url)
         if self.direct_url:
             urls.append(self.direct_url)
         if self.local_url:
             urls.append(self.local_url)
-        return urls
+        return list(dict.fromkeys(urls))
 
     def mark_unreachable(self, error_message: str) -> None:
         """Mark server as temporarily unreachable with error message."""
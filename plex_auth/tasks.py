@@ -7,13 +7,14 @@ from celery import shared_task
 from celery.schedules import crontab
 from celery.utils.log import get_task_logger
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
 from django.utils import timezone
-from plexapi.myplex import MyPlexAccount
 
-from media_manager.tasks import sync_all_movie_libraries
+from media_manager.tasks import sync_all_catalog_libraries, sync_all_movie_libraries
 
+from .utils.account_cache import account_cache
 from .utils.exceptions import PlexManagerError
+from .utils.locks import DistributedLock
+from .utils.task_dedup import enqueue_once
 
 logger = get_task_logger(__name__)
 User = get_user_model()
@@ -29,8 +30,8 @@ def update_server_connections(user_id: int) -> dict:
         user = get_user_model().objects.get(id=user_id)
         logger.info(f"Found user: {user.username}")
 
-        account = MyPlexAccount(token=user.plex_token)
-        resources = account.resources()
+        account_cache.invalidate_resources(user.plex_token)
+        resources = account_cache.get_resources(user.plex_token)
         logger.info(f"Found {len(resources)} Plex resources")
 
         updated_count = 0
@@ -92,16 +93,13 @@ def sync_plex_libraries(self, user_id: int) -> dict:
     """
     logger.info(f"Starting library sync for user_id: {user_id}")
 
-    try:
-        # Get cache lock to prevent multiple syncs
-        lock_id = f"plex_sync_{user_id}"
-        if cache.get(lock_id):
-            logger.warning(f"Sync already in progress for user_id: {user_id}")
-            return {"status": "skipped", "message": "Sync already in progress"}
-
-        # Set lock for 30 minutes
-        cache.set(lock_id, True, timeout=1800)
+    # Prevent multiple syncs for the same user across all workers
+    lock = DistributedLock(f"plex_sync_{user_id}")
+    if not lock.acquire(heartbeat=True):
+        logger.warning(f"Sync already in progress for user_id: {user_id}")
+        return {"status": "skipped", "message": "Sync already in progress"}
 
+    try:
         try:
             user = User.objects.get(id=user_id)
         except User.DoesNotExist:
@@ -133,8 +131,8 @@ def sync_plex_libraries(self, user_id: int) -> dict:
         return {"status": "error", "message": f"Sync failed: {str(e)}"}
 
     finally:
-        # Always clear the lock
-        cache.delete(lock_id)
+        # Only releases the lock if this task still owns it
+        lock.release()
 
 
 @shared_task
@@ -160,10 +158,19 @@ def schedule_user_syncs():
 
                 next_sync = last_sync + timedelta(hours=interval_hours)
 
-                # If next sync is in the past, sync now
+                # If next sync is in the past, sync now unless one is queued
                 if next_sync <= timezone.now():
-                    sync_plex_libraries.delay(user.id)
-                    logger.info(f"Triggered immediate sync for user {user.id}")
+                    # Scheduled syncs yield to ones users are waiting on, and
+                    # dedupe separately so a queued one never swallows a
+                    # manual sync
+                    _, queued = enqueue_once(
+                        sync_plex_libraries,
+                        args=(user.id,),
+                        scope=(user.id, "scheduled"),
+                        queue="bulk",
+                    )
+                    if queued:
+                        logger.info(f"Triggered immediate sync for user {user.id}")
 
             except Exception as e:
                 logger.error(f"Error scheduling sync for user {user.id}: {str(e)}")
@@ -194,3 +201,18 @@ def setup_periodic_tasks(sender, **kwargs):
         sync_all_movie_libraries.s(),
         name="daily_movie_sync",
     )
+
+    # Shows and music follow half an hour later
+    sender.add_periodic_task(
+        crontab(hour=3, minute=30, day_of_week="mon-sat"),
+        sync_all_catalog_libraries.s(),
+        name="daily_catalog_sync",
+    )
+
+    # On Sundays the catalog is fully resynced instead, which reconciles
+    # deletions delta syncs can't see and items skipped for a missing parent
+    sender.add_periodic_task(
+        crontab(hour=3, minute=30, day_of_week="sun"),
+        sync_all_catalog_libraries.s(full=True),
+        name="weekly_full_catalog_sync",
+    )
@@ -1,5 +1,25 @@
 # plex_auth/tests/utils/__init__.py
 
+from .test_account_cache import TestPlexAccountCache
+from .test_async_plex_manager import TestAsyncPlexManager
+from .test_circuit_breaker import TestServerCircuitBreaker
+from .test_connection_pool import TestPlexConnectionPool
+from .test_http_session import TestPlexHTTPSession
+from .test_locks import TestDistributedLock
+from .test_plex_manager import TestPlexManager
+from .test_rate_limiter import TestServerRateLimiter
+from .test_task_dedup import TestEnqueueOnce
 from .text_plex_oauth import TestPlexOAuth
 
-__all__ = ["TestPlexOAuth"]
+__all__ = [
+    "TestAsyncPlexManager",
+    "TestDistributedLock",
+    "TestEnqueueOnce",
+    "TestPlexAccountCache",
+    "TestPlexConnectionPool",
+    "TestPlexHTTPSession",
+    "TestPlexManager",
+    "TestPlexOAuth",
+    "TestServerRateLimiter",
+    "TestServerCircuitBreaker",
+]
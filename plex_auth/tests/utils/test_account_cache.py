@@ -0,0 +1,71 @@
+# plex_auth/tests/utils/test_account_cache.py
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from plex_auth.utils.account_cache import PlexAccountCache
+from plex_auth.utils.token_generation import revoke_token
+
+
+@patch("plex_auth.utils.account_cache.MyPlexAccount")
+class TestPlexAccountCache(SimpleTestCase):
+    """Test the token-keyed MyPlexAccount cache"""
+
+    def setUp(self):
+        cache.clear()
+        self.cache = PlexAccountCache(ttl=300)
+
+    def test_account_is_loaded_once_per_token(self, mock_account):
+        """Test that repeated lookups reuse the same account object"""
+        first = self.cache.get_account("token")
+        second = self.cache.get_account("token")
+
+        self.assertIs(first, second)
+        mock_account.assert_called_once()
+        self.assertEqual(mock_account.call_args.kwargs["token"], "token")
+
+    def test_resources_are_cached(self, mock_account):
+        """Test that resources() is only called once within the TTL"""
+        mock_account.return_value.resources.return_value = ["server"]
+
+        self.assertEqual(self.cache.get_resources("token"), ["server"])
+        self.assertEqual(self.cache.get_resources("token"), ["server"])
+
+        mock_account.return_value.resources.assert_called_once()
+
+    def test_peek_never_contacts_plex(self, mock_account):
+        """Test that peeking at uncached resources doesn't load the account"""
+        self.assertIsNone(self.cache.peek_resources("token"))
+        mock_account.assert_not_called()
+
+    def test_invalidate(self, mock_account):
+        """Test that invalidating a token forces a fresh sign-in"""
+        self.cache.get_account("token")
+        self.cache.invalidate("token")
+        self.cache.get_account("token")
+
+        self.assertEqual(mock_account.call_count, 2)
+
+    def test_revoked_token_is_reloaded(self, mock_account):
+        """Test that a token revoked by another process isn't served from memory"""
+        self.cache.get_resources("token")
+
+        # Only the shared cache changes, as when another worker logs out
+        revoke_token("token")
+
+        self.assertIsNone(self.cache.peek_resources("token"))
+        self.cache.get_account("token")
+        self.assertEqual(mock_account.call_count, 2)
+
+    @patch("plex_auth.utils.account_cache.time.monotonic")
+    def test_expired_resources_are_refetched(self, mock_monotonic, mock_account):
+        """Test that resources are refetched once the TTL has passed"""
+        mock_monotonic.return_value = 1000
+        self.cache.get_resources("token")
+
+        mock_monotonic.return_value = 1301
+        self.cache.get_resources("token")
+
+        self.assertEqual(mock_account.return_value.resources.call_count, 2)
@@ -0,0 +1,169 @@
+# plex_auth/tests/utils/test_async_plex_manager.py
+
+from unittest.mock import MagicMock
+
+import httpx
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from plex_auth.utils.async_plex_manager import AsyncPlexManager
+from plex_auth.utils.circuit_breaker import ServerCircuitBreaker
+from plex_auth.utils.exceptions import (
+    PlexManagerError,
+    ServerBusyError,
+    ServerUnavailableError,
+)
+
+SECTIONS = {
+    "MediaContainer": {
+        "Directory": [
+            {"key": "1", "title": "Movies", "type": "movie", "Location": []},
+            {"key": "2", "title": "TV", "type": "show", "leafCount": 40},
+        ]
+    }
+}
+
+RECENT = {
+    "MediaContainer": {
+        "Metadata": [
+            {
+                "ratingKey": "101",
+                "type": "movie",
+                "title": "Heat",
+                "addedAt": 1700000000,
+                "thumb": "/library/metadata/101/thumb/1",
+                "Genre": [{"tag": "Crime"}],
+            },
+            {"ratingKey": "102", "type": "movie", "addedAt": 1700000100},
+        ]
+    }
+}
+
+GENRES = {
+    "MediaContainer": {"Directory": [{"key": "12", "title": "Action", "type": "genre"}]}
+}
+
+
+class TestAsyncPlexManager(SimpleTestCase):
+    """Test the asyncio Plex client against a mocked PMS"""
+
+    def setUp(self):
+        cache.clear()
+        self.requests = []
+        self.server_conn = MagicMock(machine_identifier="machine-1", preferred_url="")
+        self.server_conn.name = "Server"
+        self.server_conn.get_connection_urls.return_value = ["http://pms:32400"]
+
+    def tearDown(self):
+        cache.clear()
+
+    def _handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/identity":
+            return httpx.Response(200, json={"MediaContainer": {}})
+        if path == "/library/sections":
+            return httpx.Response(200, json=SECTIONS)
+        if path.endswith("/all"):
+            return httpx.Response(200, json={"MediaContainer": {"totalSize": 7}})
+        if path.endswith("/genre"):
+            return httpx.Response(200, json=GENRES)
+        if path == "/library/recentlyAdded":
+            return httpx.Response(200, json=RECENT)
+        return httpx.Response(404)
+
+    def _manager(self) -> AsyncPlexManager:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
+        return AsyncPlexManager("token", client=client)
+
+    async def test_get_libraries(self):
+        """Test that sections and their counts come back in PlexManager's shape"""
+        async with self._manager() as manager:
+            libraries = await manager.get_libraries(self.server_conn)
+
+        self.assertEqual([lib["title"] for lib in libraries], ["Movies", "TV"])
+        self.assertEqual(libraries[0]["count"], 7)
+        self.assertEqual(libraries[1]["total_episodes"], 40)
+        self.assertEqual(self.requests[0].headers["X-Plex-Token"], "token")
+
+    async def test_library_contents_takes_sync_filters(self):
+        """Test that filters are translated to PMS params like PlexManager's"""
+        async with self._manager() as manager:
+            items, total = await manager.get_library_contents(
+                self.server_conn,
+                "1",
+                filters={"year": "2024", "unwatched": True, "genre": "action"},
+            )
+            await manager.get_library_contents(
+                self.server_conn, "1", filters={"genre": "Action"}
+            )
+            missing = await manager.get_library_contents(
+                self.server_conn, "1", filters={"genre": "Western"}
+            )
+            with self.assertRaises(PlexManagerError):
+                await manager.get_library_contents(
+                    self.server_conn, "1", filters={"studio": "A24"}
+                )
+
+        self.assertEqual(total, 7)
+        self.assertEqual(missing, ([], 0))
+        paths = [request.url.path for request in self.requests]
+        self.assertEqual(paths.count("/library/sections/1/genre"), 1)
+
+        params = [r.url.params for r in self.requests if r.url.path.endswith("/all")]
+        self.assertEqual(params[0]["year"], "2024")
+        self.assertEqual(params[0]["unwatched"], "1")
+        self.assertEqual(params[0]["genre"], "12")
+        self.assertEqual(params[1]["genre"], "12")
+
+    async def test_items_match_sync_format(self):
+        """Test that rating keys and timestamps have the same types as PlexManager's"""
+        async with self._manager() as manager:
+            items = await manager.get_recently_added(self.server_conn)
+
+        self.assertEqual(items[0]["key"], 101)
+        self.assertEqual(items[0]["added_at"], 1700000000.0)
+        self.assertEqual(items[0]["genres"], ["Crime"])
+        self.assertEqual(
+            items[0]["thumb"], "http://pms:32400/library/metadata/101/thumb/1"
+        )
+        # Titles are always strings, as in PlexManager
+        self.assertEqual(items[1]["title"], "")
+        self.assertEqual(items[1]["thumb"], "")
+
+    async def test_open_circuit_skips_server(self):
+        """Test that an open circuit refuses the call without any requests"""
+        breaker = ServerCircuitBreaker("machine-1", failure_threshold=1)
+        breaker.record_failure("down")
+
+        async with self._manager() as manager:
+            with self.assertRaises(ServerUnavailableError):
+                await manager.get_libraries(self.server_conn)
+
+        self.assertEqual(self.requests, [])
+
+    @override_settings(
+        PLEX_INTERACTIVE_RATE_LIMIT=1,
+        PLEX_INTERACTIVE_RATE_BURST=1,
+        PLEX_INTERACTIVE_RATE_MAX_WAIT=0,
+    )
+    async def test_requests_draw_from_rate_limit(self):
+        """Test that PMS requests share the server's rate limit budget"""
+        async with self._manager() as manager:
+            await manager.get_recently_added(self.server_conn)
+            with self.assertRaises(ServerBusyError):
+                await manager.get_recently_added(self.server_conn)
+
+    async def test_for_servers_collects_errors(self):
+        """Test that one failing server doesn't fail the whole fan-out"""
+        down = MagicMock(machine_identifier="machine-2", preferred_url="")
+        down.name = "Down"
+        down.get_connection_urls.return_value = []
+
+        async with self._manager() as manager:
+            results = await manager.for_servers(
+                [self.server_conn, down], manager.get_recently_added
+            )
+
+        self.assertEqual(results["machine-1"][0]["title"], "Heat")
+        self.assertIsInstance(results["machine-2"], Exception)
@@ -0,0 +1,86 @@
+# plex_auth/tests/utils/test_circuit_breaker.py
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from plex_auth.utils.circuit_breaker import ServerCircuitBreaker
+from plex_auth.utils.exceptions import PlexManagerError, ServerUnavailableError
+from plex_auth.utils.plex_manager import PlexManager
+
+
+class TestServerCircuitBreaker(SimpleTestCase):
+    """Test the per-server circuit breaker"""
+
+    def setUp(self):
+        cache.clear()
+        self.breaker = ServerCircuitBreaker(
+            "machine-1", failure_threshold=2, base_backoff=30, max_backoff=100
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_opens_after_threshold(self):
+        """Test that the circuit opens after consecutive failures"""
+        self.breaker.record_failure("timeout")
+        self.assertTrue(self.breaker.allow_request())
+
+        self.breaker.record_failure("timeout")
+        self.assertEqual(self.breaker.state, ServerCircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow_request())
+
+    @patch("plex_auth.utils.circuit_breaker.time.time")
+    def test_half_open_allows_single_trial(self, mock_time):
+        """Test that only one caller gets the trial request after the backoff"""
+        mock_time.return_value = 1000
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        mock_time.return_value = 1031
+        self.assertEqual(self.breaker.state, ServerCircuitBreaker.HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+
+    @patch("plex_auth.utils.circuit_breaker.time.time")
+    def test_failed_trial_backs_off_exponentially(self, mock_time):
+        """Test that each failed trial doubles the backoff up to the maximum"""
+        mock_time.return_value = 1000
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.retry_in(), 30)
+
+        mock_time.return_value = 1031
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.retry_in(), 60)
+
+        mock_time.return_value = 1092
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.retry_in(), 100)
+
+    def test_success_closes_circuit(self):
+        """Test that a successful request resets the breaker"""
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, ServerCircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    @patch("plex_auth.utils.plex_manager.connection_pool")
+    def test_plex_manager_skips_open_server(self, mock_pool):
+        """Test that PlexManager refuses to contact a server with an open circuit"""
+        server_conn = MagicMock(machine_identifier="machine-1")
+        server_conn.name = "Test Server"
+        mock_pool.get_or_connect.side_effect = PlexManagerError("unreachable")
+        manager = PlexManager("token", session=MagicMock())
+
+        for _ in range(3):
+            with self.assertRaises(PlexManagerError):
+                manager._get_server(server_conn)
+
+        mock_pool.get_or_connect.reset_mock()
+        with self.assertRaises(ServerUnavailableError):
+            manager._get_server(server_conn)
+        mock_pool.get_or_connect.assert_not_called()
@@ -0,0 +1,89 @@
+# plex_auth/tests/utils/test_connection_pool.py
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from plex_auth.utils.connection_pool import PlexConnectionPool
+from plex_auth.utils.token_generation import revoke_token
+
+
+class TestPlexConnectionPool(SimpleTestCase):
+    """Test the process-wide PlexServer connection pool"""
+
+    def setUp(self):
+        cache.clear()
+        self.pool = PlexConnectionPool(max_size=2, ttl=60, health_check_interval=30)
+
+    def test_reuses_pooled_connection(self):
+        """Test that a second lookup returns the warm connection without reconnecting"""
+        server = MagicMock()
+        connect = MagicMock(return_value=server)
+
+        first = self.pool.get_or_connect("machine-1", "token", connect)
+        second = self.pool.get_or_connect("machine-1", "token", connect)
+
+        self.assertIs(first, server)
+        self.assertIs(second, server)
+        connect.assert_called_once()
+        self.assertEqual(self.pool.stats()["hits"], 1)
+
+    def test_connections_are_keyed_by_token(self):
+        """Test that different tokens never share a connection"""
+        self.pool.get_or_connect("machine-1", "token-a", MagicMock)
+        self.pool.get_or_connect("machine-1", "token-b", MagicMock)
+
+        self.assertEqual(self.pool.stats()["size"], 2)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused connection is evicted when the pool is full"""
+        self.pool.put("machine-1", "token", MagicMock())
+        self.pool.put("machine-2", "token", MagicMock())
+        self.pool.get("machine-1", "token")  # machine-1 is now most recently used
+        self.pool.put("machine-3", "token", MagicMock())
+
+        self.assertIsNone(self.pool.get("machine-2", "token"))
+        self.assertIsNotNone(self.pool.get("machine-1", "token"))
+        self.assertEqual(self.pool.stats()["evictions"], 1)
+
+    @patch("plex_auth.utils.connection_pool.time.monotonic")
+    def test_expired_connection_is_dropped(self, mock_monotonic):
+        """Test that connections older than the TTL are not reused"""
+        mock_monotonic.return_value = 1000
+        self.pool.put("machine-1", "token", MagicMock())
+
+        mock_monotonic.return_value = 1061
+        self.assertIsNone(self.pool.get("machine-1", "token"))
+
+    @patch("plex_auth.utils.connection_pool.time.monotonic")
+    def test_unhealthy_connection_is_dropped(self, mock_monotonic):
+        """Test that idle connections failing the health check are discarded"""
+        server = MagicMock()
+        server.query.side_effect = Exception("Connection refused")
+        mock_monotonic.return_value = 1000
+        self.pool.put("machine-1", "token", server)
+
+        mock_monotonic.return_value = 1031
+        self.assertIsNone(self.pool.get("machine-1", "token"))
+        self.assertEqual(self.pool.stats()["size"], 0)
+
+    def test_invalidate_token(self):
+        """Test dropping all connections for a token"""
+        self.pool.put("machine-1", "token-a", MagicMock())
+        self.pool.put("machine-2", "token-b", MagicMock())
+
+        self.pool.invalidate_token("token-a")
+
+        self.assertEqual(self.pool.stats()["servers"], ["machine-2"])
+
+    def test_revoked_token_is_dropped(self):
+        """Test that a token revoked by another process drops its connections"""
+        self.pool.put("machine-1", "token-a", MagicMock())
+        self.pool.put("machine-2", "token-b", MagicMock())
+
+        revoke_token("token-a")
+
+        self.assertIsNone(self.pool.get("machine-1", "token-a"))
+        self.assertIsNotNone(self.pool.get("machine-2", "token-b"))
+        self.assertEqual(self.pool.stats()["servers"], ["machine-2"])
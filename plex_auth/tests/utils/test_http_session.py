@@ -0,0 +1,67 @@
+# plex_auth/tests/utils/test_http_session.py
+
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from plex_auth.utils.http_session import (
+    build_session,
+    get_pool_stats,
+    get_probe_session,
+    get_session,
+)
+from plex_auth.utils.plex_manager import PlexManager
+
+
+class TestPlexHTTPSession(SimpleTestCase):
+    """Test the shared keep-alive HTTP session"""
+
+    def test_session_is_shared(self):
+        """Test that every caller in a process gets the same session"""
+        self.assertIs(get_session(), get_session())
+
+    def test_session_is_rebuilt_after_fork(self):
+        """Test that a forked worker doesn't reuse the parent's session"""
+        parent = get_session()
+        with patch("plex_auth.utils.http_session.os.getpid", return_value=-1):
+            self.assertIsNot(get_session(), parent)
+
+    def test_probe_session_never_retries(self):
+        """Test that probes fail fast while data requests keep their retries"""
+        probe_adapter = get_probe_session().get_adapter("https://plex.tv")
+        data_adapter = get_session().get_adapter("https://plex.tv")
+
+        self.assertIsNot(get_probe_session(), get_session())
+        self.assertEqual(probe_adapter.max_retries.total, 0)
+        self.assertGreater(data_adapter.max_retries.total, 0)
+
+    @patch("plex_auth.utils.plex_manager.PlexServer")
+    def test_connection_probe_uses_probe_session(self, mock_server):
+        """Test that a probed server is handed the retrying session afterwards"""
+        session = build_session()
+        connection, _ = PlexManager("token", session=session)._probe_url(
+            "http://10.0.0.2:32400"
+        )
+
+        self.assertIs(mock_server.call_args.kwargs["session"], get_probe_session())
+        self.assertIs(connection._session, session)
+
+    def test_pool_sizing(self):
+        """Test that per-host pool sizes are applied to the adapters"""
+        session = build_session(pool_connections=4, pool_maxsize=7)
+        adapter = session.get_adapter("https://plex.tv")
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 7)
+
+    @patch("requests.Session.request")
+    def test_default_timeout(self, mock_request):
+        """Test that requests without a timeout get the session default"""
+        session = build_session(timeout=3)
+        session.request("GET", "https://plex.tv/api/v2/user")
+
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], 3)
+
+    def test_pool_stats_empty(self):
+        """Test that a fresh session reports no host pools"""
+        self.assertEqual(get_pool_stats(build_session()), [])
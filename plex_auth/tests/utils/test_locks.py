@@ -0,0 +1,96 @@
+# plex_auth/tests/utils/test_locks.py
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from plex_auth.utils.exceptions import LockLostError
+from plex_auth.utils.locks import DistributedLock
+
+
+class TestDistributedLock(SimpleTestCase):
+    """Test the owner-token sync lock"""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_only_one_holder(self):
+        """Test that a held lock can't be acquired by another owner"""
+        first = DistributedLock("sync_1", timeout=60)
+        second = DistributedLock("sync_1", timeout=60)
+
+        self.assertTrue(first.acquire())
+        self.assertFalse(second.acquire())
+        self.assertTrue(second.is_held())
+
+        self.assertTrue(first.release())
+        self.assertTrue(second.acquire())
+        second.release()
+
+    def test_release_by_other_owner_keeps_lock(self):
+        """Test that a caller who failed to acquire can't free the lock"""
+        holder = DistributedLock("sync_1", timeout=60)
+        intruder = DistributedLock("sync_1", timeout=60)
+        holder.acquire()
+
+        self.assertFalse(intruder.acquire())
+        self.assertFalse(intruder.release())
+        self.assertTrue(holder.is_held())
+        self.assertFalse(DistributedLock("sync_1").acquire())
+
+        holder.release()
+
+    def test_extend_requires_ownership(self):
+        """Test that only the owner can extend the lock"""
+        holder = DistributedLock("sync_1", timeout=60)
+        other = DistributedLock("sync_1", timeout=60)
+        holder.acquire()
+
+        self.assertTrue(holder.extend())
+        self.assertFalse(other.extend())
+
+        holder.release()
+        self.assertFalse(holder.extend())
+
+    def test_ensure_held_raises_once_lost(self):
+        """Test that a holder can tell its heartbeat lost the lock"""
+        lock = DistributedLock("sync_1", timeout=60)
+        lock.acquire()
+        lock.ensure_held()
+
+        lock.lost = True
+        with self.assertRaises(LockLostError):
+            lock.ensure_held()
+
+        lock.release()
+
+    def test_heartbeat_extends_until_release(self):
+        """Test that the heartbeat keeps extending and stops on release"""
+        lock = DistributedLock("sync_1", timeout=0.03)
+        with patch.object(lock, "extend", return_value=True) as mock_extend:
+            self.assertTrue(lock.acquire(heartbeat=True))
+            lock._stop.wait(0.1)
+            lock.release()
+
+        self.assertGreater(mock_extend.call_count, 0)
+        self.assertIsNone(lock._heartbeat)
+
+    @patch("plex_auth.utils.locks.get_redis_client")
+    def test_uses_redis_set_nx_px(self, mock_get_client):
+        """Test that Redis locks use SET NX PX and a token-checked release"""
+        client = MagicMock()
+        client.set.return_value = True
+        release_script = MagicMock(return_value=1)
+        client.register_script.return_value = release_script
+        mock_get_client.return_value = client
+
+        lock = DistributedLock("sync_1", timeout=30)
+        self.assertTrue(lock.acquire())
+        client.set.assert_called_once_with("lock_sync_1", lock.token, nx=True, px=30000)
+
+        self.assertTrue(lock.release())
+        release_script.assert_called_once_with(keys=["lock_sync_1"], args=[lock.token])
@@ -0,0 +1,279 @@
+# plex_auth/tests/utils/test_plex_manager.py
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+from xml.etree import ElementTree
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from plexapi.exceptions import NotFound
+from plexapi.video import Movie
+
+from plex_auth.utils.exceptions import PlexManagerError
+from plex_auth.utils.plex_manager import PlexManager
+
+LISTING_XML = """
+<Video ratingKey="101" type="movie" title="Heat" year="1995" rating="8.3"
+       studio="Warner" contentRating="R" duration="10200000" addedAt="1700000000"
+       thumb="/library/metadata/101/thumb/1">
+  <Genre tag="Crime" />
+  <Director tag="Michael Mann" />
+  <Role tag="Al Pacino" />
+  <Role tag="Robert De Niro" />
+</Video>
+"""
+
+
+DETAIL_XML = """
+<Video ratingKey="101" type="movie" title="Heat">
+  <Media videoResolution="1080" videoCodec="h264" container="mkv" bitrate="9000">
+    <Part file="/movies/heat.mkv">
+      <Stream streamType="1" codec="h264" />
+      <Stream streamType="2" codec="dts" languageCode="eng" />
+    </Part>
+  </Media>
+  <Guid id="imdb://tt0113277" />
+  <Role tag="Al Pacino" />
+</Video>
+"""
+
+
+class TestPlexManager(SimpleTestCase):
+    """Test PlexManager content retrieval"""
+
+    def setUp(self):
+        cache.clear()
+        self.manager = PlexManager("token", session=MagicMock())
+        self.server_conn = MagicMock(machine_identifier="machine-1")
+        self.server = MagicMock(machineIdentifier="machine-1")
+        self.server.fetchItems.return_value = MagicMock(
+            totalSize=40000, __iter__=lambda self: iter([])
+        )
+        patcher = patch.object(PlexManager, "_get_server", return_value=self.server)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _query(self):
+        key = self.server.fetchItems.call_args.args[0]
+        return urlparse(key).path, parse_qs(urlparse(key).query)
+
+    def test_library_contents_pages_on_server(self):
+        """Test that paging is pushed down to the PMS as a single small request"""
+        items, total = self.manager.get_library_contents(
+            self.server_conn, "1", limit=50, offset=100
+        )
+
+        self.assertEqual(total, 40000)
+        self.server.fetchItems.assert_called_once()
+        kwargs = self.server.fetchItems.call_args.kwargs
+        self.assertEqual(kwargs["container_start"], 100)
+        self.assertEqual(kwargs["container_size"], 50)
+        self.assertEqual(kwargs["maxresults"], 50)
+        self.assertEqual(self._query()[0], "/library/sections/1/all")
+
+    def test_library_contents_pushes_filters(self):
+        """Test that sort and filters become PMS query parameters"""
+        self.manager.get_library_contents(
+            self.server_conn,
+            "1",
+            sort="addedAt:desc",
+            filters={"year": "2024", "unwatched": True, "content_rating": "PG"},
+        )
+
+        _, params = self._query()
+        self.assertEqual(params["sort"], ["addedAt:desc"])
+        self.assertEqual(params["year"], ["2024"])
+        self.assertEqual(params["unwatched"], ["1"])
+        self.assertEqual(params["contentRating"], ["PG"])
+
+    def test_genre_name_resolved_once(self):
+        """Test that genre names are resolved to ids through a cached lookup"""
+        action = MagicMock(key="12")
+        action.title = "Action"
+        genres = [action]
+        page = self.server.fetchItems.return_value
+        self.server.fetchItems.side_effect = lambda key, **kwargs: (
+            genres if key.endswith("/genre") else page
+        )
+
+        self.manager.get_library_contents(
+            self.server_conn, "1", filters={"genre": "action"}
+        )
+        self.manager.get_library_contents(
+            self.server_conn, "1", filters={"genre": "Action"}
+        )
+
+        keys = [call.args[0] for call in self.server.fetchItems.call_args_list]
+        self.assertEqual(sum(key.endswith("/genre") for key in keys), 1)
+        self.assertEqual(self._query()[1]["genre"], ["12"])
+
+    def test_unsupported_filter_rejected(self):
+        """Test that unknown filters raise instead of being silently ignored"""
+        with self.assertRaises(PlexManagerError):
+            self.manager.get_library_contents(
+                self.server_conn, "1", filters={"studio": "A24"}
+            )
+
+    def _listing_movie(self):
+        server = MagicMock(_baseurl="http://pms:32400/")
+        return Movie(
+            server,
+            ElementTree.fromstring(LISTING_XML),
+            initpath="/library/sections/1/all",
+        )
+
+    def test_listing_format_never_reloads(self):
+        """Test that formatting a partial listing item makes no requests"""
+        movie = self._listing_movie()
+
+        data = self.manager._format_media_item(movie)
+
+        movie._server.query.assert_not_called()
+        self.assertEqual(data["key"], 101)
+        self.assertEqual(data["year"], 1995)
+        self.assertEqual(data["added_at"], 1700000000.0)
+        self.assertEqual(data["thumb"], "http://pms:32400/library/metadata/101/thumb/1")
+        self.assertEqual(data["genres"], ["Crime"])
+        self.assertEqual(data["actors"], ["Al Pacino", "Robert De Niro"])
+        self.assertEqual(data["view_count"], 0)
+
+    def test_detail_format_fetches_in_batches(self):
+        """Test that detail mode refetches metadata in batches of rating keys"""
+        movies = [self._listing_movie() for _ in range(3)]
+        self.server.fetchItems.side_effect = lambda keys, **kwargs: movies[: len(keys)]
+
+        with override_settings(PLEX_METADATA_BATCH_SIZE=2):
+            data = self.manager._format_media_items(self.server, movies, detail=True)
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual(
+            [call.args[0] for call in self.server.fetchItems.call_args_list],
+            [[101, 101], [101]],
+        )
+
+    def test_metadata_batch_returns_detail_fields(self):
+        """Test that batched metadata comes back formatted with detail fields"""
+        server = MagicMock(_baseurl="http://pms:32400")
+        movie = Movie(server, ElementTree.fromstring(DETAIL_XML), initpath="/x")
+        self.server.fetchItems.return_value = [movie]
+
+        data = self.manager.get_metadata_batch(self.server_conn, ["101"])
+
+        self.server.fetchItems.assert_called_once_with([101], container_size=1)
+        self.assertEqual(data[0]["guids"], ["imdb://tt0113277"])
+        self.assertEqual(data[0]["cast"], ["Al Pacino"])
+        self.assertEqual(data[0]["video_resolution"], "1080")
+        self.assertEqual(len(data[0]["media"][0]["streams"]), 2)
+
+    def test_library_rating_keys_are_paged(self):
+        """Test that listing rating keys pages through the section"""
+        pages = [
+            ElementTree.fromstring(
+                '<MediaContainer totalSize="3"><Video ratingKey="1" />'
+                '<Video ratingKey="2" /></MediaContainer>'
+            ),
+            ElementTree.fromstring(
+                '<MediaContainer totalSize="3"><Video ratingKey="3" /></MediaContainer>'
+            ),
+        ]
+        self.server.query.side_effect = pages
+
+        keys = self.manager.get_library_rating_keys(self.server_conn, "1", page_size=2)
+
+        self.assertEqual(keys, ["1", "2", "3"])
+        starts = [
+            call.kwargs["headers"]["X-Plex-Container-Start"]
+            for call in self.server.query.call_args_list
+        ]
+        self.assertEqual(starts, ["0", "2"])
+
+    def test_library_pages_are_streamed(self):
+        """Test that library pages are fetched lazily one request at a time"""
+
+        class Page(list):
+            totalSize = 3
+
+        self.server.fetchItems.side_effect = [Page([1, 2]), Page([3])]
+
+        pages = self.manager.iter_library_pages(
+            self.server_conn, "1", page_size=2, filters={"updatedAt>>": 100}
+        )
+        self.assertEqual(next(pages), [1, 2])
+        self.assertEqual(self.server.fetchItems.call_count, 1)
+        self.assertEqual(list(pages), [[3]])
+
+        key = self.server.fetchItems.call_args.args[0]
+        self.assertIn("updatedAt>>=100", key)
+        self.assertEqual(self.server.fetchItems.call_args.kwargs["container_start"], 2)
+
+    def test_library_section_looked_up_by_key(self):
+        """Test that sections are looked up by key from a fresh section list"""
+        movies = MagicMock(key=1)
+        shows = MagicMock(key=3)
+        self.server.library.sections.return_value = [movies, shows]
+
+        for _ in range(2):
+            section = self.manager.get_library_section(self.server_conn, "3")
+
+        self.assertEqual(section, shows)
+        self.assertEqual(self.server.library.sections.call_count, 2)
+        self.server.library.sectionByID.assert_not_called()
+
+    def test_library_index_reused_while_section_unchanged(self):
+        """Test that every page of a library slices one cached snapshot"""
+        section = MagicMock(
+            key=1, type="movie", updatedAt=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+
+        with patch.object(
+            PlexManager, "get_library_rating_keys", return_value=["1", "2"]
+        ) as mock_keys:
+            for _ in range(3):
+                keys = self.manager.get_library_index(self.server_conn, section)
+
+        self.assertEqual(keys, ["1", "2"])
+        mock_keys.assert_called_once_with(self.server_conn, "1", libtype=1)
+
+    def test_library_index_rebuilt_when_section_updated(self):
+        """Test that a section's new updatedAt moves it to a new snapshot"""
+        section = MagicMock(
+            key=1, type="movie", updatedAt=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+
+        with patch.object(
+            PlexManager, "get_library_rating_keys", side_effect=[["1"], ["1", "2"]]
+        ) as mock_keys:
+            before = self.manager.get_library_index(self.server_conn, section)
+            section.updatedAt = datetime(2024, 1, 2, tzinfo=timezone.utc)
+            after = self.manager.get_library_index(self.server_conn, section)
+
+        self.assertEqual(before, ["1"])
+        self.assertEqual(after, ["1", "2"])
+        self.assertEqual(mock_keys.call_count, 2)
+        self.assertEqual(cache.get("library_index_machine-1_1_1704067200"), ["1"])
+        self.assertEqual(cache.get("library_index_machine-1_1_1704153600"), ["1", "2"])
+
+    def test_missing_library_section_remembered(self):
+        """Test that a missing section isn't requested again"""
+        self.server.library.sections.return_value = [MagicMock(key=1)]
+
+        for _ in range(2):
+            with self.assertRaises(NotFound):
+                self.manager.get_library_section(self.server_conn, "3")
+
+        self.server.library.sections.assert_called_once()
+
+    def test_show_format_has_counts(self):
+        """Test that shows carry their season and episode counts"""
+        data = ElementTree.fromstring(
+            '<Directory ratingKey="7" type="show" title="The Wire" '
+            'childCount="5" leafCount="60" />'
+        )
+
+        item = self.manager._format_item_data(data, "http://pms:32400")
+
+        self.assertEqual((item["season_count"], item["episode_count"]), (5, 60))
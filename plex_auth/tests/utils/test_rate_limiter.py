@@ -0,0 +1,78 @@
+# plex_auth/tests/utils/test_rate_limiter.py
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from plex_auth.utils.exceptions import ServerBusyError
+from plex_auth.utils.plex_manager import PlexManager
+from plex_auth.utils.rate_limiter import (
+    PRIORITY_INTERACTIVE,
+    PRIORITY_SYNC,
+    ServerRateLimiter,
+)
+
+
+@patch("plex_auth.utils.rate_limiter.time.time", return_value=1000.0)
+class TestServerRateLimiter(SimpleTestCase):
+    """Test the per-server token bucket"""
+
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_burst_then_wait(self, mock_time):
+        """Test that requests beyond the burst are spaced at the rate"""
+        limiter = ServerRateLimiter("machine-1", rate=2, burst=2, max_wait=5)
+
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertEqual(limiter.reserve(), 0)
+        self.assertAlmostEqual(limiter.reserve(), 0.5)
+        self.assertAlmostEqual(limiter.reserve(), 1.0)
+
+    def test_refills_over_time(self, mock_time):
+        """Test that tokens come back at the configured rate"""
+        limiter = ServerRateLimiter("machine-1", rate=2, burst=2, max_wait=0)
+        limiter.reserve()
+        limiter.reserve()
+        self.assertIsNone(limiter.reserve())
+
+        mock_time.return_value = 1000.5
+        self.assertEqual(limiter.reserve(), 0)
+
+    def test_refuses_beyond_max_wait(self, mock_time):
+        """Test that callers are refused instead of queueing indefinitely"""
+        limiter = ServerRateLimiter("machine-1", rate=1, burst=1, max_wait=0)
+        limiter.acquire()
+
+        with self.assertRaises(ServerBusyError):
+            limiter.acquire()
+
+    def test_priorities_have_separate_budgets(self, mock_time):
+        """Test that syncs can't use up the interactive budget"""
+        sync = ServerRateLimiter("machine-1", PRIORITY_SYNC, rate=1, burst=1)
+        interactive = ServerRateLimiter(
+            "machine-1", PRIORITY_INTERACTIVE, rate=1, burst=1
+        )
+        sync.max_wait = interactive.max_wait = 0
+
+        sync.acquire()
+        self.assertIsNone(sync.reserve())
+        self.assertEqual(interactive.reserve(), 0)
+
+    @patch("plex_auth.utils.plex_manager.connection_pool")
+    def test_plex_manager_throttles_requests(self, mock_pool, mock_time):
+        """Test that PlexManager takes a token per request at its priority"""
+        mock_pool.get_or_connect.return_value = MagicMock()
+        server_conn = MagicMock(machine_identifier="machine-1")
+        manager = PlexManager("token", priority=PRIORITY_SYNC)
+
+        with patch.object(ServerRateLimiter, "acquire", autospec=True) as acquire:
+            manager._get_server(server_conn)
+
+        limiter = acquire.call_args.args[0]
+        self.assertEqual(limiter.machine_identifier, "machine-1")
+        self.assertEqual(limiter.priority, PRIORITY_SYNC)
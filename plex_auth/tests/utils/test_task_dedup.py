@@ -0,0 +1,88 @@
+# plex_auth/tests/utils/test_task_dedup.py
+
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from plex_auth.utils.task_dedup import (
+    _clear_inflight,
+    enqueue_once,
+    keep_inflight,
+    release_inflight,
+)
+
+
+class TestEnqueueOnce(SimpleTestCase):
+    """Test enqueue-time coalescing of duplicate sync triggers"""
+
+    def setUp(self):
+        cache.clear()
+        self.task = MagicMock()
+        self.task.name = "media_manager.tasks.sync_movie_library"
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_duplicate_returns_existing_task(self):
+        """Test that a second trigger attaches to the queued task"""
+        task_id, queued = enqueue_once(self.task, args=(1, "m", "2"), scope=("m", "2"))
+        dup_id, dup_queued = enqueue_once(
+            self.task, args=(1, "m", "2"), scope=("m", "2")
+        )
+
+        self.assertTrue(queued)
+        self.assertFalse(dup_queued)
+        self.assertEqual(dup_id, task_id)
+        self.task.apply_async.assert_called_once_with(
+            args=(1, "m", "2"), task_id=task_id
+        )
+
+    def test_different_scope_is_queued(self):
+        """Test that other libraries are not coalesced"""
+        first_id, _ = enqueue_once(self.task, scope=("m", "1"))
+        second_id, queued = enqueue_once(self.task, scope=("m", "2"))
+
+        self.assertTrue(queued)
+        self.assertNotEqual(first_id, second_id)
+
+    def test_finished_task_frees_entry(self):
+        """Test that a new run can be queued once the task finishes"""
+        task_id, _ = enqueue_once(self.task, scope=(1,))
+
+        _clear_inflight(task_id=task_id, state="RETRY")
+        self.assertFalse(enqueue_once(self.task, scope=(1,))[1])
+
+        _clear_inflight(task_id=task_id, state="SUCCESS")
+        new_id, queued = enqueue_once(self.task, scope=(1,))
+        self.assertTrue(queued)
+        self.assertNotEqual(new_id, task_id)
+
+    def test_handed_off_entry_outlives_task(self):
+        """Test that work handed off by a task stays in flight until released"""
+        task_id, _ = enqueue_once(self.task, scope=(1,))
+
+        keep_inflight(task_id)
+        _clear_inflight(task_id=task_id, state="SUCCESS")
+        self.assertEqual(enqueue_once(self.task, scope=(1,)), (task_id, False))
+
+        release_inflight(task_id)
+        self.assertTrue(enqueue_once(self.task, scope=(1,))[1])
+
+    def test_failed_handoff_frees_entry(self):
+        """Test that a task failing after handing off doesn't block new runs"""
+        task_id, _ = enqueue_once(self.task, scope=(1,))
+
+        keep_inflight(task_id)
+        _clear_inflight(task_id=task_id, state="FAILURE")
+
+        self.assertTrue(enqueue_once(self.task, scope=(1,))[1])
+
+    def test_failed_enqueue_frees_entry(self):
+        """Test that a broker error doesn't block later triggers"""
+        self.task.apply_async.side_effect = ConnectionError("broker down")
+        with self.assertRaises(ConnectionError):
+            enqueue_once(self.task, scope=(1,))
+
+        self.task.apply_async.side_effect = None
+        self.assertTrue(enqueue_once(self.task, scope=(1,))[1])
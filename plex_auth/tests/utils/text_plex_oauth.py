@@ -23,7 +23,7 @@ class TestPlexOAuth(TestCase):
         )
         self.assertEqual(headers["Accept"], "application/json")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_pin_success(self, mock_post):
         """Test successful PIN generation with correct API response"""
         mock_response = MagicMock()
@@ -49,7 +49,7 @@ class TestPlexOAuth(TestCase):
         self.assertEqual(kwargs["data"]["strong"], "true")
         self.assertEqual(kwargs["data"]["X-Plex-Product"], "Plexify")
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_get_pin_failure(self, mock_post):
         """Test PIN generation with API failure response"""
         mock_response = MagicMock()
@@ -73,7 +73,7 @@ class TestPlexOAuth(TestCase):
         self.assertIn("clientID=" + settings.PLEX_CLIENT_IDENTIFIER, auth_url)
         self.assertIn("context[device][product]=Plexify", auth_url)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_check_pin_not_authenticated(self, mock_get):
         """Test PIN status check when authentication is pending"""
         mock_response = MagicMock()
@@ -90,7 +90,7 @@ class TestPlexOAuth(TestCase):
         result = PlexOAuth.check_pin("12345")
         self.assertIsNone(result)  # Should return None when not authenticated
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_check_pin_authenticated(self, mock_get):
         """Test PIN status check when authentication is complete"""
         auth_token = "xyz789"
@@ -111,7 +111,7 @@ class TestPlexOAuth(TestCase):
         self.assertEqual(result["authToken"], auth_token)
         self.assertEqual(result["clientIdentifier"], settings.PLEX_CLIENT_IDENTIFIER)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_check_pin_api_error(self, mock_get):
         """Test PIN status check with API error response"""
         mock_response = MagicMock()
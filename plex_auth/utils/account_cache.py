@@ -0,0 +1,126 @@
+# plex_auth/utils/account_cache.py
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from plexapi.myplex import MyPlexAccount, MyPlexResource
+
+from plex_auth.utils.http_session import get_session
+from plex_auth.utils.token_generation import get_token_generation
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedAccount:
+    """A MyPlexAccount and its resources along with their load times."""
+
+    account: Optional[MyPlexAccount] = None
+    account_loaded_at: float = 0.0
+    resources: Optional[List[MyPlexResource]] = None
+    resources_loaded_at: float = 0.0
+    generation: int = 0
+
+
+class PlexAccountCache:
+    """
+    Process-wide, token-keyed cache of MyPlexAccount objects and resource lists.
+
+    Both the account and its resources are loaded lazily on first use and
+    reused until the TTL expires, so constructing a PlexManager never talks to
+    plex.tv by itself. Entries are dropped when the token is revoked in any
+    process (see token_generation.revoke_token) or invalidated locally.
+    """
+
+    def __init__(self, ttl: Optional[int] = None):
+        self.ttl = ttl or getattr(settings, "PLEX_ACCOUNT_CACHE_TTL", 300)
+        self._entries: Dict[str, CachedAccount] = {}
+        self._lock = threading.Lock()
+        self._token_locks: Dict[str, threading.Lock] = {}
+
+    def get_account(self, token: str) -> MyPlexAccount:
+        """
+        Return the MyPlexAccount for a token, signing in to plex.tv if needed.
+
+        Raises:
+            Unauthorized: If plex.tv rejects the token
+        """
+        entry = self._get_entry(token)
+        if entry.account is not None and not self._expired(entry.account_loaded_at):
+            return entry.account
+
+        with self._get_token_lock(token):
+            if entry.account is None or self._expired(entry.account_loaded_at):
+                logger.debug("Loading MyPlexAccount for token %s...", token[:4])
+                entry.account = MyPlexAccount(token=token, session=get_session())
+                entry.account_loaded_at = time.monotonic()
+            return entry.account
+
+    def get_resources(self, token: str) -> List[MyPlexResource]:
+        """Return the account's plex.tv resources, fetching them if needed."""
+        entry = self._get_entry(token)
+        if entry.resources is not None and not self._expired(entry.resources_loaded_at):
+            return entry.resources
+
+        account = self.get_account(token)
+        with self._get_token_lock(token):
+            if entry.resources is None or self._expired(entry.resources_loaded_at):
+                logger.debug("Loading Plex resources for token %s...", token[:4])
+                entry.resources = account.resources()
+                entry.resources_loaded_at = time.monotonic()
+            return entry.resources
+
+    def peek_resources(self, token: str) -> Optional[List[MyPlexResource]]:
+        """Return cached resources without ever contacting plex.tv."""
+        generation = get_token_generation(token)
+        with self._lock:
+            entry = self._entries.get(token)
+        if entry is None or entry.resources is None or entry.generation != generation:
+            return None
+        if self._expired(entry.resources_loaded_at):
+            return None
+        return entry.resources
+
+    def invalidate(self, token: str) -> None:
+        """Forget the account and resources cached for a token."""
+        with self._lock:
+            self._entries.pop(token, None)
+            self._token_locks.pop(token, None)
+
+    def invalidate_resources(self, token: str) -> None:
+        """Forget only the resource list so the next lookup refetches it."""
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is not None:
+                entry.resources = None
+
+    def clear(self) -> None:
+        """Forget every cached account."""
+        with self._lock:
+            self._entries.clear()
+            self._token_locks.clear()
+
+    def _get_entry(self, token: str) -> CachedAccount:
+        generation = get_token_generation(token)
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry.generation != generation:
+                # New token, or revoked since it was cached
+                entry = CachedAccount(generation=generation)
+                self._entries[token] = entry
+            return entry
+
+    def _get_token_lock(self, token: str) -> threading.Lock:
+        with self._lock:
+            return self._token_locks.setdefault(token, threading.Lock())
+
+    def _expired(self, loaded_at: float) -> bool:
+        return time.monotonic() - loaded_at > self.ttl
+
+
+# Shared by every PlexManager in this process
+account_cache = PlexAccountCache()
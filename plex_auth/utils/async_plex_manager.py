@@ -0,0 +1,574 @@
+# plex_auth/utils/async_plex_manager.py
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+
+from plex_auth.utils.circuit_breaker import ServerCircuitBreaker
+from plex_auth.utils.constants import (
+    PLEX_RESOURCES_URL,
+    PREFERRED_URL_HEAD_START,
+    SERVER_CONNECT_TIMEOUT,
+)
+from plex_auth.utils.exceptions import (
+    PlexManagerError,
+    ServerBusyError,
+    ServerUnavailableError,
+)
+from plex_auth.utils.plex_manager import (
+    GENRE_CHOICES_KEY,
+    GENRE_CHOICES_TTL,
+    PlexManager,
+)
+from plex_auth.utils.rate_limiter import PRIORITY_INTERACTIVE, ServerRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+def _in_thread(func: Callable) -> Callable[..., Awaitable[Any]]:
+    """Wrap a blocking cache call so it runs outside the event loop."""
+    return sync_to_async(func, thread_sensitive=False)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class AsyncPlexManager:
+    """
+    Asyncio-native counterpart to PlexManager.
+
+    Talks to plex.tv and Plex Media Servers directly over httpx and parses the
+    JSON responses itself, so calls for several servers can run concurrently.
+    Returned dictionaries have the same shape as PlexManager's.
+
+    Server connection objects must already be loaded; this class never touches
+    the database, so it is safe to use from async views and event loops. The
+    shared circuit breakers and per-server rate limits apply as they do for
+    PlexManager; their cache calls run in worker threads so they never block
+    the event loop.
+
+    Example:
+        async with AsyncPlexManager(user.plex_token) as manager:
+            results = await manager.for_servers(servers, manager.get_libraries)
+    """
+
+    def __init__(
+        self,
+        plex_token: str,
+        client: Optional[httpx.AsyncClient] = None,
+        timeout: Optional[float] = None,
+        priority: str = PRIORITY_INTERACTIVE,
+    ):
+        self.plex_token = plex_token
+        self.priority = priority
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout or getattr(settings, "PLEX_HTTP_TIMEOUT", 10),
+            limits=httpx.Limits(
+                max_keepalive_connections=getattr(
+                    settings, "PLEX_HTTP_POOL_MAXSIZE", 10
+                ),
+            ),
+        )
+        self._base_urls: Dict[str, str] = {}
+        self._resources: Optional[List[Dict[str, Any]]] = None
+
+    async def __aenter__(self) -> "AsyncPlexManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this manager created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    def _headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        headers = {
+            "Accept": "application/json",
+            "X-Plex-Token": self.plex_token,
+            "X-Plex-Product": "Plexify",
+            "X-Plex-Client-Identifier": settings.PLEX_CLIENT_IDENTIFIER,
+        }
+        if extra:
+            headers.update(extra)
+        return headers
+
+    async def for_servers(
+        self,
+        server_conns: Iterable[Any],
+        method: Callable[..., Awaitable[Any]],
+        *args,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Run a manager method against several servers concurrently.
+
+        Args:
+            server_conns: PlexServerConnection model instances
+            method: Bound async method of this manager, e.g. ``manager.get_libraries``
+            *args, **kwargs: Passed through after the server connection
+
+        Returns:
+            Dict mapping machine_identifier to the method's result, or to the
+            exception it raised
+        """
+        server_conns = list(server_conns)
+        results = await asyncio.gather(
+            *(method(server_conn, *args, **kwargs) for server_conn in server_conns),
+            return_exceptions=True,
+        )
+        return {
+            server_conn.machine_identifier: result
+            for server_conn, result in zip(server_conns, results)
+        }
+
+    # Connection resolution
+
+    async def _fetch_resources(self) -> List[Dict[str, Any]]:
+        """Fetch the account's resources from plex.tv (cached per manager)."""
+        if self._resources is None:
+            response = await self._client.get(
+                PLEX_RESOURCES_URL,
+                headers=self._headers(),
+                params={"includeHttps": 1, "includeRelay": 1},
+            )
+            if response.status_code == 401:
+                raise PlexManagerError("Invalid Plex authentication token")
+            response.raise_for_status()
+            self._resources = response.json()
+        return self._resources
+
+    async def _probe_url(self, url: str) -> Tuple[str, float]:
+        """Check a server URL responds, returning it with the latency in ms."""
+        started = time.monotonic()
+        response = await self._client.get(
+            f"{url.rstrip('/')}/identity",
+            headers=self._headers(),
+            timeout=SERVER_CONNECT_TIMEOUT,
+        )
+        response.raise_for_status()
+        return url, (time.monotonic() - started) * 1000
+
+    async def _race_urls(self, urls: List[str], preferred_url: str = "") -> str:
+        """Probe URLs concurrently and return the first to respond."""
+        if not urls:
+            raise PlexManagerError("No connection URLs available")
+
+        tasks = {}
+        errors = []
+        try:
+            if preferred_url in urls:
+                task = asyncio.create_task(self._probe_url(preferred_url))
+                tasks[task] = preferred_url
+                done, _ = await asyncio.wait({task}, timeout=PREFERRED_URL_HEAD_START)
+                if task in done and not task.exception():
+                    return preferred_url
+
+            for url in urls:
+                if url not in tasks.values():
+                    tasks[asyncio.create_task(self._probe_url(url))] = url
+
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    url, _ = await next_done
+                    return url
+                except Exception as e:
+                    errors.append(str(e))
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        raise PlexManagerError(f"No reachable endpoint ({'; '.join(errors)})")
+
+    async def _get_base_url(self, server_conn) -> str:
+        """Resolve (and remember) a working base URL for a server."""
+        cache_key = server_conn.machine_identifier
+        if cache_key in self._base_urls:
+            return self._base_urls[cache_key]
+
+        breaker = ServerCircuitBreaker(server_conn.machine_identifier)
+        if not await _in_thread(breaker.allow_request)():
+            raise ServerUnavailableError(
+                f"{server_conn.name} is unavailable, retrying in {breaker.retry_in()}s"
+            )
+
+        urls = server_conn.get_connection_urls()
+        try:
+            url = await self._race_urls(urls, preferred_url=server_conn.preferred_url)
+        except PlexManagerError:
+            # Stored URLs are all down; ask plex.tv for the current connections
+            resources = await self._fetch_resources()
+            resource = next(
+                (
+                    r
+                    for r in resources
+                    if r.get("clientIdentifier") == server_conn.machine_identifier
+                ),
+                None,
+            )
+            fallback_urls = [
+                c["uri"]
+                for c in (resource or {}).get("connections", [])
+                if c.get("uri") not in urls
+            ]
+            try:
+                url = await self._race_urls(fallback_urls)
+            except PlexManagerError as e:
+                await _in_thread(breaker.record_failure)(str(e))
+                raise PlexManagerError(
+                    f"Failed to connect to {server_conn.name}: {str(e)}"
+                )
+
+        await _in_thread(breaker.record_success)()
+        self._base_urls[cache_key] = url.rstrip("/")
+        return self._base_urls[cache_key]
+
+    async def _query(
+        self,
+        server_conn,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        container_start: Optional[int] = None,
+        container_size: Optional[int] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        GET a PMS endpoint and return the base URL with the MediaContainer.
+
+        Raises:
+            PlexManagerError: If the server can't be reached or returns an error
+            ServerBusyError: If the server's request budget is exhausted
+        """
+        base_url = await self._get_base_url(server_conn)
+        await self._throttle(server_conn)
+        extra_headers = {}
+        if container_start is not None:
+            extra_headers["X-Plex-Container-Start"] = str(container_start)
+        if container_size is not None:
+            extra_headers["X-Plex-Container-Size"] = str(container_size)
+
+        try:
+            response = await self._client.get(
+                f"{base_url}{path}",
+                headers=self._headers(extra_headers),
+                params=params,
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            # Force re-resolution next time in case the endpoint went away
+            self._base_urls.pop(server_conn.machine_identifier, None)
+            raise PlexManagerError(f"Request to {server_conn.name} failed: {str(e)}")
+
+        return base_url, response.json().get("MediaContainer", {})
+
+    async def _throttle(self, server_conn) -> None:
+        """Wait for the server's rate limiter without blocking the event loop."""
+        limiter = ServerRateLimiter(server_conn.machine_identifier, self.priority)
+        wait = await _in_thread(limiter.reserve)()
+        if wait is None:
+            raise ServerBusyError(
+                f"Too many {self.priority} requests to {server_conn.machine_identifier}"
+            )
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    # Public API
+
+    async def discover_servers(self) -> List[Dict[str, Any]]:
+        """Fetch available Plex servers from the Plex API."""
+        try:
+            resources = await self._fetch_resources()
+            servers = []
+
+            for resource in resources:
+                provides = (resource.get("provides") or "").split(",")
+                if resource.get("product") != "Plex Media Server" or (
+                    "server" not in provides
+                ):
+                    continue
+
+                connections = resource.get("connections") or []
+                if not connections:
+                    continue
+                connection = next(
+                    (c for c in connections if not c.get("local")), connections[0]
+                )
+
+                servers.append(
+                    {
+                        "name": resource.get("name"),
+                        "url": connection.get("uri"),
+                        "machine_identifier": resource.get("clientIdentifier"),
+                        "version": resource.get("productVersion"),
+                        "token": self.plex_token,
+                        "owned": resource.get("owned", False),
+                        "local": connection.get("local", False),
+                        "status": "available",
+                    }
+                )
+
+            return servers
+
+        except Exception as e:
+            logger.error("Error discovering servers: %s", str(e), exc_info=True)
+            return []
+
+    async def get_libraries(self, server_conn) -> List[Dict[str, Any]]:
+        """Fetch libraries with basic metadata; item counts are fetched concurrently."""
+        try:
+            base_url, container = await self._query(server_conn, "/library/sections")
+            sections = container.get("Directory", [])
+
+            counts = await asyncio.gather(
+                *(
+                    self._query(
+                        server_conn,
+                        f"/library/sections/{section['key']}/all",
+                        params={"includeCollections": 0},
+                        container_start=0,
+                        container_size=0,
+                    )
+                    for section in sections
+                )
+            )
+
+            libraries = []
+            for section, (_, count_container) in zip(sections, counts):
+                section_type = section.get("type")
+                base_info = {
+                    "key": section.get("key"),
+                    "title": section.get("title"),
+                    "type": section_type,
+                    "count": count_container.get("totalSize", 0),
+                    "thumb": self._make_url(base_url, section.get("thumb")),
+                    "art": self._make_url(base_url, section.get("art")),
+                    "agent": section.get("agent"),
+                    "scanner": section.get("scanner"),
+                    "language": section.get("language"),
+                    "locations": [
+                        location.get("path") for location in section.get("Location", [])
+                    ],
+                    "refreshing": section.get("refreshing", False),
+                    "updated_at": section.get("updatedAt"),
+                }
+
+                if section_type == "movie":
+                    base_info.update(
+                        {
+                            "unwatched_count": section.get("unwatchedCount", 0),
+                            "total_duration": section.get("duration", 0),
+                        }
+                    )
+                elif section_type == "show":
+                    base_info.update(
+                        {
+                            "total_episodes": section.get("leafCount", 0),
+                            "unwatched_episodes": section.get("unwatchedLeafCount", 0),
+                        }
+                    )
+                elif section_type == "artist":
+                    base_info.update(
+                        {
+                            "total_albums": section.get("albumCount", 0),
+                            "total_tracks": section.get("leafCount", 0),
+                        }
+                    )
+
+                libraries.append(base_info)
+
+            return libraries
+
+        except PlexManagerError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching libraries: {str(e)}")
+            raise PlexManagerError(f"Failed to fetch libraries: {str(e)}")
+
+    async def get_library_contents(
+        self,
+        server_conn,
+        library_key: str,
+        sort: str = "titleSort",
+        limit: int = 50,
+        offset: int = 0,
+        filters: Optional[Dict] = None,
+    ) -> Tuple[List[Dict], int]:
+        """
+        Fetch one page of a library; sorting, filtering and paging run on the PMS.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            library_key: Library section key
+            sort: PMS sort field, optionally with direction (e.g. 'addedAt:desc')
+            limit: Number of items to return
+            offset: Starting offset for pagination
+            filters: Optional dictionary of filters, as PlexManager takes them;
+                supports year, genre (name or id), unwatched and content_rating
+
+        Returns:
+            Tuple of (items list, total count)
+        """
+        try:
+            genre_choices = None
+            if PlexManager.needs_genre_choices(filters):
+                genre_choices = await self._get_genre_choices(server_conn, library_key)
+            params = PlexManager.build_library_params(sort, filters, genre_choices)
+            if params is None:
+                # No such genre in this library, so nothing can match
+                return [], 0
+
+            base_url, container = await self._query(
+                server_conn,
+                f"/library/sections/{library_key}/all",
+                params=params,
+                container_start=offset,
+                container_size=limit,
+            )
+            items = [
+                self._format_metadata(item, base_url)
+                for item in container.get("Metadata", [])
+            ]
+            return items, container.get("totalSize", len(items))
+
+        except PlexManagerError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching library contents: {str(e)}")
+            raise PlexManagerError(f"Failed to fetch library contents: {str(e)}")
+
+    async def _get_genre_choices(self, server_conn, library_key: str) -> Dict[str, str]:
+        """Return a section's genre ids by lowercased name, cached like PlexManager's."""
+        cache_key = GENRE_CHOICES_KEY.format(
+            server_conn.machine_identifier, library_key
+        )
+        choices = await _in_thread(cache.get)(cache_key)
+        if choices is None:
+            _, container = await self._query(
+                server_conn, f"/library/sections/{library_key}/genre"
+            )
+            choices = {
+                str(choice["title"]).lower(): str(choice["key"])
+                for choice in container.get("Directory", [])
+            }
+            await _in_thread(cache.set)(cache_key, choices, GENRE_CHOICES_TTL)
+        return choices
+
+    async def get_recently_added(
+        self, server_conn, limit: int = 12
+    ) -> List[Dict[str, Any]]:
+        """Get recently added items from a server."""
+        try:
+            base_url, container = await self._query(
+                server_conn,
+                "/library/recentlyAdded",
+                container_start=0,
+                container_size=limit,
+            )
+            return [
+                self._format_metadata(item, base_url)
+                for item in container.get("Metadata", [])[:limit]
+            ]
+
+        except PlexManagerError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching recent items: {str(e)}")
+            raise PlexManagerError(f"Failed to fetch recent items: {str(e)}")
+
+    async def get_on_deck(self, server_conn, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get on deck items from a server, with playback progress."""
+        try:
+            base_url, container = await self._query(
+                server_conn,
+                "/library/onDeck",
+                container_start=0,
+                container_size=limit,
+            )
+
+            on_deck = []
+            for item in container.get("Metadata", [])[:limit]:
+                item_data = self._format_metadata(item, base_url)
+                progress = 0
+                if item.get("duration"):
+                    progress = (item.get("viewOffset", 0) / item["duration"]) * 100
+                item_data["progress"] = round(progress, 1)
+                on_deck.append(item_data)
+
+            return on_deck
+
+        except PlexManagerError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching on deck items: {str(e)}")
+            raise PlexManagerError(f"Failed to fetch on deck items: {str(e)}")
+
+    # Formatting
+
+    @staticmethod
+    def _make_url(base_url: str, path: Optional[str]) -> str:
+        if not path:
+            return ""
+        if path.startswith("http"):
+            return path
+        return f"{base_url}{path}"
+
+    def _format_metadata(self, item: Dict[str, Any], base_url: str) -> Dict[str, Any]:
+        """Format a PMS Metadata JSON object like PlexManager._format_media_item."""
+        item_type = item.get("type")
+        base_info = {
+            "key": int(item["ratingKey"]) if item.get("ratingKey") else None,
+            "title": item.get("title", ""),
+            "type": item_type,
+            "thumb": self._make_url(base_url, item.get("thumb")),
+            "art": self._make_url(base_url, item.get("art")),
+            "added_at": _to_float(item.get("addedAt")),
+            "updated_at": _to_float(item.get("updatedAt")),
+            "year": item.get("year"),
+            "rating": item.get("rating"),
+            "summary": item.get("summary", ""),
+            "duration": item.get("duration"),
+            "view_count": item.get("viewCount", 0),
+            "view_offset": item.get("viewOffset", 0),
+        }
+
+        if item_type == "movie":
+            base_info.update(
+                {
+                    "studio": item.get("studio", ""),
+                    "content_rating": item.get("contentRating", ""),
+                    "genres": [tag["tag"] for tag in item.get("Genre", [])],
+                    "directors": [tag["tag"] for tag in item.get("Director", [])],
+                    "actors": [tag["tag"] for tag in item.get("Role", [])][:5],
+                }
+            )
+        elif item_type in ("show", "episode"):
+            is_episode = item_type == "episode"
+            base_info.update(
+                {
+                    "show_title": (
+                        item.get("grandparentTitle")
+                        if is_episode
+                        else item.get("title")
+                    ),
+                    "season_number": item.get("parentIndex") if is_episode else None,
+                    "episode_number": item.get("index") if is_episode else None,
+                    "episode_title": item.get("title") if is_episode else None,
+                }
+            )
+            if not is_episode:
+                base_info.update(
+                    {
+                        "season_count": item.get("childCount", 0),
+                        "episode_count": item.get("leafCount", 0),
+                    }
+                )
+
+        return base_info
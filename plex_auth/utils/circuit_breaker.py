@@ -0,0 +1,115 @@
+# plex_auth/utils/circuit_breaker.py
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class ServerCircuitBreaker:
+    """
+    Per-server circuit breaker shared through the Django cache.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests to the server are refused until the backoff expires. The circuit
+    then goes half-open and lets a single trial request through: success
+    closes it, failure re-opens it with an exponentially longer backoff.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        machine_identifier: str,
+        failure_threshold: Optional[int] = None,
+        base_backoff: Optional[int] = None,
+        max_backoff: Optional[int] = None,
+    ):
+        self.machine_identifier = machine_identifier
+        self.failure_threshold = failure_threshold or getattr(
+            settings, "PLEX_CIRCUIT_FAILURE_THRESHOLD", 3
+        )
+        self.base_backoff = base_backoff or getattr(
+            settings, "PLEX_CIRCUIT_BASE_BACKOFF", 30
+        )
+        self.max_backoff = max_backoff or getattr(
+            settings, "PLEX_CIRCUIT_MAX_BACKOFF", 900
+        )
+        self.cache_key = f"circuit_{machine_identifier}"
+        self.probe_key = f"circuit_probe_{machine_identifier}"
+
+    def _load(self) -> Dict[str, Any]:
+        return cache.get(self.cache_key) or {
+            "state": self.CLOSED,
+            "failures": 0,
+            "trips": 0,
+            "retry_at": 0,
+            "last_error": "",
+        }
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        # Keep the record around well past the longest backoff
+        cache.set(self.cache_key, data, timeout=self.max_backoff * 4)
+
+    @property
+    def state(self) -> str:
+        """Current state, reporting an expired open circuit as half-open."""
+        data = self._load()
+        if data["state"] == self.OPEN and time.time() >= data["retry_at"]:
+            return self.HALF_OPEN
+        return data["state"]
+
+    def is_open(self) -> bool:
+        """True while requests to the server should be skipped entirely."""
+        return self.state == self.OPEN
+
+    def retry_in(self) -> int:
+        """Seconds until the circuit allows a trial request."""
+        return max(0, int(self._load()["retry_at"] - time.time()))
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request to the server may be made.
+
+        In the half-open state only one caller across the cluster wins the
+        trial slot; everyone else is refused until the trial resolves.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN:
+            return False
+        return cache.add(self.probe_key, True, timeout=self.base_backoff)
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        data = self._load()
+        if data["state"] != self.CLOSED or data["failures"]:
+            logger.info(f"Circuit for server {self.machine_identifier} closed")
+            cache.delete(self.cache_key)
+        cache.delete(self.probe_key)
+
+    def record_failure(self, error: str = "") -> None:
+        """Count a failed request, opening the circuit when needed."""
+        data = self._load()
+        data["failures"] += 1
+        data["last_error"] = error
+
+        was_trial = data["state"] == self.OPEN
+        if was_trial or data["failures"] >= self.failure_threshold:
+            backoff = min(self.base_backoff * (2 ** data["trips"]), self.max_backoff)
+            data["state"] = self.OPEN
+            data["trips"] += 1
+            data["retry_at"] = time.time() + backoff
+            logger.warning(
+                f"Circuit for server {self.machine_identifier} opened for {backoff}s: {error}"
+            )
+
+        self._save(data)
+        cache.delete(self.probe_key)
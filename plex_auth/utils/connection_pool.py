@@ -0,0 +1,220 @@
+# plex_auth/utils/connection_pool.py
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from plexapi.server import PlexServer
+
+from plex_auth.utils.http_session import get_probe_session
+from plex_auth.utils.token_generation import get_token_generation
+
+logger = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, str]
+
+
+@dataclass
+class PooledServer:
+    """A connected PlexServer along with its bookkeeping timestamps."""
+
+    server: PlexServer
+    created_at: float
+    last_checked: float
+    generation: int = 0
+
+
+class PlexConnectionPool:
+    """
+    Process-wide, thread-safe pool of connected PlexServer instances.
+
+    Connections are keyed by (machine_identifier, token) so they can be shared
+    across PlexManager instances, requests and Celery tasks running in the same
+    process. Entries expire after a TTL, are health checked when they have been
+    idle for longer than the check interval, and the least recently used entry
+    is evicted once the pool is full. Connections for a token revoked in any
+    process are dropped on their next lookup.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[int] = None,
+        health_check_interval: Optional[int] = None,
+    ):
+        self.max_size = max_size or getattr(settings, "PLEX_CONNECTION_POOL_SIZE", 32)
+        self.ttl = ttl or getattr(settings, "PLEX_CONNECTION_POOL_TTL", 900)
+        self.health_check_interval = health_check_interval or getattr(
+            settings, "PLEX_CONNECTION_HEALTH_CHECK_INTERVAL", 60
+        )
+        self._entries: "OrderedDict[PoolKey, PooledServer]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: Dict[PoolKey, threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_connect(
+        self,
+        machine_identifier: str,
+        token: str,
+        connect: Callable[[], PlexServer],
+    ) -> PlexServer:
+        """
+        Return a warm connection for the server, connecting if necessary.
+
+        Only one thread per key runs ``connect`` at a time; concurrent callers
+        wait for it and then share the resulting connection.
+
+        Args:
+            machine_identifier: Plex server machine identifier
+            token: Plex token the connection is authenticated with
+            connect: Callable that resolves and returns a new PlexServer
+
+        Returns:
+            Connected PlexServer instance
+        """
+        key = (machine_identifier, token)
+
+        server = self.get(machine_identifier, token)
+        if server is not None:
+            return server
+
+        with self._get_key_lock(key):
+            # Another thread may have connected while we were waiting
+            server = self.get(machine_identifier, token, count_miss=False)
+            if server is not None:
+                return server
+
+            server = connect()
+            self.put(machine_identifier, token, server)
+            return server
+
+    def get(
+        self, machine_identifier: str, token: str, count_miss: bool = True
+    ) -> Optional[PlexServer]:
+        """Return a pooled connection if one exists and is still usable."""
+        key = (machine_identifier, token)
+        now = time.monotonic()
+        generation = get_token_generation(token)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if count_miss:
+                    self._misses += 1
+                return None
+
+            if entry.generation != generation:
+                logger.debug(f"Token for {machine_identifier} was revoked")
+                del self._entries[key]
+                if count_miss:
+                    self._misses += 1
+                return None
+
+            if now - entry.created_at > self.ttl:
+                logger.debug(f"Pooled connection to {machine_identifier} expired")
+                del self._entries[key]
+                if count_miss:
+                    self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            needs_check = now - entry.last_checked > self.health_check_interval
+
+        # Health checks hit the network, so never run them under the pool lock
+        if needs_check and not self._is_healthy(entry):
+            logger.info(
+                f"Pooled connection to {machine_identifier} failed health check"
+            )
+            self.invalidate(machine_identifier, token)
+            if count_miss:
+                with self._lock:
+                    self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return entry.server
+
+    def put(self, machine_identifier: str, token: str, server: PlexServer) -> None:
+        """Add a connection to the pool, evicting the least recently used if full."""
+        key = (machine_identifier, token)
+        now = time.monotonic()
+        generation = get_token_generation(token)
+
+        with self._lock:
+            self._entries[key] = PooledServer(
+                server=server,
+                created_at=now,
+                last_checked=now,
+                generation=generation,
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._key_locks.pop(evicted_key, None)
+                self._evictions += 1
+                logger.debug(f"Evicted pooled connection to {evicted_key[0]}")
+
+    def invalidate(self, machine_identifier: str, token: Optional[str] = None) -> None:
+        """
+        Drop pooled connections for a server.
+
+        Args:
+            machine_identifier: Plex server machine identifier
+            token: Only drop the connection for this token if provided
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if key[0] == machine_identifier and (token is None or key[1] == token):
+                    del self._entries[key]
+
+    def invalidate_token(self, token: str) -> None:
+        """Drop every pooled connection authenticated with the given token."""
+        with self._lock:
+            for key in list(self._entries):
+                if key[1] == token:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all pooled connections."""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool usage statistics (without exposing tokens)."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "servers": [key[0] for key in self._entries],
+            }
+
+    def _get_key_lock(self, key: PoolKey) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _is_healthy(self, entry: PooledServer) -> bool:
+        """Ping the server's identity endpoint to confirm the connection still works."""
+        try:
+            entry.server.query("/identity", method=get_probe_session().get, timeout=5)
+        except Exception as e:
+            logger.debug(f"Health check failed: {str(e)}")
+            return False
+
+        entry.last_checked = time.monotonic()
+        return True
+
+
+# Shared by every PlexManager in this process
+connection_pool = PlexConnectionPool()
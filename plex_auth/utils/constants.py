@@ -10,6 +10,11 @@ PLEX_RESOURCES_URL: Final = f"{PLEX_API_BASE}/resources"
 
 # Request timeouts (in seconds)
 REQUEST_TIMEOUT: Final = 10
+SERVER_CONNECT_TIMEOUT: Final = 5
+PREFERRED_URL_HEAD_START: Final = 0.5
+
+# Rating keys per /library/metadata/<k1,k2,...> request
+METADATA_BATCH_SIZE: Final = 50
 
 # HTTP Status codes
 HTTP_CREATED: Final = 201
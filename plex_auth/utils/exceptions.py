@@ -5,3 +5,21 @@ class PlexManagerError(Exception):
     """Custom exception for Plex API related errors"""
 
     pass
+
+
+class ServerUnavailableError(PlexManagerError):
+    """Raised without contacting a server while its circuit breaker is open"""
+
+    pass
+
+
+class ServerBusyError(ServerUnavailableError):
+    """Raised without contacting a server whose request budget is exhausted"""
+
+    pass
+
+
+class LockLostError(Exception):
+    """Raised when a distributed lock expired or was taken over while held"""
+
+    pass
@@ -0,0 +1,159 @@
+# plex_auth/utils/http_session.py
+
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from plex_auth.utils.constants import REQUEST_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class PlexSession(requests.Session):
+    """
+    requests.Session that applies a default timeout to every request.
+
+    requests has no session-level timeout, and a call without one can hang a
+    worker forever, so callers that don't pass ``timeout`` get the default.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        super().__init__()
+        self.default_timeout = timeout or REQUEST_TIMEOUT
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+def build_session(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    max_retries: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> PlexSession:
+    """
+    Build a keep-alive session with pooled connections for Plex traffic.
+
+    Args:
+        pool_connections: Number of per-host connection pools to keep
+        pool_maxsize: Maximum number of connections kept open per host
+        max_retries: Retries for idempotent requests on connection errors and 502/503/504
+        timeout: Default request timeout in seconds
+
+    Returns:
+        Configured PlexSession
+    """
+    session = PlexSession(
+        timeout=timeout or getattr(settings, "PLEX_HTTP_TIMEOUT", REQUEST_TIMEOUT)
+    )
+
+    retries = Retry(
+        total=(
+            max_retries
+            if max_retries is not None
+            else getattr(settings, "PLEX_HTTP_MAX_RETRIES", 2)
+        ),
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections
+        or getattr(settings, "PLEX_HTTP_POOL_CONNECTIONS", 16),
+        pool_maxsize=pool_maxsize or getattr(settings, "PLEX_HTTP_POOL_MAXSIZE", 10),
+        max_retries=retries,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+# Shared sessions by name, with the pid of the process that built them
+_sessions: Dict[str, Tuple[int, PlexSession]] = {}
+_session_lock = threading.Lock()
+
+
+def _get_shared_session(name: str, **options) -> PlexSession:
+    """
+    Return the process-wide session with the given name, building it if needed.
+
+    Sessions are rebuilt after a fork (gunicorn and Celery prefork workers)
+    so that processes never share pooled sockets.
+    """
+    pid = os.getpid()
+    entry = _sessions.get(name)
+    if entry is not None and entry[0] == pid:
+        return entry[1]
+
+    with _session_lock:
+        entry = _sessions.get(name)
+        if entry is None or entry[0] != pid:
+            logger.debug(f"Creating shared Plex HTTP session {name} for process {pid}")
+            entry = (pid, build_session(**options))
+            _sessions[name] = entry
+        return entry[1]
+
+
+def get_session() -> PlexSession:
+    """Return the process-wide session shared by all Plex data requests."""
+    return _get_shared_session("default")
+
+
+def get_probe_session() -> PlexSession:
+    """
+    Return the process-wide session for connection probes and health checks.
+
+    Probes never retry: they have short timeouts of their own, and retrying
+    a dead URL would multiply the time before a connection race falls over
+    to the next URL or the circuit breaker opens.
+    """
+    return _get_shared_session("probe", max_retries=0)
+
+
+def get_pool_stats(session: Optional[requests.Session] = None) -> List[Dict[str, Any]]:
+    """
+    Return per-host connection pool statistics for tuning pool sizes.
+
+    Each entry reports the host, how many connections have been opened, how
+    many requests were served, and how many idle connections are available
+    for reuse.
+    """
+    session = session or get_session()
+    stats = []
+    seen = set()
+
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            try:
+                pool = pools[key]
+            except KeyError:
+                # Evicted between keys() and lookup
+                continue
+
+            stats.append(
+                {
+                    "scheme": pool.scheme,
+                    "host": pool.host,
+                    "port": pool.port,
+                    "maxsize": pool.pool.maxsize if pool.pool else 0,
+                    "idle_connections": pool.pool.qsize() if pool.pool else 0,
+                    "connections_opened": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+            )
+
+    return stats
@@ -0,0 +1,189 @@
+# plex_auth/utils/locks.py
+
+import logging
+import threading
+import uuid
+from typing import Optional
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+
+from plex_auth.utils.exceptions import LockLostError
+
+logger = logging.getLogger(__name__)
+
+# Only delete or extend the key while it still holds our token
+RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+EXTEND_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_redis_client = None
+_redis_lock = threading.Lock()
+
+
+def get_redis_client():
+    """
+    Return the shared Redis client for REDIS_URL, or None if it isn't set.
+
+    The client keeps its own connection pool and is safe to share between
+    threads.
+    """
+    global _redis_client
+
+    url = getattr(settings, "REDIS_URL", None)
+    if not url:
+        return None
+
+    if _redis_client is None:
+        with _redis_lock:
+            if _redis_client is None:
+                _redis_client = redis.Redis.from_url(url)
+    return _redis_client
+
+
+class DistributedLock:
+    """
+    Mutual exclusion across every web and worker process.
+
+    With REDIS_URL set the lock is a Redis key taken with ``SET NX PX`` and
+    holding a random owner token; release and extension are Lua scripts that
+    only act while the key still holds that token, so a holder whose lock
+    expired can never free someone else's. Without Redis the lock falls back
+    to an atomic ``cache.add``, which is only shared as widely as the cache
+    backend is.
+
+    Locks expire after ``timeout`` seconds so a crashed holder can't block
+    others for long; long-running holders start a heartbeat that keeps
+    extending the lock until it is released.
+
+    Usage:
+        lock = DistributedLock(f"movie_sync_{server_id}_{library_key}")
+        if not lock.acquire(heartbeat=True):
+            return  # someone else holds it
+        try:
+            ...
+        finally:
+            lock.release()
+    """
+
+    def __init__(self, name: str, timeout: Optional[int] = None):
+        self.key = f"lock_{name}"
+        self.timeout = timeout or getattr(settings, "PLEX_SYNC_LOCK_TIMEOUT", 300)
+        self.token = uuid.uuid4().hex
+        self.lost = False
+        self._redis = get_redis_client()
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def acquire(self, heartbeat: bool = False) -> bool:
+        """
+        Try to take the lock without waiting.
+
+        Args:
+            heartbeat: Keep extending the lock in the background until release
+
+        Returns:
+            bool: Whether the lock was acquired
+        """
+        if self._redis is not None:
+            acquired = bool(
+                self._redis.set(
+                    self.key, self.token, nx=True, px=int(self.timeout * 1000)
+                )
+            )
+        else:
+            acquired = cache.add(self.key, self.token, timeout=self.timeout)
+
+        if acquired and heartbeat:
+            self._start_heartbeat()
+        return acquired
+
+    def extend(self) -> bool:
+        """
+        Reset the lock's expiry if we still own it.
+
+        Returns:
+            bool: False if the lock expired or was taken over
+        """
+        if self._redis is not None:
+            script = self._redis.register_script(EXTEND_SCRIPT)
+            return bool(
+                script(keys=[self.key], args=[self.token, int(self.timeout * 1000)])
+            )
+
+        if cache.get(self.key) != self.token:
+            return False
+        return cache.touch(self.key, self.timeout)
+
+    def release(self) -> bool:
+        """
+        Release the lock if we still own it.
+
+        Returns:
+            bool: False if the lock had already expired or been taken over
+        """
+        self._stop_heartbeat()
+
+        if self._redis is not None:
+            script = self._redis.register_script(RELEASE_SCRIPT)
+            released = bool(script(keys=[self.key], args=[self.token]))
+        elif cache.get(self.key) == self.token:
+            # Not atomic, but the window is tiny and the cache fallback is
+            # only meant for single-host setups
+            released = cache.delete(self.key)
+        else:
+            released = False
+
+        if not released:
+            logger.warning(f"Lock {self.key} was no longer held at release")
+        return released
+
+    def ensure_held(self) -> None:
+        """
+        Check that the heartbeat hasn't lost the lock.
+
+        Raises:
+            LockLostError: If the lock expired or was taken over
+        """
+        if self.lost:
+            raise LockLostError(f"Lock {self.key} is no longer held")
+
+    def is_held(self) -> bool:
+        """Whether anyone currently holds the lock."""
+        if self._redis is not None:
+            return bool(self._redis.exists(self.key))
+        return cache.get(self.key) is not None
+
+    def _start_heartbeat(self) -> None:
+        self._stop.clear()
+        self._heartbeat = threading.Thread(
+            target=self._run_heartbeat, name=f"heartbeat-{self.key}", daemon=True
+        )
+        self._heartbeat.start()
+
+    def _stop_heartbeat(self) -> None:
+        if self._heartbeat is not None:
+            self._stop.set()
+            self._heartbeat.join()
+            self._heartbeat = None
+
+    def _run_heartbeat(self) -> None:
+        # Extend well before expiry so one slow round trip can't lose the lock
+        while not self._stop.wait(self.timeout / 3):
+            try:
+                if not self.extend():
+                    self.lost = True
+                    logger.error(f"Lost lock {self.key} while holding it")
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to extend lock {self.key}: {str(e)}")
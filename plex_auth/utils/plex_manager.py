@@ -1,36 +1,72 @@
 # plex_auth/utils/plex_manager.py
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode
 
+import requests
+from django.conf import settings
+from django.core.cache import cache
 from plexapi.exceptions import NotFound, Unauthorized
-from plexapi.myplex import MyPlexAccount
+from plexapi.library import FilterChoice, LibrarySection
+from plexapi.myplex import MyPlexAccount, MyPlexResource
 from plexapi.server import PlexServer
-from plexapi.video import Episode, Movie, Show
+from plexapi.utils import searchType
+from requests.exceptions import RequestException
 
-from plex_auth.utils.exceptions import PlexManagerError
+from plex_auth.utils.account_cache import account_cache
+from plex_auth.utils.circuit_breaker import ServerCircuitBreaker
+from plex_auth.utils.connection_pool import connection_pool
+from plex_auth.utils.constants import (
+    METADATA_BATCH_SIZE,
+    PREFERRED_URL_HEAD_START,
+    SERVER_CONNECT_TIMEOUT,
+)
+from plex_auth.utils.exceptions import PlexManagerError, ServerUnavailableError
+from plex_auth.utils.http_session import get_probe_session, get_session
+from plex_auth.utils.rate_limiter import PRIORITY_INTERACTIVE, ServerRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Genre ids by name for a section, shared with AsyncPlexManager
+GENRE_CHOICES_KEY = "genre_choices_{}_{}"
+GENRE_CHOICES_TTL = 3600  # seconds
+
 
 class PlexManager:
     """
     Enhanced utility class for interacting with the Plex API using plexapi library.
     Handles server discovery, content retrieval, and connection management.
+
+    Requests to a server draw from its rate limit budget for ``priority``:
+    interactive for page views, sync for background work.
     """
 
-    def __init__(self, plex_token: str):
+    def __init__(
+        self,
+        plex_token: str,
+        session: Optional[requests.Session] = None,
+        priority: str = PRIORITY_INTERACTIVE,
+    ):
         self.plex_token = plex_token
+        self.session = session or get_session()
+        self.priority = priority
         self._account = None
-        self._servers: Dict[str, PlexServer] = {}  # Cache for server connections
-        self._initialize_account()
+
+    @property
+    def account(self) -> MyPlexAccount:
+        """The MyPlexAccount for this token, loaded from plex.tv on first use."""
+        if self._account is None:
+            self._initialize_account()
+        return self._account
 
     def _initialize_account(self) -> None:
-        """Initialize Plex account connection."""
+        """Initialize Plex account connection from the shared account cache."""
         try:
-            self._account = MyPlexAccount(token=self.plex_token)
+            self._account = account_cache.get_account(self.plex_token)
         except Unauthorized as e:
             logger.error(f"Invalid or expired Plex token: {str(e)}")
             raise PlexManagerError("Invalid Plex authentication token")
@@ -38,57 +74,235 @@ class PlexManager:
             logger.error(f"Failed to initialize Plex account: {str(e)}")
             raise PlexManagerError(f"Could not connect to Plex: {str(e)}")
 
-    @lru_cache(maxsize=8)
+    def _get_resources(self, refresh: bool = False) -> List[MyPlexResource]:
+        """Get the account's plex.tv resources from the shared account cache."""
+        if refresh:
+            account_cache.invalidate_resources(self.plex_token)
+        try:
+            return account_cache.get_resources(self.plex_token)
+        except Unauthorized as e:
+            logger.error(f"Invalid or expired Plex token: {str(e)}")
+            raise PlexManagerError("Invalid Plex authentication token")
+
     def _get_server(self, server_conn) -> PlexServer:
         """
-        Get or create a cached server connection using PlexAPI's built-in connection resolution.
+        Get a warm server connection from the process-wide connection pool,
+        resolving a new connection only when none is pooled.
+
+        Each call takes one request from the server's rate limit budget.
+
+        Raises:
+            ServerUnavailableError: If the server's circuit breaker is open
+            ServerBusyError: If the server's request budget is exhausted
         """
-        cache_key = server_conn.machine_identifier
-        if cache_key not in self._servers:
+        breaker = ServerCircuitBreaker(server_conn.machine_identifier)
+        if not breaker.allow_request():
+            raise ServerUnavailableError(
+                f"{server_conn.name} is unavailable, retrying in {breaker.retry_in()}s"
+            )
+
+        self._throttle(server_conn.machine_identifier)
+
+        try:
+            server = connection_pool.get_or_connect(
+                server_conn.machine_identifier,
+                self.plex_token,
+                lambda: self._connect(server_conn),
+            )
+        except PlexManagerError as e:
+            breaker.record_failure(str(e))
+            raise
+
+        breaker.record_success()
+        return server
+
+    def _throttle(self, machine_identifier: str) -> None:
+        """Wait for the server's rate limiter before sending a request."""
+        ServerRateLimiter(machine_identifier, self.priority).acquire()
+
+    def _connect(self, server_conn) -> PlexServer:
+        """
+        Create a new server connection.
+
+        The stored URLs for the server are probed in parallel and the first
+        healthy responder wins; plex.tv resource connections join the race if
+        they are already cached. plex.tv is only contacted when none of the
+        stored URLs respond. The endpoint that won last time gets a short head
+        start, and the new winner is stored on the server connection for the
+        next cold connect.
+        """
+        try:
+            urls = server_conn.get_connection_urls()
+            urls.extend(self._get_resource_urls(server_conn, fetch=False))
+            urls = list(dict.fromkeys(urls))
+
             try:
-                # Use already initialized account instead of creating new one
-                server_resource = self._account.resource(server_conn.machine_identifier)
-
-                # First try local URL if available (faster)
-                if server_conn.local_url:
-                    try:
-                        connection = PlexServer(
-                            server_conn.local_url, self.plex_token, timeout=5
-                        )
-                        self._servers[cache_key] = connection
-                        logger.info(
-                            f"Connected to {server_conn.name} using local URL: {server_conn.local_url}"
-                        )
-                        return connection
-                    except Exception as e:
-                        logger.debug(
-                            f"Local connection failed, falling back to Plex.tv: {str(e)}"
-                        )
-
-                # Fall back to PlexAPI connection resolution
-                connection = server_resource.connect(timeout=5)
-                logger.info(
-                    f"Connected to {server_conn.name} using: {connection._baseurl}"
+                connection, url, latency_ms = self._race_connections(
+                    urls, preferred_url=server_conn.preferred_url
                 )
+            except PlexManagerError as e:
+                fallback_urls = [
+                    url
+                    for url in self._get_resource_urls(server_conn, fetch=True)
+                    if url not in urls
+                ]
+                if not fallback_urls:
+                    raise
+                logger.debug(
+                    f"Stored URLs failed for {server_conn.name}, trying plex.tv connections: {str(e)}"
+                )
+                connection, url, latency_ms = self._race_connections(fallback_urls)
 
-                self._servers[cache_key] = connection
-                return connection
+            logger.info(
+                f"Connected to {server_conn.name} using: {url} ({latency_ms:.0f} ms)"
+            )
+            server_conn.record_preferred_connection(url, latency_ms)
+            return connection
 
-            except Exception as e:
-                logger.error(f"Failed to connect to {server_conn.name}: {str(e)}")
-                raise PlexManagerError(f"Failed to connect to server: {str(e)}")
+        except Exception as e:
+            logger.error(f"Failed to connect to {server_conn.name}: {str(e)}")
+            raise PlexManagerError(f"Failed to connect to server: {str(e)}")
+
+    def _get_resource_urls(self, server_conn, fetch: bool = True) -> List[str]:
+        """
+        Get the connection URLs plex.tv advertises for a server.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            fetch: Whether to contact plex.tv if the resources aren't cached
+        """
+        try:
+            if fetch:
+                resources = self._get_resources()
+            else:
+                resources = account_cache.peek_resources(self.plex_token) or []
+        except Exception as e:
+            logger.debug(f"Could not load plex.tv resources: {str(e)}")
+            return []
+
+        server_resource = next(
+            (
+                resource
+                for resource in resources
+                if resource.clientIdentifier == server_conn.machine_identifier
+            ),
+            None,
+        )
+        if server_resource is None:
+            return []
+
+        return [connection.uri for connection in server_resource.connections]
+
+    def _probe_url(self, url: str) -> Tuple[PlexServer, float]:
+        """Connect to a single URL, returning the server and the latency in ms."""
+        started = time.monotonic()
+        connection = PlexServer(
+            url,
+            self.plex_token,
+            session=get_probe_session(),
+            timeout=SERVER_CONNECT_TIMEOUT,
+        )
+        latency_ms = (time.monotonic() - started) * 1000
+
+        # Only the probe skips retries; data requests go through our session
+        connection._session = self.session
+        return connection, latency_ms
+
+    def _race_connections(
+        self, urls: List[str], preferred_url: str = ""
+    ) -> Tuple[PlexServer, str, float]:
+        """
+        Probe all URLs concurrently and return the first one to respond.
+
+        Args:
+            urls: Candidate connection URLs
+            preferred_url: URL that won last time; it is probed alone for a
+                short head start before the other URLs join the race
+
+        Returns:
+            Tuple of (connected server, winning URL, latency in ms)
+        """
+        if not urls:
+            raise PlexManagerError("No connection URLs available")
+
+        errors = []
+        executor = ThreadPoolExecutor(
+            max_workers=len(urls), thread_name_prefix="plex-connect"
+        )
+        try:
+            futures = {}
+            if preferred_url in urls:
+                futures[executor.submit(self._probe_url, preferred_url)] = preferred_url
+                done, _ = wait(futures, timeout=PREFERRED_URL_HEAD_START)
+                for future in done:
+                    if not future.exception():
+                        connection, latency_ms = future.result()
+                        return connection, preferred_url, latency_ms
+
+            for url in urls:
+                if url not in futures.values():
+                    futures[executor.submit(self._probe_url, url)] = url
+
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    connection, latency_ms = future.result()
+                    return connection, url, latency_ms
+                except Exception as e:
+                    logger.debug(f"Connection to {url} failed: {str(e)}")
+                    errors.append(f"{url}: {str(e)}")
+        finally:
+            # Don't wait for slower probes once we have a winner
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        raise PlexManagerError(f"No reachable endpoint ({'; '.join(errors)})")
 
-        return self._servers[cache_key]
+    def _discard_server(self, server_conn, error: str = "") -> None:
+        """
+        Drop a pooled connection that failed mid-request so the next call
+        reconnects, and count the failure against the server's circuit breaker.
+        """
+        connection_pool.invalidate(server_conn.machine_identifier, self.plex_token)
+        ServerCircuitBreaker(server_conn.machine_identifier).record_failure(error)
+
+    @staticmethod
+    def _missing_section_key(server_conn, library_key: str) -> str:
+        return f"missing_section_{server_conn.machine_identifier}_{library_key}"
+
+    def is_section_missing(self, server_conn, library_key: str) -> bool:
+        """Check whether a library section recently came back as not found."""
+        return bool(cache.get(self._missing_section_key(server_conn, library_key)))
+
+    def mark_section_missing(self, server_conn, library_key: str) -> None:
+        """Briefly remember that a library section doesn't exist on a server."""
+        cache.set(
+            self._missing_section_key(server_conn, library_key),
+            True,
+            timeout=getattr(settings, "PLEX_NOT_FOUND_CACHE_TTL", 60),
+        )
+
+    @staticmethod
+    def get_last_known_libraries(server_conn) -> List[Dict[str, Any]]:
+        """
+        Return the libraries from the last successful get_libraries call, for
+        display while a server is unreachable.
+        """
+        return (
+            cache.get(f"server_libraries_last_{server_conn.machine_identifier}") or []
+        )
 
-    def discover_servers(self) -> List[Dict[str, Any]]:
+    def discover_servers(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch available Plex servers from the Plex API.
+
+        Args:
+            refresh: Bypass the cached resource list and refetch it from plex.tv
         """
         try:
             logger.debug(
                 "Starting server discovery with token: %s", self.plex_token[:4] + "..."
             )
-            resources = self._account.resources()
+            resources = self._get_resources(refresh=refresh)
             logger.debug("Found %d resources", len(resources))
             servers = []
 
@@ -210,15 +424,24 @@ class PlexManager:
                 libraries.append(base_info)
                 logger.debug(f"Processed library section: {section.title}")
 
+            cache.set(
+                f"server_libraries_last_{server_conn.machine_identifier}",
+                libraries,
+                timeout=getattr(settings, "PLEX_LAST_KNOWN_DATA_TTL", 604800),
+            )
             return libraries
 
+        except ServerUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching libraries: {str(e)}")
+            if isinstance(e, RequestException):
+                self._discard_server(server_conn, str(e))
             raise PlexManagerError(f"Failed to fetch libraries: {str(e)}")
 
     def get_library_contents(
         self,
-        server_url: str,
+        server_conn,
         library_key: str,
         sort: str = "titleSort",
         limit: int = 50,
@@ -226,129 +449,541 @@ class PlexManager:
         filters: Optional[Dict] = None,
     ) -> Tuple[List[Dict], int]:
         """
-        Fetch paginated contents of a specific library with optional filtering.
+        Fetch one page of a library with optional filtering.
+
+        Sorting, filtering and paging all happen on the PMS, so a page costs a
+        single request of ``limit`` items no matter how large the library is.
+        The total count comes from the container's ``totalSize`` header.
 
         Args:
-            server_url: URL of the Plex server
+            server_conn: PlexServerConnection model instance
             library_key: Library section key
-            sort: Sort field (default: titleSort)
+            sort: PMS sort field, optionally with direction (e.g. 'addedAt:desc')
             limit: Number of items to return
             offset: Starting offset for pagination
-            filters: Optional dictionary of filters (e.g., {'year': 2024, 'genre': 'Action'})
+            filters: Optional dictionary of filters; supports year, genre (name
+                or id), unwatched and content_rating
+                (e.g., {'year': 2024, 'genre': 'Action'})
 
         Returns:
             Tuple of (items list, total count)
         """
+        if self.is_section_missing(server_conn, library_key):
+            raise PlexManagerError("Library section not found")
+
         try:
-            server = self._get_server(server_url)
-            library = server.library.sectionByID(library_key)
+            server = self._get_server(server_conn)
 
-            # Apply filters if provided
-            items = library.all()
-            if filters:
-                for key, value in filters.items():
-                    items = [
-                        item for item in items if getattr(item, key, None) == value
-                    ]
+            genre_choices = None
+            if self.needs_genre_choices(filters):
+                genre_choices = self._get_genre_choices(
+                    server, server_conn, library_key
+                )
+            params = self.build_library_params(sort, filters, genre_choices)
+            if params is None:
+                # No such genre in this library, so nothing can match
+                return [], 0
 
-            total_count = len(items)
-            items = items[offset : offset + limit]
+            items = server.fetchItems(
+                f"/library/sections/{library_key}/all?{urlencode(params)}",
+                container_start=offset,
+                container_size=limit,
+                maxresults=limit,
+            )
+            total_count = (
+                items.totalSize
+                if getattr(items, "totalSize", None) is not None
+                else len(items)
+            )
 
-            return ([self._format_media_item(item) for item in items], total_count)
+            formatted = [self._format_media_item(item) for item in items]
+            return [item for item in formatted if item], total_count
 
         except NotFound:
             logger.error(f"Library section {library_key} not found")
+            self.mark_section_missing(server_conn, library_key)
             raise PlexManagerError("Library section not found")
+        except ServerUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching library contents: {str(e)}")
+            if isinstance(e, RequestException):
+                self._discard_server(server_conn, str(e))
             raise PlexManagerError(f"Failed to fetch library contents: {str(e)}")
 
-    def _format_media_item(self, item: Any) -> Dict[str, Any]:
-        """Format a media item into a standardized dictionary."""
-        try:
-            # Get the server base URL
-            server = item._server
-            base_url = server._baseurl.rstrip("/")
+    @staticmethod
+    def needs_genre_choices(filters: Optional[Dict]) -> bool:
+        """Return whether the filters name a genre that must be mapped to its id."""
+        genre = (filters or {}).get("genre")
+        return genre not in (None, "") and not str(genre).isdigit()
 
-            # Helper function to create full URLs
-            def make_url(path: str) -> str:
-                if not path:
-                    return ""
-                if path.startswith("http"):
-                    return path
-                return f"{base_url}{path}"
-
-            base_info = {
-                "key": item.ratingKey,
-                "title": item.title,
-                "type": item.type,
-                "thumb": make_url(item.thumb) if hasattr(item, "thumb") else "",
-                "art": make_url(item.art) if hasattr(item, "art") else "",
-                "added_at": (
-                    item.addedAt.timestamp() if hasattr(item, "addedAt") else None
-                ),
-                "updated_at": (
-                    item.updatedAt.timestamp() if hasattr(item, "updatedAt") else None
-                ),
-                "year": item.year if hasattr(item, "year") else None,
-                "rating": item.rating if hasattr(item, "rating") else None,
-                "summary": item.summary if hasattr(item, "summary") else "",
-                "duration": item.duration if hasattr(item, "duration") else None,
-                "view_count": item.viewCount if hasattr(item, "viewCount") else 0,
-                "view_offset": item.viewOffset if hasattr(item, "viewOffset") else 0,
+    @staticmethod
+    def build_library_params(
+        sort: str,
+        filters: Optional[Dict],
+        genre_choices: Optional[Dict[str, str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Translate library filters into PMS query params.
+
+        Shared with AsyncPlexManager so both managers accept the same filters.
+
+        Args:
+            sort: PMS sort field
+            filters: Optional dictionary of filters; supports year, genre (name
+                or id), unwatched and content_rating
+            genre_choices: The section's genre ids by lowercased name, needed
+                when filtering by genre name
+
+        Returns:
+            The params, or None if the genre matches nothing in the library
+
+        Raises:
+            PlexManagerError: If a filter isn't supported
+        """
+        params = {"sort": sort}
+        for name, value in (filters or {}).items():
+            if value is None or value == "":
+                continue
+            if name == "year":
+                params["year"] = int(value)
+            elif name == "unwatched":
+                if value:
+                    params["unwatched"] = 1
+            elif name in ("content_rating", "contentRating"):
+                params["contentRating"] = value
+            elif name == "genre":
+                if str(value).isdigit():
+                    params["genre"] = str(value)
+                else:
+                    genre_id = (genre_choices or {}).get(str(value).lower())
+                    if genre_id is None:
+                        return None
+                    params["genre"] = genre_id
+            else:
+                raise PlexManagerError(f"Unsupported library filter: {name}")
+        return params
+
+    def _get_genre_choices(
+        self, server: PlexServer, server_conn, library_key: str
+    ) -> Dict[str, str]:
+        """
+        Return a section's genre ids by lowercased name.
+
+        The list is cached so resolving a name doesn't cost a request on
+        every page.
+        """
+        cache_key = GENRE_CHOICES_KEY.format(
+            server_conn.machine_identifier, library_key
+        )
+        choices = cache.get(cache_key)
+        if choices is None:
+            choices = {
+                choice.title.lower(): choice.key
+                for choice in server.fetchItems(
+                    f"/library/sections/{library_key}/genre", cls=FilterChoice
+                )
             }
+            cache.set(cache_key, choices, timeout=GENRE_CHOICES_TTL)
+        return choices
 
-            # Add media-type specific information
-            if isinstance(item, Movie):
-                base_info.update(
-                    {
-                        "studio": item.studio if hasattr(item, "studio") else "",
-                        "content_rating": (
-                            item.contentRating if hasattr(item, "contentRating") else ""
-                        ),
-                        "genres": (
-                            [genre.tag for genre in item.genres]
-                            if hasattr(item, "genres")
-                            else []
-                        ),
-                        "directors": (
-                            [director.tag for director in item.directors]
-                            if hasattr(item, "directors")
-                            else []
-                        ),
-                        "actors": (
-                            [actor.tag for actor in item.roles][:5]
-                            if hasattr(item, "roles")
-                            else []
-                        ),
-                    }
+    def iter_library_pages(
+        self,
+        server_conn,
+        library_key: str,
+        page_size: int = 500,
+        libtype: int = 1,
+        sort: str = "addedAt:asc",
+        filters: Optional[Dict[str, Any]] = None,
+        start: int = 0,
+    ) -> Iterator[List[Any]]:
+        """
+        Yield a library section's items one page at a time.
+
+        Each page is a single X-Plex-Container-Start/Size request, so memory
+        stays bounded by ``page_size`` however large the section is. Sorting
+        by addedAt keeps pages stable when items are added mid-iteration.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            library_key: Library section key
+            page_size: Items per page
+            libtype: PMS search type to list (1 = movie)
+            sort: PMS sort field
+            filters: Raw PMS filters, e.g. {'updatedAt>>': 1700000000}
+            start: Offset of the first item, to resume an earlier iteration
+
+        Yields:
+            Lists of plexapi listing objects
+        """
+        query = urlencode({"type": libtype, "sort": sort})
+        for field, value in (filters or {}).items():
+            query += f"&{field}={value}"
+        key = f"/library/sections/{library_key}/all?{query}"
+
+        server = self._get_server(server_conn)
+        while True:
+            try:
+                page = server.fetchItems(
+                    key,
+                    container_start=start,
+                    container_size=page_size,
+                    maxresults=page_size,
                 )
-            elif isinstance(item, (Show, Episode)):
-                base_info.update(
-                    {
-                        "show_title": (
-                            item.grandparentTitle
-                            if isinstance(item, Episode)
-                            else item.title
-                        ),
-                        "season_number": (
-                            item.parentIndex if isinstance(item, Episode) else None
-                        ),
-                        "episode_number": (
-                            item.index if isinstance(item, Episode) else None
-                        ),
-                        "episode_title": (
-                            item.title if isinstance(item, Episode) else None
-                        ),
-                    }
+            except NotFound:
+                self.mark_section_missing(server_conn, library_key)
+                raise PlexManagerError("Library section not found")
+            except Exception as e:
+                logger.error(f"Error fetching library page at {start}: {str(e)}")
+                if isinstance(e, RequestException):
+                    self._discard_server(server_conn, str(e))
+                raise PlexManagerError(f"Failed to fetch library page: {str(e)}")
+
+            if not page:
+                return
+            yield list(page)
+
+            start += len(page)
+            total = getattr(page, "totalSize", None)
+            if total is not None and start >= total:
+                return
+            self._throttle(server_conn.machine_identifier)
+
+    def get_library_rating_keys(
+        self, server_conn, library_key: str, libtype: int = 1, page_size: int = 5000
+    ) -> List[str]:
+        """
+        List the rating keys of every item in a library section.
+
+        Only the raw XML is parsed and bulky fields and tags are excluded, so
+        this is much cheaper than a full listing of the section.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            library_key: Library section key
+            libtype: PMS search type to list (1 = movie)
+            page_size: Items per request
+
+        Returns:
+            Rating keys as strings
+        """
+        try:
+            server = self._get_server(server_conn)
+            params = urlencode(
+                {
+                    "type": libtype,
+                    "excludeFields": "summary,tagline",
+                    "excludeElements": "Media,Genre,Country,Director,Writer,Role",
+                }
+            )
+            rating_keys = []
+            start = 0
+            while True:
+                data = server.query(
+                    f"/library/sections/{library_key}/all?{params}",
+                    headers={
+                        "X-Plex-Container-Start": str(start),
+                        "X-Plex-Container-Size": str(page_size),
+                    },
                 )
+                page = [el.get("ratingKey") for el in data if el.get("ratingKey")]
+                rating_keys.extend(page)
+                start += page_size
+                if not page or start >= int(data.get("totalSize") or 0):
+                    return rating_keys
+                self._throttle(server_conn.machine_identifier)
+
+        except NotFound:
+            self.mark_section_missing(server_conn, library_key)
+            raise PlexManagerError("Library section not found")
+        except ServerUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Error listing library rating keys: {str(e)}")
+            if isinstance(e, RequestException):
+                self._discard_server(server_conn, str(e))
+            raise PlexManagerError(f"Failed to list library contents: {str(e)}")
+
+    def get_library_section(self, server_conn, library_key: str) -> LibrarySection:
+        """
+        Look up a library section, e.g. for its updatedAt.
+
+        The section list is reloaded on every call: the pooled server caches
+        sections it has already seen, which would leave ``updatedAt`` stale
+        for as long as the connection lives. For the same reason read counts
+        with ``totalViewSize()``, not the cached ``totalSize``.
 
-            return base_info
+        Args:
+            server_conn: PlexServerConnection model instance
+            library_key: Library section key
+
+        Returns:
+            The plexapi LibrarySection
+
+        Raises:
+            NotFound: If the server has no section with that key
+        """
+        if self.is_section_missing(server_conn, library_key):
+            raise NotFound(f"Library with ID {library_key} not found")
 
+        try:
+            server = self._get_server(server_conn)
+            sections = server.library.sections()
+        except ServerUnavailableError:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching library section {library_key}: {str(e)}")
+            if isinstance(e, RequestException):
+                self._discard_server(server_conn, str(e))
+            raise PlexManagerError(f"Failed to fetch library section: {str(e)}")
+
+        for section in sections:
+            if str(section.key) == str(library_key):
+                return section
+
+        self.mark_section_missing(server_conn, library_key)
+        raise NotFound(f"Library with ID {library_key} not found")
+
+    def get_library_index(self, server_conn, section: Any) -> List[str]:
+        """
+        Return a snapshot of a library section's rating keys, in title order.
+
+        The snapshot is cached under the section's ``updatedAt``, so every page
+        of a library view slices the same list, and it is only rebuilt once
+        the section changes on the server.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            section: plexapi LibrarySection to index
+
+        Returns:
+            Rating keys as strings
+        """
+        updated_at = getattr(section, "updatedAt", None)
+        version = int(updated_at.timestamp()) if updated_at else 0
+        cache_key = (
+            f"library_index_{server_conn.machine_identifier}_{section.key}_{version}"
+        )
+
+        rating_keys = cache.get(cache_key)
+        if rating_keys is None:
+            rating_keys = self.get_library_rating_keys(
+                server_conn, str(section.key), libtype=searchType(section.type)
+            )
+            cache.set(
+                cache_key,
+                rating_keys,
+                timeout=getattr(settings, "PLEX_LIBRARY_SNAPSHOT_TTL", 86400),
+            )
+        return rating_keys
+
+    def get_metadata_batch(
+        self, server_conn, rating_keys: List[Any], chunk_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch full metadata for many items with one request per chunk.
+
+        Args:
+            server_conn: PlexServerConnection model instance
+            rating_keys: Rating keys of the items to load
+            chunk_size: Rating keys per /library/metadata/<k1,k2,...> request
+                (default: PLEX_METADATA_BATCH_SIZE)
+
+        Returns:
+            Formatted items in the same shape as _format_media_item, with the
+            detail fields (guids, full cast, media and streams) filled in.
+            Items that no longer exist are left out.
+        """
+        try:
+            server = self._get_server(server_conn)
+            items = self._fetch_metadata(server, rating_keys, chunk_size)
+            formatted = [self._format_media_item(item, detail=True) for item in items]
+            return [item for item in formatted if item]
+
+        except ServerUnavailableError:
+            raise
+        except NotFound:
+            # The PMS answers 404 when none of the requested keys exist
+            return []
+        except Exception as e:
+            logger.error(f"Error fetching metadata batch: {str(e)}")
+            if isinstance(e, RequestException):
+                self._discard_server(server_conn, str(e))
+            raise PlexManagerError(f"Failed to fetch metadata: {str(e)}")
+
+    def _fetch_metadata(
+        self,
+        server: PlexServer,
+        rating_keys: List[Any],
+        chunk_size: Optional[int] = None,
+    ) -> List[Any]:
+        """Load full metadata objects for rating keys in chunks."""
+        chunk_size = chunk_size or getattr(
+            settings, "PLEX_METADATA_BATCH_SIZE", METADATA_BATCH_SIZE
+        )
+        rating_keys = [int(key) for key in rating_keys]
+
+        items = []
+        for start in range(0, len(rating_keys), chunk_size):
+            if start:
+                # The first request was accounted for by _get_server
+                self._throttle(server.machineIdentifier)
+            chunk = rating_keys[start : start + chunk_size]
+            items.extend(server.fetchItems(chunk, container_size=len(chunk)))
+        return items
+
+    def _format_media_item(
+        self, item: Any, detail: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Format a media item into a standardized dictionary.
+
+        Only attributes present in the item's XML are read, so partial objects
+        from a listing are never reloaded from the server one by one. Tag lists
+        (genres, directors, actors) hold whatever the response included; use
+        _format_media_items with ``detail=True`` when they must be complete.
+
+        ``detail`` adds guids, the full cast and media/stream information; it
+        only makes sense for items loaded from /library/metadata.
+        """
+        try:
+            return self._format_item_data(
+                item._data, item._server._baseurl, detail=detail
+            )
         except Exception as e:
             logger.error(f"Error formatting media item: {str(e)}")
             return None
 
+    def _format_media_items(
+        self, server: PlexServer, items: List[Any], detail: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Format a list of media items.
+
+        Args:
+            server: Connected PlexServer the items came from
+            items: plexapi media objects, usually from a listing
+            detail: Refetch full metadata for the items in batches of rating
+                keys, so tag lists are complete
+
+        Returns:
+            List of formatted items; items that fail to format are skipped
+        """
+        if detail:
+            items = self._fetch_metadata(
+                server, [item._data.attrib["ratingKey"] for item in items]
+            )
+
+        formatted = [self._format_media_item(item, detail=detail) for item in items]
+        return [item for item in formatted if item]
+
+    @staticmethod
+    def _format_item_data(
+        data: Any, base_url: str, detail: bool = False
+    ) -> Dict[str, Any]:
+        """Format a metadata XML element into a standardized dictionary."""
+        attrib = data.attrib
+        base_url = base_url.rstrip("/")
+        item_type = attrib.get("type")
+
+        # Helper function to create full URLs
+        def make_url(path: Optional[str]) -> str:
+            if not path:
+                return ""
+            if path.startswith("http"):
+                return path
+            return f"{base_url}{path}"
+
+        def number(name: str, cast=int, default=None):
+            value = attrib.get(name)
+            return cast(value) if value not in (None, "") else default
+
+        def tags(tag: str) -> List[str]:
+            return [el.attrib["tag"] for el in data.findall(tag) if el.get("tag")]
+
+        base_info = {
+            "key": number("ratingKey"),
+            "title": attrib.get("title", ""),
+            "type": item_type,
+            "thumb": make_url(attrib.get("thumb")),
+            "art": make_url(attrib.get("art")),
+            "added_at": number("addedAt", float),
+            "updated_at": number("updatedAt", float),
+            "year": number("year"),
+            "rating": number("rating", float),
+            "summary": attrib.get("summary", ""),
+            "duration": number("duration"),
+            "view_count": number("viewCount", default=0),
+            "view_offset": number("viewOffset", default=0),
+        }
+
+        # Add media-type specific information
+        if item_type == "movie":
+            base_info.update(
+                {
+                    "studio": attrib.get("studio", ""),
+                    "content_rating": attrib.get("contentRating", ""),
+                    "genres": tags("Genre"),
+                    "directors": tags("Director"),
+                    "actors": tags("Role")[:5],
+                }
+            )
+        elif item_type in ("show", "episode"):
+            is_episode = item_type == "episode"
+            base_info.update(
+                {
+                    "show_title": (
+                        attrib.get("grandparentTitle", "")
+                        if is_episode
+                        else base_info["title"]
+                    ),
+                    "season_number": number("parentIndex") if is_episode else None,
+                    "episode_number": number("index") if is_episode else None,
+                    "episode_title": base_info["title"] if is_episode else None,
+                }
+            )
+            if not is_episode:
+                base_info.update(
+                    {
+                        "season_count": number("childCount", default=0),
+                        "episode_count": number("leafCount", default=0),
+                    }
+                )
+
+        if detail:
+            media = [
+                {
+                    "container": media.get("container", ""),
+                    "bitrate": int(media.get("bitrate") or 0),
+                    "width": int(media.get("width") or 0),
+                    "height": int(media.get("height") or 0),
+                    "video_resolution": media.get("videoResolution", ""),
+                    "video_codec": media.get("videoCodec", ""),
+                    "audio_codec": media.get("audioCodec", ""),
+                    "audio_channels": int(media.get("audioChannels") or 0),
+                    "streams": [
+                        {
+                            "stream_type": int(stream.get("streamType") or 0),
+                            "codec": stream.get("codec", ""),
+                            "language": stream.get("languageCode", ""),
+                            "title": stream.get("displayTitle", ""),
+                        }
+                        for stream in media.iterfind("Part/Stream")
+                    ],
+                }
+                for media in data.findall("Media")
+            ]
+            base_info.update(
+                {
+                    "guids": [el.get("id") for el in data.findall("Guid")],
+                    "cast": tags("Role"),
+                    "media": media,
+                    "video_resolution": (media[0]["video_resolution"] if media else ""),
+                }
+            )
+
+        return base_info
+
     def get_recently_added(self, server_conn, limit: int = 12) -> List[Dict[str, Any]]:
         """Get recently added items from a server.
 
@@ -373,8 +1008,12 @@ class PlexManager:
 
             return recent
 
+        except ServerUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching recent items: {str(e)}")
+            if isinstance(e, RequestException):
+                self._discard_server(server_conn, str(e))
             raise PlexManagerError(f"Failed to fetch recent items: {str(e)}")
 
     def get_on_deck(self, server_conn, limit: int = 10) -> List[Dict[str, Any]]:
@@ -399,19 +1038,25 @@ class PlexManager:
                 if item_data:
                     # Add progress information
                     progress = 0
-                    if hasattr(item, "viewOffset") and hasattr(item, "duration"):
-                        if item.duration > 0:
-                            progress = (item.viewOffset / item.duration) * 100
+                    if item_data["duration"]:
+                        progress = (
+                            item_data["view_offset"] / item_data["duration"]
+                        ) * 100
                     item_data["progress"] = round(progress, 1)
                     on_deck.append(item_data)
 
             return on_deck
 
+        except ServerUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Error fetching on deck items: {str(e)}")
+            if isinstance(e, RequestException):
+                self._discard_server(server_conn, str(e))
             raise PlexManagerError(f"Failed to fetch on deck items: {str(e)}")
 
     def clear_cache(self) -> None:
-        """Clear the server connection cache."""
-        self._servers.clear()
-        self._get_server.cache_clear()
+        """Drop all pooled server connections and cached account data for this token."""
+        connection_pool.invalidate_token(self.plex_token)
+        account_cache.invalidate(self.plex_token)
+        self._account = None
@@ -13,6 +13,7 @@ from plex_auth.utils.constants import (
     REQUEST_TIMEOUT,
 )
 from plex_auth.utils.exceptions import PlexManagerError
+from plex_auth.utils.http_session import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -42,13 +43,18 @@ class PlexOAuth:
         }
 
     @classmethod
-    def get_pin(cls) -> Optional[Dict[str, Any]]:
+    def get_pin(
+        cls, session: Optional[requests.Session] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Request a new authentication pin from Plex.
 
         The pin is used to initiate the OAuth flow and track the
         authentication status.
 
+        Args:
+            session: HTTP session to use (defaults to the shared Plex session)
+
         Returns:
             Dict containing pin data if successful, None otherwise
             Example: {'id': 12345, 'code': 'ABC123', 'expires_in': 1800}
@@ -63,7 +69,8 @@ class PlexOAuth:
                 "X-Plex-Client-Identifier": settings.PLEX_CLIENT_IDENTIFIER,
             }
 
-            response = requests.post(
+            session = session or get_session()
+            response = session.post(
                 PLEX_PIN_URL,
                 headers=cls.get_headers(),
                 data=data,  # Using form data as required by Plex API
@@ -110,12 +117,15 @@ class PlexOAuth:
         return f"{base_url}?{query_string}"
 
     @classmethod
-    def check_pin(cls, pin_id: str) -> Optional[Dict[str, Any]]:
+    def check_pin(
+        cls, pin_id: str, session: Optional[requests.Session] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Check the authentication status of a pin.
 
         Args:
             pin_id: The ID of the pin to check (not the pin code)
+            session: HTTP session to use (defaults to the shared Plex session)
 
         Returns:
             Dict containing auth data if authenticated, None if pending
@@ -130,7 +140,8 @@ class PlexOAuth:
                 "X-Plex-Product": "Plexify",
             }
 
-            response = requests.get(
+            session = session or get_session()
+            response = session.get(
                 f"{PLEX_PIN_URL}/{pin_id}",
                 headers=cls.get_headers(),
                 params=params,
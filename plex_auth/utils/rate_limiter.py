@@ -0,0 +1,143 @@
+# plex_auth/utils/rate_limiter.py
+
+import logging
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from plex_auth.utils.exceptions import ServerBusyError
+from plex_auth.utils.locks import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_SYNC = "sync"
+
+# Refill the bucket, then reserve a token if it will be free within max_wait.
+# Returns the seconds to wait as a string, or "-1" if the request is refused.
+TAKE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+
+local wait = 0
+if tokens < 1 then
+    wait = (1 - tokens) / rate
+end
+if wait > max_wait then
+    return "-1"
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens - 1), "ts", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(burst / rate) + 60)
+return tostring(wait)
+"""
+
+
+def _budget(priority: str) -> Dict[str, float]:
+    """Requests per second, burst size and longest wait for a priority."""
+    if priority == PRIORITY_SYNC:
+        return {
+            "rate": getattr(settings, "PLEX_SYNC_RATE_LIMIT", 4),
+            "burst": getattr(settings, "PLEX_SYNC_RATE_BURST", 8),
+            "max_wait": getattr(settings, "PLEX_SYNC_RATE_MAX_WAIT", 60),
+        }
+    return {
+        "rate": getattr(settings, "PLEX_INTERACTIVE_RATE_LIMIT", 10),
+        "burst": getattr(settings, "PLEX_INTERACTIVE_RATE_BURST", 30),
+        "max_wait": getattr(settings, "PLEX_INTERACTIVE_RATE_MAX_WAIT", 2),
+    }
+
+
+class ServerRateLimiter:
+    """
+    Per-server token bucket shared through Redis or the Django cache.
+
+    Background syncs and interactive requests draw from separate buckets
+    with their own budgets, so a sync can use at most its share of a PMS and
+    page views always have theirs. Callers that would have to wait longer
+    than the priority's ``max_wait`` are refused instead of piling up.
+
+    With REDIS_URL set the bucket is updated atomically by a Lua script;
+    otherwise it lives in the cache, where concurrent updates may let a few
+    extra requests through.
+    """
+
+    def __init__(
+        self,
+        machine_identifier: str,
+        priority: str = PRIORITY_INTERACTIVE,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_wait: Optional[float] = None,
+    ):
+        budget = _budget(priority)
+        self.machine_identifier = machine_identifier
+        self.priority = priority
+        self.rate = float(rate or budget["rate"])
+        self.burst = float(burst or budget["burst"])
+        self.max_wait = float(budget["max_wait"] if max_wait is None else max_wait)
+        self.cache_key = f"ratelimit_{machine_identifier}_{priority}"
+
+    def reserve(self) -> Optional[float]:
+        """
+        Take a token, possibly one that only becomes free in the future.
+
+        Returns:
+            Seconds to wait before sending the request, or None if that
+            would exceed ``max_wait`` and no token was taken
+        """
+        now = time.time()
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            script = redis_client.register_script(TAKE_SCRIPT)
+            wait = float(
+                script(
+                    keys=[self.cache_key],
+                    args=[self.rate, self.burst, now, self.max_wait],
+                )
+            )
+            return None if wait < 0 else wait
+
+        state = cache.get(self.cache_key) or {"tokens": self.burst, "ts": now}
+        tokens = min(
+            self.burst, state["tokens"] + max(0.0, now - state["ts"]) * self.rate
+        )
+        wait = (1 - tokens) / self.rate if tokens < 1 else 0.0
+        if wait > self.max_wait:
+            return None
+
+        cache.set(
+            self.cache_key,
+            {"tokens": tokens - 1, "ts": now},
+            timeout=int(self.burst / self.rate) + 60,
+        )
+        return wait
+
+    def acquire(self) -> None:
+        """
+        Block until a request to the server is allowed.
+
+        Raises:
+            ServerBusyError: If the server's budget is exhausted for longer
+                than ``max_wait``
+        """
+        wait = self.reserve()
+        if wait is None:
+            raise ServerBusyError(
+                f"Too many {self.priority} requests to {self.machine_identifier}"
+            )
+        if wait > 0:
+            logger.debug(
+                f"Throttling {self.priority} request to "
+                f"{self.machine_identifier} for {wait:.2f}s"
+            )
+            time.sleep(wait)
@@ -0,0 +1,114 @@
+# plex_auth/utils/task_dedup.py
+
+import logging
+import uuid
+from typing import Any, Iterable, Optional, Tuple
+
+from celery.signals import task_postrun
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def _dedup_key(task_name: str, scope: Iterable[Any]) -> str:
+    return "inflight_" + "_".join([task_name, *(str(part) for part in scope)])
+
+
+def _task_key(task_id: str) -> str:
+    return f"inflight_task_{task_id}"
+
+
+def _handoff_key(task_id: str) -> str:
+    return f"inflight_handoff_{task_id}"
+
+
+def enqueue_once(
+    task,
+    args: Tuple = (),
+    scope: Iterable[Any] = (),
+    ttl: Optional[int] = None,
+    **options,
+) -> Tuple[str, bool]:
+    """
+    Queue a task unless an identical one is already queued or running.
+
+    Duplicates are detected when the task is queued, keyed by the task name
+    and ``scope`` (e.g. user ID, or server and library), so double clicks
+    and overlapping schedules never reach the broker. The entry is removed
+    when the task finishes (or, for tasks that hand their work off with
+    keep_inflight, when release_inflight is called) and otherwise expires
+    after ``ttl`` seconds, so a lost task can't block new runs forever.
+
+    Args:
+        task: Celery task to queue
+        args: Positional arguments for the task
+        scope: Values that identify the work, besides the task itself
+        ttl: Seconds before the entry expires (default: SYNC_DEDUP_TTL)
+        **options: Extra apply_async options
+
+    Returns:
+        Tuple of (task ID, whether a new task was queued). When the work was
+        already in flight the existing task's ID is returned, so callers can
+        poll its progress.
+    """
+    ttl = ttl or getattr(settings, "SYNC_DEDUP_TTL", 3600)
+    key = _dedup_key(task.name, scope)
+    task_id = str(uuid.uuid4())
+
+    if not cache.add(key, task_id, timeout=ttl):
+        existing_id = cache.get(key)
+        if existing_id:
+            logger.info(f"Coalesced {task.name} into in-flight task {existing_id}")
+            return existing_id, False
+        # The entry expired between the two calls
+        cache.set(key, task_id, timeout=ttl)
+
+    # Written before queueing, since eager tasks finish inside apply_async
+    cache.set(_task_key(task_id), key, timeout=ttl)
+    try:
+        task.apply_async(args=args, task_id=task_id, **options)
+    except Exception:
+        cache.delete_many([key, _task_key(task_id)])
+        raise
+
+    return task_id, True
+
+
+def keep_inflight(task_id: str, ttl: Optional[int] = None) -> None:
+    """
+    Keep a task's dedup entry after the task returns.
+
+    For tasks that only queue the real work, e.g. a chord, so duplicates keep
+    coalescing until whatever finishes the work calls release_inflight. The
+    entry's expiry restarts, giving the queued work a full ``ttl`` seconds.
+
+    Args:
+        task_id: ID of the task that was queued with enqueue_once
+        ttl: Seconds before the entry expires (default: SYNC_DEDUP_TTL)
+    """
+    ttl = ttl or getattr(settings, "SYNC_DEDUP_TTL", 3600)
+    key = cache.get(_task_key(task_id))
+    if key is None:
+        return
+    cache.touch(key, ttl)
+    cache.touch(_task_key(task_id), ttl)
+    cache.set(_handoff_key(task_id), True, timeout=ttl)
+
+
+def release_inflight(task_id: str) -> None:
+    """Free a task's dedup entry so the same work can be queued again."""
+    key = cache.get(_task_key(task_id))
+    if key is not None and cache.get(key) == task_id:
+        cache.delete(key)
+    cache.delete_many([_task_key(task_id), _handoff_key(task_id)])
+
+
+@task_postrun.connect
+def _clear_inflight(task_id=None, state=None, **kwargs):
+    """Free a finished task's dedup entry; retries and handoffs keep theirs."""
+    if not task_id or state == "RETRY":
+        return
+    if state == "SUCCESS" and cache.get(_handoff_key(task_id)) is not None:
+        return
+    release_inflight(task_id)
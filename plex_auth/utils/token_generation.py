@@ -0,0 +1,37 @@
+# plex_auth/utils/token_generation.py
+
+import hashlib
+
+from django.core.cache import cache
+
+# Outlives every per-process cache TTL; if it expires anyway, entries only
+# look stale and get reloaded
+GENERATION_TTL = 60 * 60 * 24
+
+
+def _generation_key(token: str) -> str:
+    # Hash the token so it never appears in the shared cache
+    digest = hashlib.sha256(token.encode()).hexdigest()[:32]
+    return f"plex_token_generation_{digest}"
+
+
+def get_token_generation(token: str) -> int:
+    """
+    Return the token's current generation from the shared cache.
+
+    Per-process caches record the generation an entry was loaded under and
+    drop it once the shared value moves on, so revoking a token in one
+    worker reaches every web and Celery process.
+    """
+    return cache.get(_generation_key(token), 0)
+
+
+def revoke_token(token: str) -> None:
+    """Invalidate everything any process has cached for a token."""
+    key = _generation_key(token)
+    if not cache.add(key, 1, timeout=GENERATION_TTL):
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Expired between the two calls
+            cache.set(key, 1, timeout=GENERATION_TTL)
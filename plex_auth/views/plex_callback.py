@@ -8,9 +8,9 @@ from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.views.generic import View
-from plexapi.myplex import MyPlexAccount
 
 from plex_auth.backends import PlexAuthenticationBackend
+from plex_auth.utils.account_cache import account_cache
 from plex_auth.utils.exceptions import PlexManagerError
 from plex_auth.utils.plex_oauth import PlexOAuth
 
@@ -67,10 +67,11 @@ class PlexCallbackView(View):
     def _validate_plex_token(self, token: str) -> Optional[dict]:
         """
         Validate Plex token by attempting to create a MyPlexAccount instance
-        and return normalized account data.
+        and return normalized account data. The account is kept in the shared
+        account cache so later PlexManager calls don't sign in again.
         """
         try:
-            account = MyPlexAccount(token=token)
+            account = account_cache.get_account(token)
             return {
                 "id": account.uuid,
                 "username": account.username,
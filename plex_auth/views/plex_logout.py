@@ -7,6 +7,10 @@ from django.http import HttpRequest
 from django.shortcuts import redirect
 from django.views.generic import View
 
+from plex_auth.utils.account_cache import account_cache
+from plex_auth.utils.connection_pool import connection_pool
+from plex_auth.utils.token_generation import revoke_token
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +22,11 @@ class PlexLogoutView(View):
     def get(self, request: HttpRequest):
         if request.user.is_authenticated:
             username = request.user.username
+            plex_token = request.user.plex_token
             logout(request)
+            if plex_token:
+                revoke_token(plex_token)
+                account_cache.invalidate(plex_token)
+                connection_pool.invalidate_token(plex_token)
             logger.info(f"User logged out: {username}")
         return redirect("plex_auth:login")